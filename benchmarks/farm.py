@@ -0,0 +1,188 @@
+"""Simulated endpoint farm for the HTTP Uptime Monitor benchmarks.
+
+One aiohttp server answers ``/ep/<index>`` for every simulated endpoint.
+Each endpoint has a fixed response delay drawn from a latency distribution,
+so the benchmark can compare measured response times with the injected
+ones. A share of the endpoints fails with 500, and another share streams
+its body slowly. With TLS enabled, a second port serves the same endpoints
+with a self-signed certificate.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass
+import datetime
+import multiprocessing
+import random
+import ssl
+import tempfile
+
+from aiohttp import web
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal", "bimodal")
+
+# Chunks of a slow body and the pause between them
+SLOW_BODY_CHUNKS = 4
+SLOW_BODY_CHUNK = b"x" * 16384
+
+
+@dataclass
+class FarmProfile:
+    """Behaviour of the simulated endpoints; identical on both sides."""
+
+    endpoints: int = 100
+    latency: str = "lognormal"
+    latency_ms: float = 50.0
+    error_rate: float = 0.0
+    slow_body_rate: float = 0.0
+    slow_body_delay_ms: float = 100.0
+    seed: int = 1
+
+    def delays(self) -> list[float]:
+        """Return the response delay of every endpoint in milliseconds."""
+        rng = random.Random(self.seed)
+        mean = self.latency_ms
+        if self.latency == "fixed":
+            return [mean] * self.endpoints
+        if self.latency == "uniform":
+            return [rng.uniform(0, 2 * mean) for _ in range(self.endpoints)]
+        if self.latency == "bimodal":
+            # Mostly fast endpoints with a slow tail ten times slower
+            return [
+                mean * (10 if rng.random() < 0.1 else 0.5) * rng.uniform(0.8, 1.2)
+                for _ in range(self.endpoints)
+            ]
+        if self.latency == "lognormal":
+            return [rng.lognormvariate(0, 0.5) * mean for _ in range(self.endpoints)]
+        raise ValueError(f"Unknown latency distribution: {self.latency}")
+
+    def behaviours(self) -> list[tuple[float, bool, bool]]:
+        """Return the delay, failing and slow body flags of every endpoint."""
+        rng = random.Random(self.seed + 1)
+        return [
+            (delay, rng.random() < self.error_rate, rng.random() < self.slow_body_rate)
+            for delay in self.delays()
+        ]
+
+
+def _self_signed_context(directory: str) -> ssl.SSLContext:
+    """Return a server context with a freshly generated self-signed certificate."""
+    # pylint: disable=import-outside-toplevel
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=30))
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = f"{directory}/cert.pem"
+    key_path = f"{directory}/key.pem"
+    with open(cert_path, "wb") as file:
+        file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as file:
+        file.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+def build_app(profile: FarmProfile) -> web.Application:
+    """Return the application serving the simulated endpoints."""
+    behaviours = profile.behaviours()
+    slow_delay = profile.slow_body_delay_ms / 1000
+
+    async def _handle(request: web.Request) -> web.StreamResponse:
+        try:
+            delay, failing, slow = behaviours[int(request.match_info["index"])]
+        except (IndexError, ValueError):
+            raise web.HTTPNotFound() from None
+        await asyncio.sleep(delay / 1000)
+        if failing:
+            return web.Response(status=500, text="simulated failure")
+        if not slow or request.method == "HEAD":
+            return web.Response(text="ok")
+
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for _ in range(SLOW_BODY_CHUNKS):
+            await response.write(SLOW_BODY_CHUNK)
+            await asyncio.sleep(slow_delay)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_route("*", "/ep/{index}", _handle)
+    return app
+
+
+async def _async_serve(profile: FarmProfile, port: int, tls_port: int | None, ready) -> None:
+    """Serve the farm until the process is terminated."""
+    runner = web.AppRunner(build_app(profile), access_log=None)
+    await runner.setup()
+    # Listen on all of 127.0.0.0/8, so endpoints can be spread over hosts
+    await web.TCPSite(runner, "0.0.0.0", port, backlog=4096).start()
+    if tls_port is not None:
+        with tempfile.TemporaryDirectory() as directory:
+            context = _self_signed_context(directory)
+        await web.TCPSite(
+            runner, "0.0.0.0", tls_port, ssl_context=context, backlog=4096
+        ).start()
+    ready.set()
+    await asyncio.Event().wait()
+
+
+def _run(profile: dict, port: int, tls_port: int | None, ready) -> None:
+    asyncio.run(_async_serve(FarmProfile(**profile), port, tls_port, ready))
+
+
+class Farm:
+    """Run the endpoint farm in a separate process.
+
+    The farm gets its own process and event loop, so serving the endpoints
+    does not compete with the probe engine being measured.
+    """
+
+    def __init__(self, profile: FarmProfile, port: int, tls_port: int | None = None) -> None:
+        """Initialize the farm."""
+        self.profile = profile
+        self.port = port
+        self.tls_port = tls_port
+        self._process: multiprocessing.Process | None = None
+
+    def start(self) -> None:
+        """Start the farm and wait until it accepts connections."""
+        context = multiprocessing.get_context("spawn")
+        ready = context.Event()
+        self._process = context.Process(
+            target=_run,
+            args=(asdict(self.profile), self.port, self.tls_port, ready),
+            daemon=True,
+        )
+        self._process.start()
+        if not ready.wait(30):
+            self.stop()
+            raise RuntimeError("Endpoint farm did not start")
+
+    def stop(self) -> None:
+        """Stop the farm."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
@@ -0,0 +1,173 @@
+"""Per-endpoint memory footprint of the HTTP Uptime Monitor probe engine.
+
+Builds the state the integration keeps for every endpoint, component by
+component, and measures it with tracemalloc. The latest probe result is
+measured twice: as the plain dict probes return, with the datetime
+objects and attribute dict it used to carry through to the entities, and
+as the ProbeResult record the coordinators keep instead.
+
+    python benchmarks/memory.py --endpoints 1000
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import gc
+import importlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+import types
+from typing import Any, Callable
+
+ENGINE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "custom_components", "http_uptime"
+)
+
+# Load the integration as a package without running its __init__, which
+# needs Home Assistant
+_package = types.ModuleType("_http_uptime_engine")
+_package.__path__ = [ENGINE_DIR]
+sys.modules[_package.__name__] = _package
+adaptive = importlib.import_module("_http_uptime_engine.adaptive")
+breaker = importlib.import_module("_http_uptime_engine.breaker")
+metrics = importlib.import_module("_http_uptime_engine.metrics")
+result = importlib.import_module("_http_uptime_engine.result")
+stats = importlib.import_module("_http_uptime_engine.stats")
+
+
+def _probe_dict(index: int) -> dict[str, Any]:
+    """Return a result as an HTTP probe returns it."""
+    return {
+        "status_code": 200,
+        "response_time": 40.0 + index % 50,
+        "ssl_expires": datetime(2030, 1, 1, tzinfo=timezone.utc),
+        "url": f"https://host{index}.example.com/health",
+        "bytes_read": 512,
+        "dns_time": 0.0,
+        "connect_time": None,
+        "ttfb": 38.5 + index % 50,
+        "transfer_time": 0.4,
+        "connection_reused": True,
+        "is_up": True,
+    }
+
+
+def _dict_result(index: int) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return a result the way it was kept before ProbeResult, with its attributes."""
+    data = _probe_dict(index)
+    data["last_success"] = datetime.now(timezone.utc)
+    data["last_failure"] = datetime.now(timezone.utc)
+    attributes = {
+        "status_code": data["status_code"],
+        "url": data["url"],
+        "response_time": data["response_time"],
+        "dns_time": data["dns_time"],
+        "ttfb": data["ttfb"],
+        "transfer_time": data["transfer_time"],
+        "bytes_read": data["bytes_read"],
+        "connection_reused": data["connection_reused"],
+        "last_success": data["last_success"].isoformat(),
+        "last_failure": data["last_failure"].isoformat(),
+        "ssl_expires": data["ssl_expires"].isoformat(),
+    }
+    return data, attributes
+
+
+def _record_result(index: int) -> Any:
+    """Return a result as the coordinators keep it."""
+    record = result.ProbeResult.from_probe(_probe_dict(index), True)
+    record.last_success = record.last_failure = int(time.time())
+    return record
+
+
+def _statistics(samples: int) -> Callable[[int], Any]:
+    """Return a factory of rolling statistics filled with ``samples`` probes."""
+
+    def _build(index: int) -> Any:
+        statistics = stats.EndpointStatistics(60)
+        now = time.monotonic() - samples * 60
+        for sample in range(samples):
+            statistics.record(now + sample * 60, 40.0 + (index + sample) % 50, True)
+        return statistics
+
+    return _build
+
+
+def _series(index: int) -> Any:
+    """Return a metrics series that has seen a probe."""
+    series = metrics.EndpointSeries(
+        {
+            "entry_id": f"{index:032x}",
+            "entry": f"Endpoint {index}",
+            "endpoint": f"Endpoint {index}",
+            "url": f"https://host{index}.example.com/health",
+        }
+    )
+    series.update(_record_result(index))
+    series.samples()
+    return series
+
+
+def _measure(build: Callable[[int], Any], endpoints: int) -> float:
+    """Return the bytes allocated per endpoint by ``build``."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(index) for index in range(endpoints)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / endpoints
+
+
+def main() -> None:
+    """Measure and print the per-endpoint footprint."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--endpoints", type=int, default=1000)
+    parser.add_argument(
+        "--samples", type=int, default=720, help="Probes in the rolling statistics"
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    components = {
+        "result (dict + attributes)": _dict_result,
+        "result (ProbeResult)": _record_result,
+        "rolling statistics": _statistics(args.samples),
+        "metrics series": _series,
+        "circuit breaker": lambda index: breaker.CircuitBreaker(60),
+        "adaptive interval": lambda index: adaptive.AdaptiveInterval(60, 600),
+    }
+    footprint = {
+        name: round(_measure(build, args.endpoints)) for name, build in components.items()
+    }
+    total = sum(
+        size for name, size in footprint.items() if name != "result (dict + attributes)"
+    )
+
+    print(f"Per-endpoint footprint, {args.endpoints} endpoints, {args.samples} samples")
+    for name, size in footprint.items():
+        print(f"  {name:<28} {size:>9,} B")
+    print(f"  {'total (with ProbeResult)':<28} {total:>9,} B")
+    print(f"  {'total for all endpoints':<28} {total * args.endpoints / 2**20:>9.1f} MiB")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "endpoints": args.endpoints,
+                    "samples": args.samples,
+                    "bytes_per_endpoint": footprint,
+                    "total_bytes_per_endpoint": total,
+                },
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
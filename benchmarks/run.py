@@ -0,0 +1,395 @@
+"""Load benchmark of the HTTP Uptime Monitor probe engine.
+
+Probes a simulated endpoint farm (see ``farm.py``) through the same path
+the coordinators use: the shared scheduler, probe registry, pooled
+sessions, DNS resolver, certificate cache and optionally the worker pool,
+and records every result in an endpoint tracker with its statistics,
+incidents, circuit breaker and metrics series. History writes and entity
+updates are not included. For every endpoint count it reports the probe rate, how far measured
+response times are from the injected delays, CPU time and memory::
+
+    python benchmarks/run.py --endpoints 100 1000 5000 --output results.json
+    python benchmarks/run.py --endpoints 1000 --compare results.json
+
+Only Python and ``aiohttp`` are needed (``cryptography`` for ``--tls``);
+the integration package is loaded without Home Assistant.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+import importlib
+import json
+import math
+import os
+import platform
+import resource
+import sys
+import time
+import types
+from typing import Any
+
+import aiohttp
+
+from farm import LATENCY_DISTRIBUTIONS, Farm, FarmProfile
+
+ENGINE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "custom_components", "http_uptime"
+)
+
+# Load the integration as a package without running its __init__, which
+# needs Home Assistant
+_package = types.ModuleType("_http_uptime_engine")
+_package.__path__ = [ENGINE_DIR]
+sys.modules[_package.__name__] = _package
+certs = importlib.import_module("_http_uptime_engine.certs")
+metrics = importlib.import_module("_http_uptime_engine.metrics")
+probe = importlib.import_module("_http_uptime_engine.probe")
+registry = importlib.import_module("_http_uptime_engine.registry")
+probe_result = importlib.import_module("_http_uptime_engine.result")
+resolver = importlib.import_module("_http_uptime_engine.resolver")
+scheduler = importlib.import_module("_http_uptime_engine.scheduler")
+session = importlib.import_module("_http_uptime_engine.session")
+tracker = importlib.import_module("_http_uptime_engine.tracker")
+worker = importlib.import_module("_http_uptime_engine.worker")
+
+# Metrics compared by --compare, and whether higher is better
+COMPARED_METRICS = {
+    "probes_per_sec": True,
+    "completion": True,
+    "overhead_p95_ms": False,
+    "cpu_per_probe_us": False,
+    "rss_mb": False,
+}
+
+
+def _percentile(values: list[float], percent: float) -> float | None:
+    """Return the nearest-rank percentile of sorted values."""
+    if not values:
+        return None
+    return values[max(math.ceil(len(values) * percent / 100) - 1, 0)]
+
+
+def _rss_mb() -> float:
+    """Return the resident set size of this process."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            pages = int(file.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except OSError:
+        # Peak instead of current; kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def _cpu_time() -> float:
+    """Return the user and system CPU time of this process."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _endpoint_url(args: argparse.Namespace, index: int) -> str:
+    """Return the URL of an endpoint, spreading endpoints over loopback hosts."""
+    host = index % args.hosts
+    address = f"127.0.{host // 250}.{host % 250 + 1}"
+    if args.probe_type == "tcp":
+        return f"tcp://{address}:{args.port}"
+    if args.tls:
+        return f"https://{address}:{args.tls_port}/ep/{index}"
+    return f"http://{address}:{args.port}/ep/{index}"
+
+
+def _endpoint_config(args: argparse.Namespace, index: int) -> dict[str, Any]:
+    """Return the configuration of an endpoint as an entry would store it."""
+    return {
+        "name": f"ep{index}",
+        "url": _endpoint_url(args, index),
+        "probe_type": args.probe_type,
+        "method": "GET",
+        "timeout": args.timeout,
+        "update_interval": args.interval,
+        # The farm's certificate is self-signed
+        "verify_ssl": False,
+        "expected_status": [200],
+        "headers": {},
+    }
+
+
+class Scenario:
+    """Probe one farm size for a fixed time and collect the measurements."""
+
+    def __init__(self, args: argparse.Namespace, endpoints: int) -> None:
+        """Initialize the scenario."""
+        self.args = args
+        self.profile = FarmProfile(
+            endpoints,
+            args.latency,
+            args.latency_ms,
+            args.error_rate,
+            args.slow_body_rate,
+            args.slow_body_delay_ms,
+            args.seed,
+        )
+        self.delays = self.profile.delays()
+        self.recording = False
+        self.probes = 0
+        self.up = 0
+        self.down = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.overheads: list[float] = []
+
+    async def async_run(self) -> dict[str, Any]:
+        """Run the scenario and return its results."""
+        args = self.args
+        farm = Farm(self.profile, args.port, args.tls_port if args.tls else None)
+        farm.start()
+        dns = resolver.CachingResolver()
+        sessions = session.SessionManager(resolver=dns)
+        certificates = certs.CertificateCache()
+        probes = registry.ProbeRegistry()
+        jobs = scheduler.ProbeScheduler(args.max_in_flight)
+        pool = worker.WorkerPool(args.workers) if args.workers else None
+        export = metrics.MetricsSnapshot()
+        try:
+            for index in range(self.profile.endpoints):
+                config = _endpoint_config(args, index)
+                endpoint = tracker.EndpointTracker(args.interval, ["1h"])
+                endpoint.series, _ = export.register(
+                    {"endpoint": config["name"], "url": config["url"]}
+                )
+                jobs.async_add(
+                    config["name"],
+                    args.interval,
+                    lambda index=index, config=config, endpoint=endpoint: (
+                        self._async_probe(
+                            index,
+                            config,
+                            endpoint,
+                            dns,
+                            sessions,
+                            certificates,
+                            probes,
+                            jobs,
+                            pool,
+                        )
+                    ),
+                )
+
+            # The first round opens every connection; measure the steady state
+            await asyncio.sleep(args.warmup)
+            self.recording = True
+            rss_start = _rss_mb()
+            cpu_start = _cpu_time()
+            start = time.monotonic()
+            await asyncio.sleep(args.duration)
+            elapsed = time.monotonic() - start
+            cpu = _cpu_time() - cpu_start
+            self.recording = False
+            stats = {
+                "scheduler": jobs.stats,
+                "sessions": sessions.stats,
+                "resolver": dns.stats,
+                "registry": probes.stats,
+                "workers": None if pool is None else pool.stats,
+            }
+        finally:
+            await jobs.async_stop()
+            if pool is not None:
+                await pool.async_stop()
+            await certificates.async_stop()
+            await sessions.async_close()
+            await dns.close()
+            farm.stop()
+
+        expected = self.profile.endpoints * elapsed / args.interval
+        self.overheads.sort()
+        return {
+            "endpoints": self.profile.endpoints,
+            "duration": round(elapsed, 2),
+            "probes": self.probes,
+            "probes_per_sec": round(self.probes / elapsed, 1),
+            "expected_per_sec": round(expected / elapsed, 1),
+            "completion": round(self.probes / expected, 3) if expected else None,
+            "up": self.up,
+            "down": self.down,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "overhead_mean_ms": round(sum(self.overheads) / len(self.overheads), 2)
+            if self.overheads
+            else None,
+            **{
+                f"overhead_p{percent}_ms": None
+                if (value := _percentile(self.overheads, percent)) is None
+                else round(value, 2)
+                for percent in (50, 95, 99)
+            },
+            "cpu_seconds": round(cpu, 3),
+            "cpu_percent": round(cpu / elapsed * 100, 1),
+            "cpu_per_probe_us": round(cpu / self.probes * 1e6, 1) if self.probes else None,
+            # Worker processes are not included
+            "rss_mb": round(_rss_mb(), 1),
+            "rss_growth_mb": round(_rss_mb() - rss_start, 1),
+            "engine": stats,
+        }
+
+    async def _async_probe(
+        self,
+        index: int,
+        config: dict[str, Any],
+        endpoint: Any,
+        dns: Any,
+        sessions: Any,
+        certificates: Any,
+        probes: Any,
+        jobs: Any,
+        pool: Any,
+    ) -> None:
+        """Probe an endpoint the way the coordinators do and record the result."""
+
+        async def _async_request() -> dict[str, Any]:
+            if pool is not None:
+                async with jobs.slot():
+                    return await pool.async_probe(config)
+            client = sessions.get_session(config["verify_ssl"], config["timeout"])
+            async with jobs.slot():
+                return await probe.async_probe(client, config, certificates, dns)
+
+        # Every endpoint has its own URL, so a result reused from the registry
+        # would be a probe the schedule asked for but never sent
+        reason = None
+        try:
+            result = await probes.async_probe(
+                registry.probe_key(config), _async_request, max_age=0
+            )
+        except asyncio.TimeoutError:
+            outcome = "timeouts"
+            reason = f"Timeout connecting to {config['url']}"
+        except (aiohttp.ClientError, OSError, worker.WorkerProbeError) as err:
+            outcome = "errors"
+            reason = f"Error connecting to {config['url']}: {err}"
+        else:
+            endpoint.breaker.record_success()
+            record = probe_result.ProbeResult.from_probe(
+                result, probe.status_ok(result, config)
+            )
+            outcome = "up" if record.is_up else "down"
+            if self.recording and record.status_code is not None:
+                self.overheads.append(record.response_time - self.delays[index])
+        if reason is not None:
+            endpoint.breaker.record_failure(reason)
+            record = probe_result.ProbeResult(
+                config["url"], False, failure_reason=reason, circuit=endpoint.breaker.state
+            )
+        endpoint.record(record, time.time())
+
+        if self.recording:
+            self.probes += 1
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+
+def _compare(results: dict[str, Any], baseline_path: str) -> None:
+    """Print the change of the key metrics against an earlier results file."""
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = {
+            scenario["endpoints"]: scenario for scenario in json.load(file)["scenarios"]
+        }
+    for scenario in results["scenarios"]:
+        if (previous := baseline.get(scenario["endpoints"])) is None:
+            continue
+        print(f"\n{scenario['endpoints']} endpoints vs {baseline_path}:")
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = previous.get(metric), scenario.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            better = (change > 0) == higher_is_better
+            print(
+                f"  {metric:18} {old:>10} -> {new:>10}  {change:+6.1f}%"
+                f"{'' if abs(change) < 5 else ' better' if better else ' WORSE'}"
+            )
+
+
+def _print_summary(scenario: dict[str, Any]) -> None:
+    """Print the headline numbers of a scenario."""
+    print(
+        f"{scenario['endpoints']:>6} endpoints: "
+        f"{scenario['probes_per_sec']:>8} probes/s "
+        f"({scenario['completion']:.1%} of schedule), "
+        f"overhead p50/p95 {scenario['overhead_p50_ms']}/{scenario['overhead_p95_ms']} ms, "
+        f"{scenario['cpu_per_probe_us']} us CPU/probe, "
+        f"{scenario['rss_mb']} MB RSS, "
+        f"{scenario['timeouts']} timeouts, {scenario['errors']} errors"
+    )
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--endpoints", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--duration", type=float, default=30, help="Seconds measured")
+    parser.add_argument("--interval", type=float, default=10, help="Probe interval")
+    parser.add_argument(
+        "--warmup", type=float, help="Seconds before measuring (default: interval)"
+    )
+    parser.add_argument("--timeout", type=int, default=10)
+    parser.add_argument("--max-in-flight", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument(
+        "--probe-type", choices=["http", "head", "tcp", "tls"], default="http"
+    )
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Mean delay")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--slow-body-rate", type=float, default=0.0)
+    parser.add_argument("--slow-body-delay-ms", type=float, default=100)
+    parser.add_argument("--tls", action="store_true", help="Serve endpoints over TLS")
+    parser.add_argument("--hosts", type=int, default=250, help="Loopback hosts used")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--tls-port", type=int, default=18443)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Compare with an earlier results file")
+    args = parser.parse_args()
+    if args.warmup is None:
+        args.warmup = args.interval
+    if args.probe_type == "tls":
+        args.tls = True
+
+    # Every pooled connection needs a file descriptor
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    if hard < 4 * max(args.endpoints):
+        print(f"Warning: only {hard} file descriptors available", file=sys.stderr)
+
+    with open(os.path.join(ENGINE_DIR, "manifest.json"), encoding="utf-8") as file:
+        version = json.load(file)["version"]
+    results: dict[str, Any] = {
+        "version": version,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "aiohttp": aiohttp.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "parameters": {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("output", "compare")
+        },
+        "scenarios": [],
+    }
+    for endpoints in args.endpoints:
+        scenario = asyncio.run(Scenario(args, endpoints).async_run())
+        results["scenarios"].append(scenario)
+        _print_summary(scenario)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        _compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
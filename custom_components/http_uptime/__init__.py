@@ -2,22 +2,92 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import discovery
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType
+import voluptuous as vol
 
-from .const import DOMAIN
+from .const import (
+    CONF_DEFERRED_STARTUP,
+    CONF_MAX_IN_FLIGHT,
+    CONF_PROFILE_RATE,
+    CONF_STARTUP_RATE,
+    CONF_WORKERS,
+    DATA_CERT_CACHE,
+    DATA_CONFIG,
+    DATA_COORDINATORS,
+    DATA_ENGINE_MONITOR,
+    DATA_ENGINE_SENSORS,
+    DATA_LOCATIONS,
+    DATA_METRICS,
+    DATA_PROBE_REGISTRY,
+    DATA_RESOLVER,
+    DATA_SCHEDULER,
+    DATA_SESSION_MANAGER,
+    DATA_STARTUP,
+    DATA_WORKER_POOL,
+    DEFAULT_DEFERRED_STARTUP,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_PROFILE_RATE,
+    DEFAULT_STARTUP_RATE,
+    DEFAULT_WORKERS,
+    DOMAIN,
+    HISTORY_DIR,
+    LEGACY_HISTORY_DIR,
+)
+from .history import migrate_history, remove_history
+from .services import async_setup_services
+from .views import AgentView, MetricsView
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MAX_IN_FLIGHT, default=DEFAULT_MAX_IN_FLIGHT
+                ): cv.positive_int,
+                vol.Optional(CONF_WORKERS, default=DEFAULT_WORKERS): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=32)
+                ),
+                vol.Optional(
+                    CONF_DEFERRED_STARTUP, default=DEFAULT_DEFERRED_STARTUP
+                ): cv.boolean,
+                vol.Optional(CONF_STARTUP_RATE, default=DEFAULT_STARTUP_RATE): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.1, max=1000)
+                ),
+                vol.Optional(CONF_PROFILE_RATE, default=DEFAULT_PROFILE_RATE): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=1)
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the HTTP Uptime Monitor component."""
+    hass.data.setdefault(DOMAIN, {})[DATA_CONFIG] = config.get(DOMAIN, {})
+    await hass.async_add_executor_job(
+        migrate_history,
+        hass.config.path(LEGACY_HISTORY_DIR),
+        hass.config.path(HISTORY_DIR),
+    )
+    hass.http.register_view(AgentView(hass))
+    hass.http.register_view(MetricsView(hass))
+    async_setup_services(hass)
+    # The engine sensors are not tied to an entry, so they outlive any of them
+    hass.async_create_task(
+        discovery.async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+    )
     return True
 
 
@@ -27,12 +97,72 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = entry.data
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its configuration changes."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        await _async_release_shared(hass)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the probe history of a removed config entry."""
+    await hass.async_add_executor_job(
+        remove_history, hass.config.path(HISTORY_DIR), entry.entry_id
+    )
+
+
+async def _async_release_shared(hass: HomeAssistant) -> None:
+    """Shut down integration-wide resources once the last entry is unloaded."""
+    domain_data = hass.data[DOMAIN]
+    if any(
+        other.entry_id in domain_data
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        return
+
+    # Before the parts they read, so a last poll does not recreate them
+    for sensor in domain_data.pop(DATA_ENGINE_SENSORS, ()):
+        await sensor.async_remove()
+
+    if (startup := domain_data.pop(DATA_STARTUP, None)) is not None:
+        _LOGGER.debug("Startup timings: %s", startup.stats)
+        await startup.async_stop()
+
+    if (scheduler := domain_data.pop(DATA_SCHEDULER, None)) is not None:
+        _LOGGER.debug("Stopping probe scheduler: %s", scheduler.stats)
+        await scheduler.async_stop()
+
+    domain_data.pop(DATA_PROBE_REGISTRY, None)
+    domain_data.pop(DATA_LOCATIONS, None)
+    domain_data.pop(DATA_METRICS, None)
+    domain_data.pop(DATA_COORDINATORS, None)
+
+    if (monitor := domain_data.pop(DATA_ENGINE_MONITOR, None)) is not None:
+        _LOGGER.debug("Stopping engine monitor: %s", monitor.stats)
+        monitor.async_stop()
+
+    if (pool := domain_data.pop(DATA_WORKER_POOL, None)) is not None:
+        _LOGGER.debug("Stopping probe workers: %s", pool.stats)
+        await pool.async_stop()
+
+    if (cache := domain_data.pop(DATA_CERT_CACHE, None)) is not None:
+        await cache.async_stop()
+
+    if (manager := domain_data.pop(DATA_SESSION_MANAGER, None)) is not None:
+        _LOGGER.debug("Closing pooled sessions: %s", manager.stats)
+        await manager.async_close()
+
+    if (resolver := domain_data.pop(DATA_RESOLVER, None)) is not None:
+        _LOGGER.debug("Closing DNS resolver: %s", resolver.stats)
+        await resolver.close()
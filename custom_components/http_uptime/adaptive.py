@@ -0,0 +1,90 @@
+"""Adaptive polling interval for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+from .const import (
+    ADAPTIVE_GROWTH,
+    ADAPTIVE_LATENCY_FACTOR,
+    ADAPTIVE_STABLE_PROBES,
+    DEFAULT_ADAPTIVE_LATENCY_MS,
+    DEFAULT_CONFIRM_COUNT,
+    DEFAULT_CONFIRM_INTERVAL,
+)
+
+# Weight of the newest response time in the latency baseline
+BASELINE_SMOOTHING = 0.2
+
+
+class AdaptiveInterval:
+    """Pick the next probe interval from the recent probe results.
+
+    After ``ADAPTIVE_STABLE_PROBES`` healthy probes in a row the interval
+    grows by ``ADAPTIVE_GROWTH`` per probe up to ``maximum``. A failed probe
+    or a latency jump of at least ``latency_threshold`` milliseconds resets
+    it and starts up to ``confirm_count`` re-probes every
+    ``confirm_interval`` seconds. Once the problem is confirmed, or
+    clears, probing continues at the configured ``base`` interval.
+    """
+
+    def __init__(
+        self,
+        base: float,
+        maximum: float,
+        confirm_count: int = DEFAULT_CONFIRM_COUNT,
+        confirm_interval: float = DEFAULT_CONFIRM_INTERVAL,
+        latency_threshold: float = DEFAULT_ADAPTIVE_LATENCY_MS,
+    ) -> None:
+        """Initialize the interval."""
+        self.base = base
+        self.maximum = max(maximum, base)
+        self.confirm_count = confirm_count
+        self.confirm_interval = min(confirm_interval, base)
+        self.latency_threshold = latency_threshold
+        self.interval = base
+        self._stable = 0
+        self._remaining = 0
+        self._degraded = False
+        self._baseline: float | None = None
+
+    @property
+    def confirming(self) -> bool:
+        """Return whether the next probe is a confirmation re-probe."""
+        return self._remaining > 0
+
+    def update(self, is_up: bool, latency: float | None) -> float:
+        """Record a probe result and return the interval until the next one."""
+        anomaly = not is_up or self._latency_jumped(latency)
+        if is_up and latency is not None:
+            self._baseline = (
+                latency
+                if self._baseline is None
+                else self._baseline + (latency - self._baseline) * BASELINE_SMOOTHING
+            )
+
+        if not anomaly:
+            self._remaining = 0
+            self._degraded = False
+            self._stable += 1
+            if self._stable > ADAPTIVE_STABLE_PROBES:
+                self.interval = min(self.interval * ADAPTIVE_GROWTH, self.maximum)
+            else:
+                self.interval = self.base
+            return self.interval
+
+        self._stable = 0
+        if self._remaining:
+            self._remaining -= 1
+        elif not self._degraded:
+            # A new problem: re-probe quickly to confirm it
+            self._degraded = True
+            self._remaining = self.confirm_count
+        self.interval = self.confirm_interval if self._remaining else self.base
+        return self.interval
+
+    def _latency_jumped(self, latency: float | None) -> bool:
+        """Return whether a response time is far above the baseline."""
+        if latency is None or self._baseline is None:
+            return False
+        return (
+            latency - self._baseline >= self.latency_threshold
+            and latency >= self._baseline * ADAPTIVE_LATENCY_FACTOR
+        )
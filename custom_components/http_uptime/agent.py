@@ -0,0 +1,218 @@
+"""Headless probe agent for HTTP Uptime Monitor.
+
+The agent runs the integration's probe engine without Home Assistant. It
+fetches the endpoints from Home Assistant's agent API, probes them on their
+intervals from the network it runs in, and pushes the results back in
+batches. Run it from the integration directory::
+
+    python custom_components/http_uptime/agent.py \\
+        --server http://homeassistant.local:8123 --token TOKEN --location office
+"""
+from __future__ import annotations
+
+if __name__ == "__main__" and not __package__:
+    # Run as a script: load this directory as a package without running its
+    # __init__, which needs Home Assistant
+    import importlib
+    import os
+    import sys
+    import types
+
+    _package = types.ModuleType("_http_uptime_engine")
+    _package.__path__ = [os.path.dirname(os.path.abspath(__file__))]
+    sys.modules[_package.__name__] = _package
+    importlib.import_module(f"{_package.__name__}.agent").main()
+    raise SystemExit
+
+import argparse
+import asyncio
+from collections import deque
+import logging
+import os
+import time
+from typing import Any
+
+import aiohttp
+
+from .certs import CertificateCache
+from .const import (
+    AGENT_API_PATH,
+    AGENT_BUFFER_LIMIT,
+    AGENT_FLUSH_INTERVAL,
+    AGENT_MAX_BATCH,
+    AGENT_SYNC_INTERVAL,
+    CONF_TIMEOUT,
+    CONF_UPDATE_INTERVAL,
+    CONF_VERIFY_SSL,
+    DEFAULT_MAX_IN_FLIGHT,
+)
+from .probe import async_probe
+from .resolver import CachingResolver
+from .scheduler import ProbeScheduler
+from .session import SessionManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ProbeAgent:
+    """Probe the endpoints handed out by Home Assistant and report back."""
+
+    def __init__(
+        self,
+        server: str,
+        token: str,
+        location: str,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        flush_interval: float = AGENT_FLUSH_INTERVAL,
+        sync_interval: float = AGENT_SYNC_INTERVAL,
+    ) -> None:
+        """Initialize the agent."""
+        self._url = server.rstrip("/") + AGENT_API_PATH
+        self._headers = {"Authorization": f"Bearer {token}"}
+        self.location = location
+        self._flush_interval = flush_interval
+        self._sync_interval = sync_interval
+        self._resolver = CachingResolver()
+        self._sessions = SessionManager(resolver=self._resolver)
+        self._certificates = CertificateCache()
+        self._scheduler = ProbeScheduler(max_in_flight)
+        self._endpoints: dict[str, dict[str, Any]] = {}
+        self._buffer: deque[list[Any]] = deque(maxlen=AGENT_BUFFER_LIMIT)
+        self._flush_due = asyncio.Event()
+        self.sent = 0
+        self.failed_pushes = 0
+
+    async def async_run(self) -> None:
+        """Sync endpoints and push results until cancelled."""
+        async with aiohttp.ClientSession(headers=self._headers) as api:
+            flusher = asyncio.get_running_loop().create_task(self._async_flush_loop(api))
+            try:
+                while True:
+                    try:
+                        await self._async_sync(api)
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                        _LOGGER.warning("Could not fetch endpoints: %s", err)
+                    await asyncio.sleep(self._sync_interval)
+            finally:
+                flusher.cancel()
+                await asyncio.gather(flusher, return_exceptions=True)
+                await self._async_push(api)
+                await self._scheduler.async_stop()
+                await self._certificates.async_stop()
+                await self._sessions.async_close()
+                await self._resolver.close()
+
+    async def _async_sync(self, api: aiohttp.ClientSession) -> None:
+        """Schedule new and changed endpoints and drop removed ones."""
+        async with api.get(self._url, raise_for_status=True) as response:
+            endpoints: dict[str, dict[str, Any]] = (await response.json())["endpoints"]
+
+        for key in self._endpoints.keys() - endpoints.keys():
+            self._scheduler.async_remove(key)
+        for key, config in endpoints.items():
+            if self._endpoints.get(key) != config:
+                self._scheduler.async_add(
+                    key,
+                    config[CONF_UPDATE_INTERVAL],
+                    lambda key=key, config=config: self._async_probe(key, config),
+                )
+        if endpoints != self._endpoints:
+            _LOGGER.info("Probing %s endpoints as %s", len(endpoints), self.location)
+        self._endpoints = endpoints
+
+    async def _async_probe(self, key: str, config: dict[str, Any]) -> None:
+        """Probe an endpoint and queue its result."""
+        session = self._sessions.get_session(config[CONF_VERIFY_SSL], config[CONF_TIMEOUT])
+        try:
+            async with self._scheduler.slot():
+                result = await async_probe(
+                    session, config, self._certificates, self._resolver
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Probe of %s failed: %s", key, err)
+            self._buffer.append([key, time.time(), False, None, None])
+        else:
+            self._buffer.append(
+                [
+                    key,
+                    time.time(),
+                    result["is_up"],
+                    result.get("status_code"),
+                    result.get("response_time"),
+                ]
+            )
+        if len(self._buffer) >= AGENT_MAX_BATCH:
+            self._flush_due.set()
+
+    async def _async_flush_loop(self, api: aiohttp.ClientSession) -> None:
+        """Push queued results periodically or when a batch is full."""
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_due.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_due.clear()
+            await self._async_push(api)
+
+    async def _async_push(self, api: aiohttp.ClientSession) -> None:
+        """Send queued results, keeping them for the next push on failure."""
+        while self._buffer:
+            batch = [
+                self._buffer.popleft()
+                for _ in range(min(len(self._buffer), AGENT_MAX_BATCH))
+            ]
+            try:
+                async with api.post(
+                    self._url,
+                    json={
+                        "location": self.location,
+                        "sent": time.time(),
+                        "results": batch,
+                    },
+                    raise_for_status=True,
+                ):
+                    pass
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                self.failed_pushes += 1
+                _LOGGER.warning("Could not push %s results: %s", len(batch), err)
+                self._buffer.extendleft(reversed(batch))
+                return
+            self.sent += len(batch)
+
+
+def main() -> None:
+    """Run the agent from the command line."""
+    parser = argparse.ArgumentParser(description="HTTP Uptime Monitor probe agent")
+    parser.add_argument("--server", required=True, help="Home Assistant base URL")
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("HTTP_UPTIME_TOKEN"),
+        help="Long-lived access token (default: $HTTP_UPTIME_TOKEN)",
+    )
+    parser.add_argument("--location", required=True, help="Name of this location")
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT)
+    parser.add_argument("--flush-interval", type=float, default=AGENT_FLUSH_INTERVAL)
+    parser.add_argument("--sync-interval", type=float, default=AGENT_SYNC_INTERVAL)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    if not args.token:
+        parser.error("--token or HTTP_UPTIME_TOKEN is required")
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    agent = ProbeAgent(
+        args.server,
+        args.token,
+        args.location,
+        args.max_in_flight,
+        args.flush_interval,
+        args.sync_interval,
+    )
+    try:
+        asyncio.run(agent.async_run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,104 @@
+"""Multi-location result aggregation for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .const import AGENT_STALE_FACTOR, AGENT_STALE_MIN, DATA_LOCATIONS, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+# Location name of the probes run by Home Assistant itself
+LOCATION_LOCAL = "local"
+
+
+class LocationResult(NamedTuple):
+    """Latest result of one endpoint from one location."""
+
+    timestamp: float
+    is_up: bool
+    status_code: int | None
+    response_time: float | None
+
+
+class LocationResults:
+    """Latest result per location of every endpoint offered to agents.
+
+    Endpoints are registered by the coordinators under a stable key; agents
+    fetch them, probe them from their own network and push their results
+    back. A verdict combines the results that are not older than a few probe
+    intervals.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the results."""
+        self._endpoints: dict[str, dict[str, Any]] = {}
+        self._results: dict[str, dict[str, LocationResult]] = {}
+        self.received = 0
+        self.rejected = 0
+
+    @property
+    def endpoints(self) -> dict[str, dict[str, Any]]:
+        """Return the endpoint configurations agents should probe."""
+        return self._endpoints
+
+    def register(self, key: str, config: dict[str, Any]) -> Callable[[], None]:
+        """Offer an endpoint to agents and return a function withdrawing it."""
+        self._endpoints[key] = config
+
+        def _unregister() -> None:
+            self._endpoints.pop(key, None)
+            self._results.pop(key, None)
+
+        return _unregister
+
+    def update(self, key: str, location: str, result: LocationResult) -> bool:
+        """Store a location's result, ignoring unknown endpoints."""
+        if key not in self._endpoints:
+            self.rejected += 1
+            return False
+        self.received += 1
+        self._results.setdefault(key, {})[location] = result
+        return True
+
+    def verdict(
+        self, key: str, interval: float, quorum: int = 0
+    ) -> tuple[bool | None, dict[str, LocationResult]]:
+        """Return the quorum state and the fresh results of an endpoint.
+
+        The endpoint is up when at least ``quorum`` fresh locations saw it
+        up; 0 requires a majority. Returns None without fresh results.
+        """
+        cutoff = time.time() - max(interval * AGENT_STALE_FACTOR, AGENT_STALE_MIN)
+        fresh = {
+            location: result
+            for location, result in self._results.get(key, {}).items()
+            if result.timestamp >= cutoff
+        }
+        if not fresh:
+            return None, fresh
+        up = sum(result.is_up for result in fresh.values())
+        needed = quorum or len(fresh) // 2 + 1
+        return up >= min(needed, len(fresh)), fresh
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return aggregation counters."""
+        return {
+            "endpoints": len(self._endpoints),
+            "locations": len(
+                {location for results in self._results.values() for location in results}
+            ),
+            "received": self.received,
+            "rejected": self.rejected,
+        }
+
+
+def async_get_location_results(hass: HomeAssistant) -> LocationResults:
+    """Return the integration-wide location results, creating them if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (results := domain_data.get(DATA_LOCATIONS)) is None:
+        results = domain_data[DATA_LOCATIONS] = LocationResults()
+    return results
@@ -0,0 +1,66 @@
+"""Circuit breaker for endpoints that stop answering."""
+from __future__ import annotations
+
+import time
+
+from .const import BREAKER_MAX_INTERVAL, BREAKER_THRESHOLD
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+
+
+class CircuitBreaker:
+    """Stop spending full timeouts on an endpoint that keeps failing.
+
+    Only probes that got no response count as failures. After ``threshold``
+    of them in a row the circuit opens: the endpoint is retried ``base``
+    seconds later, doubling the spacing after every failed retry up to
+    ``maximum``. A retry first needs a quick connection to succeed; the
+    first response closes the circuit again.
+    """
+
+    def __init__(
+        self,
+        base: float,
+        threshold: int = BREAKER_THRESHOLD,
+        maximum: float = BREAKER_MAX_INTERVAL,
+    ) -> None:
+        """Initialize the breaker."""
+        self.base = base
+        self.threshold = threshold
+        self.maximum = max(maximum, base)
+        self.failures = 0
+        self.reason: str | None = None
+        self.retry_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the endpoint only gets quick retries."""
+        return self.failures >= self.threshold
+
+    @property
+    def state(self) -> str:
+        """Return the state of the circuit."""
+        return CIRCUIT_OPEN if self.is_open else CIRCUIT_CLOSED
+
+    @property
+    def interval(self) -> float:
+        """Return the spacing of probes in the current state."""
+        if not self.is_open:
+            return self.base
+        return min(self.base * 2 ** (self.failures - self.threshold), self.maximum)
+
+    def due(self, now: float) -> bool:
+        """Return whether the endpoint should be probed at ``now``."""
+        return not self.is_open or now >= self.retry_at
+
+    def record_success(self) -> None:
+        """Close the circuit after a response."""
+        self.failures = 0
+        self.reason = None
+
+    def record_failure(self, reason: str) -> None:
+        """Count a probe that got no response."""
+        self.failures += 1
+        self.reason = reason
+        self.retry_at = time.monotonic() + self.interval
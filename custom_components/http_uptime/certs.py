@@ -0,0 +1,158 @@
+"""TLS certificate expiry cache for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from datetime import datetime, timezone
+import hashlib
+import logging
+import ssl
+import time
+from typing import TYPE_CHECKING
+
+from cryptography import x509
+
+from .const import CERT_FETCH_TIMEOUT, CERT_REFRESH_INTERVAL, DATA_CERT_CACHE, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def certificate_expiry(der: bytes) -> datetime:
+    """Return the expiry of a DER encoded certificate."""
+    certificate = x509.load_der_x509_certificate(der)
+    if hasattr(certificate, "not_valid_after_utc"):
+        return certificate.not_valid_after_utc
+    return certificate.not_valid_after.replace(tzinfo=timezone.utc)
+
+
+class _CertificateEntry:
+    """Cached certificate information of one host:port and pinned address."""
+
+    __slots__ = ("expires", "fingerprint", "checked", "task")
+
+    def __init__(self) -> None:
+        self.expires: datetime | None = None
+        self.fingerprint: bytes | None = None
+        self.checked = -CERT_REFRESH_INTERVAL
+        self.task: asyncio.Task | None = None
+
+
+class CertificateCache:
+    """Serve certificate expiry per host:port without parsing on the probe path.
+
+    Probes hand in the raw peer certificate when their connection is still
+    attached to the response; it is only hashed and compared with the cached
+    fingerprint. Parsing happens in a background task when the fingerprint
+    changes, and hosts that have not been observed for ``refresh_interval``
+    are fetched with a separate, unverified TLS handshake, so self-signed
+    certificates are covered too. Endpoints pinned to an address are cached
+    per address, and fetched from it with the host name as SNI.
+    """
+
+    def __init__(self, refresh_interval: float = CERT_REFRESH_INTERVAL) -> None:
+        """Initialize the cache."""
+        self._refresh_interval = refresh_interval
+        self._entries: dict[tuple[str, int, str | None], _CertificateEntry] = {}
+        self._context = ssl.create_default_context()
+        self._context.check_hostname = False
+        self._context.verify_mode = ssl.CERT_NONE
+        self.parsed = 0
+        self.fetched = 0
+
+    def get(self, host: str, port: int, address: str | None = None) -> datetime | None:
+        """Return the cached expiry, scheduling a refresh when it is stale."""
+        entry = self._entries.setdefault((host, port, address), _CertificateEntry())
+        if time.monotonic() - entry.checked >= self._refresh_interval:
+            self._schedule(host, port, address, entry, None)
+        return entry.expires
+
+    def observe(
+        self, host: str, port: int, der: bytes | None, address: str | None = None
+    ) -> None:
+        """Note the certificate a probe saw, refreshing if it changed."""
+        if not der:
+            return
+        entry = self._entries.setdefault((host, port, address), _CertificateEntry())
+        fingerprint = hashlib.sha256(der).digest()
+        if fingerprint == entry.fingerprint:
+            entry.checked = time.monotonic()
+            return
+        self._schedule(host, port, address, entry, der)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return cache counters."""
+        return {"hosts": len(self._entries), "parsed": self.parsed, "fetched": self.fetched}
+
+    async def async_stop(self) -> None:
+        """Cancel pending refreshes."""
+        tasks = [entry.task for entry in self._entries.values() if entry.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._entries.clear()
+
+    def _schedule(
+        self,
+        host: str,
+        port: int,
+        address: str | None,
+        entry: _CertificateEntry,
+        der: bytes | None,
+    ) -> None:
+        """Start a background refresh unless one is already running."""
+        if entry.task is not None and not entry.task.done():
+            return
+        entry.checked = time.monotonic()
+        entry.task = asyncio.get_running_loop().create_task(
+            self._async_refresh(host, port, address, entry, der)
+        )
+
+    async def _async_refresh(
+        self,
+        host: str,
+        port: int,
+        address: str | None,
+        entry: _CertificateEntry,
+        der: bytes | None,
+    ) -> None:
+        """Parse an observed certificate, or fetch and parse it."""
+        try:
+            if der is None:
+                der = await self._async_fetch(host, port, address)
+                self.fetched += 1
+            entry.expires = certificate_expiry(der)
+            entry.fingerprint = hashlib.sha256(der).digest()
+            self.parsed += 1
+        except (OSError, asyncio.TimeoutError, ValueError) as err:
+            _LOGGER.debug("Could not get certificate of %s:%s: %s", host, port, err)
+
+    async def _async_fetch(self, host: str, port: int, address: str | None) -> bytes:
+        """Return the certificate presented for host:port, at ``address`` if pinned."""
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                address or host, port, ssl=self._context, server_hostname=host
+            ),
+            CERT_FETCH_TIMEOUT,
+        )
+        try:
+            ssl_object = writer.get_extra_info("ssl_object")
+            der = ssl_object.getpeercert(binary_form=True) if ssl_object else None
+        finally:
+            writer.close()
+            with suppress(OSError, asyncio.TimeoutError):
+                await asyncio.wait_for(writer.wait_closed(), CERT_FETCH_TIMEOUT)
+        if not der:
+            raise ValueError("No certificate presented")
+        return der
+
+
+def async_get_certificate_cache(hass: HomeAssistant) -> CertificateCache:
+    """Return the integration-wide certificate cache, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (cache := domain_data.get(DATA_CERT_CACHE)) is None:
+        cache = domain_data[DATA_CERT_CACHE] = CertificateCache()
+    return cache
@@ -1,7 +1,11 @@
 """Config flow for HTTP Uptime Monitor integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
+import ipaddress
 import logging
+import re
 from typing import Any
 
 import aiohttp
@@ -11,33 +15,111 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_NAME, CONF_URL
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 
 from .const import (
+    CONF_ADAPTIVE_INTERVAL,
+    CONF_ADAPTIVE_LATENCY_MS,
+    CONF_BATCH_CONCURRENCY,
+    CONF_BODY_KEYWORD,
+    CONF_BODY_REGEX,
+    CONF_CONFIRM_COUNT,
+    CONF_CONFIRM_INTERVAL,
     CONF_ENDPOINTS,
     CONF_EXPECTED_STATUS,
     CONF_HEADERS,
+    CONF_JSON_PATH,
+    CONF_JSON_VALUE,
+    CONF_LATENCY_SENSORS,
+    CONF_LATENCY_THRESHOLD_MS,
+    CONF_LATENCY_THRESHOLD_PCT,
+    CONF_MAX_INTERVAL,
     CONF_METHOD,
+    CONF_PROBE_TYPE,
+    CONF_QUORUM,
+    CONF_RESOLVE,
+    CONF_STATE_HEARTBEAT,
+    CONF_STATS_WINDOWS,
     CONF_TIMEOUT,
     CONF_UPDATE_INTERVAL,
     CONF_VERIFY_SSL,
+    DEFAULT_ADAPTIVE_INTERVAL,
+    DEFAULT_ADAPTIVE_LATENCY_MS,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_CONFIRM_COUNT,
+    DEFAULT_CONFIRM_INTERVAL,
     DEFAULT_EXPECTED_STATUS,
+    DEFAULT_LATENCY_SENSORS,
+    DEFAULT_LATENCY_THRESHOLD_MS,
+    DEFAULT_LATENCY_THRESHOLD_PCT,
+    DEFAULT_MAX_INTERVAL,
     DEFAULT_METHOD,
+    DEFAULT_PROBE_TYPE,
+    DEFAULT_QUORUM,
+    DEFAULT_STATE_HEARTBEAT,
+    DEFAULT_STATS_WINDOWS,
     DEFAULT_TIMEOUT,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_VERIFY_SSL,
     DOMAIN,
+    PROBE_TYPE_HEAD,
+    PROBE_TYPE_TCP,
+    PROBE_TYPE_TLS,
+    PROBE_TYPES,
+    STATS_WINDOWS,
 )
+from .probe import async_probe_connect, connect_target
+from .resolver import async_get_resolver
+from .session import async_get_session_manager
 
 _LOGGER = logging.getLogger(__name__)
 
+# Options kept as-is when an entry is reconfigured
+ADVANCED_OPTIONS = [
+    CONF_STATS_WINDOWS,
+    CONF_LATENCY_THRESHOLD_MS,
+    CONF_LATENCY_THRESHOLD_PCT,
+    CONF_STATE_HEARTBEAT,
+    CONF_LATENCY_SENSORS,
+    CONF_QUORUM,
+    CONF_BODY_KEYWORD,
+    CONF_BODY_REGEX,
+    CONF_JSON_PATH,
+    CONF_JSON_VALUE,
+]
+
+CONTENT_OPTIONS = [CONF_BODY_KEYWORD, CONF_BODY_REGEX, CONF_JSON_PATH, CONF_JSON_VALUE]
+
+# Options that may be left empty; a cleared field is not submitted at all
+CLEARABLE_OPTIONS = [*CONTENT_OPTIONS, CONF_RESOLVE]
+
+METHODS = ["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"]
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_NAME): str,
         vol.Required(CONF_URL): str,
-        vol.Optional(CONF_METHOD, default=DEFAULT_METHOD): vol.In(
-            ["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"]
+        vol.Optional(CONF_PROBE_TYPE, default=DEFAULT_PROBE_TYPE): vol.In(PROBE_TYPES),
+        vol.Optional(CONF_METHOD, default=DEFAULT_METHOD): vol.In(METHODS),
+        vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=300)
         ),
+        vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=10, max=3600)
+        ),
+        vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool,
+        vol.Optional(CONF_EXPECTED_STATUS, default="200"): str,
+        vol.Optional(CONF_HEADERS, default=""): str,
+    }
+)
+
+STEP_BATCH_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): str,
+        vol.Required(CONF_ENDPOINTS): str,
+        vol.Optional(CONF_PROBE_TYPE, default=DEFAULT_PROBE_TYPE): vol.In(PROBE_TYPES),
+        vol.Optional(CONF_METHOD, default=DEFAULT_METHOD): vol.In(METHODS),
         vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): vol.All(
             vol.Coerce(int), vol.Range(min=1, max=300)
         ),
@@ -47,55 +129,241 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool,
         vol.Optional(CONF_EXPECTED_STATUS, default="200"): str,
         vol.Optional(CONF_HEADERS, default=""): str,
+        vol.Optional(CONF_BATCH_CONCURRENCY, default=DEFAULT_BATCH_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=500)
+        ),
     }
 )
 
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
-    
-    # Parse expected status codes
+def _advanced_options_schema(data: Mapping[str, Any]) -> dict[vol.Optional, Any]:
+    """Return the options shared by single endpoint and batch entries."""
+    return {
+        vol.Optional(
+            CONF_STATS_WINDOWS,
+            default=data.get(CONF_STATS_WINDOWS, DEFAULT_STATS_WINDOWS),
+        ): cv.multi_select(list(STATS_WINDOWS)),
+        vol.Optional(
+            CONF_LATENCY_THRESHOLD_MS,
+            default=data.get(CONF_LATENCY_THRESHOLD_MS, DEFAULT_LATENCY_THRESHOLD_MS),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(
+            CONF_LATENCY_THRESHOLD_PCT,
+            default=data.get(CONF_LATENCY_THRESHOLD_PCT, DEFAULT_LATENCY_THRESHOLD_PCT),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+        vol.Optional(
+            CONF_STATE_HEARTBEAT,
+            default=data.get(CONF_STATE_HEARTBEAT, DEFAULT_STATE_HEARTBEAT),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+        vol.Optional(
+            CONF_LATENCY_SENSORS,
+            default=data.get(CONF_LATENCY_SENSORS, DEFAULT_LATENCY_SENSORS),
+        ): bool,
+        vol.Optional(
+            CONF_QUORUM,
+            default=data.get(CONF_QUORUM, DEFAULT_QUORUM),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+    }
+
+
+def _content_options_schema(data: Mapping[str, Any]) -> dict[vol.Optional, Any]:
+    """Return the response body assertion options."""
+    return {
+        vol.Optional(
+            key, description={"suggested_value": data.get(key, "")}
+        ): str
+        for key in CONTENT_OPTIONS
+    }
+
+
+def _validate_content(data: Mapping[str, Any]) -> None:
+    """Raise if the body regex does not compile."""
+    if pattern := data.get(CONF_BODY_REGEX):
+        try:
+            re.compile(pattern.encode())
+        except re.error as err:
+            raise InvalidContentCheck(f"Invalid regular expression: {err}") from err
+
+
+def _adaptive_options_schema(data: Mapping[str, Any]) -> dict[vol.Optional, Any]:
+    """Return the adaptive interval options of single endpoint entries."""
+    return {
+        vol.Optional(
+            CONF_ADAPTIVE_INTERVAL,
+            default=data.get(CONF_ADAPTIVE_INTERVAL, DEFAULT_ADAPTIVE_INTERVAL),
+        ): bool,
+        vol.Optional(
+            CONF_MAX_INTERVAL,
+            default=data.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL),
+        ): vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
+        vol.Optional(
+            CONF_CONFIRM_COUNT,
+            default=data.get(CONF_CONFIRM_COUNT, DEFAULT_CONFIRM_COUNT),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10)),
+        vol.Optional(
+            CONF_CONFIRM_INTERVAL,
+            default=data.get(CONF_CONFIRM_INTERVAL, DEFAULT_CONFIRM_INTERVAL),
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+        vol.Optional(
+            CONF_ADAPTIVE_LATENCY_MS,
+            default=data.get(CONF_ADAPTIVE_LATENCY_MS, DEFAULT_ADAPTIVE_LATENCY_MS),
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60000)),
+    }
+
+
+def _parse_expected_status(value: str | list[int]) -> list[int]:
+    """Parse expected status codes from a comma-separated string."""
     try:
-        if isinstance(data[CONF_EXPECTED_STATUS], str):
-            expected_status = [int(x.strip()) for x in data[CONF_EXPECTED_STATUS].split(",")]
-        else:
-            expected_status = data[CONF_EXPECTED_STATUS]
+        if isinstance(value, str):
+            return [int(x.strip()) for x in value.split(",")]
+        return value
     except (ValueError, TypeError):
-        expected_status = DEFAULT_EXPECTED_STATUS
-    
-    # Parse headers
+        return DEFAULT_EXPECTED_STATUS
+
+
+def _parse_headers(value: str | dict[str, str] | None) -> dict[str, str]:
+    """Parse headers given one per line as 'Key: Value'."""
     headers = {}
-    if data.get(CONF_HEADERS):
+    if value:
         try:
-            if isinstance(data[CONF_HEADERS], dict):
-                headers = data[CONF_HEADERS]
+            if isinstance(value, dict):
+                headers = value
             else:
-                for line in data[CONF_HEADERS].split("\n"):
+                for line in value.split("\n"):
                     line = line.strip()
                     if line and ":" in line:
-                        key, value = line.split(":", 1)
-                        headers[key.strip()] = value.strip()
+                        key, val = line.split(":", 1)
+                        headers[key.strip()] = val.strip()
         except Exception:
             headers = {}
+    return headers
+
+
+def _parse_endpoints(
+    value: str | list[dict[str, str]], probe_type: str = DEFAULT_PROBE_TYPE
+) -> list[dict[str, str]]:
+    """Parse endpoints given one per line as 'Name | URL' or just 'URL'."""
+    if isinstance(value, list):
+        endpoints = value
+    else:
+        endpoints = []
+        for line in value.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+            name, _, url = line.rpartition("|")
+            url = url.strip()
+            if not url.startswith(("http://", "https://", "tcp://")):
+                raise InvalidEndpoints(f"Invalid endpoint URL: {url}")
+            endpoints.append({CONF_NAME: name.strip() or url, CONF_URL: url})
+
+    if not endpoints:
+        raise InvalidEndpoints("No endpoints given")
+    for endpoint in endpoints:
+        try:
+            _validate_connect_target(endpoint[CONF_URL], probe_type)
+        except InvalidHost as err:
+            raise InvalidEndpoints(str(err)) from err
+    return endpoints
+
+
+def _validate_connect_target(url: str, probe_type: str) -> None:
+    """Check a URL names the host and port a connection-level probe needs.
+
+    ``tcp://`` URLs are only probed by connection-level probes, which fail
+    on every check without a port, so both are caught here instead.
+    """
+    if probe_type not in (PROBE_TYPE_TCP, PROBE_TYPE_TLS):
+        if url.startswith("tcp://"):
+            raise InvalidHost(f"{url} needs the tcp or tls probe type")
+        return
+    try:
+        connect_target({CONF_URL: url}, probe_type == PROBE_TYPE_TLS)
+    except ValueError as err:
+        raise InvalidHost(str(err)) from err
+
+
+def _format_endpoints(endpoints: list[dict[str, str]]) -> str:
+    """Format endpoints back into the multi-line form representation."""
+    return "\n".join(
+        f"{endpoint[CONF_NAME]} | {endpoint[CONF_URL]}" for endpoint in endpoints
+    )
+
+
+async def validate_input(
+    hass: HomeAssistant, data: dict[str, Any], connect: bool = True
+) -> dict[str, Any]:
+    """Validate the user input allows us to connect.
+
+    With ``connect`` unset, the input is only checked and normalized.
+    """
+    _validate_content(data)
+    if pinned := data.get(CONF_RESOLVE):
+        try:
+            ipaddress.ip_address(pinned)
+        except ValueError as err:
+            raise InvalidHost(f"Invalid address: {pinned}") from err
+    expected_status = _parse_expected_status(data[CONF_EXPECTED_STATUS])
+    headers = _parse_headers(data.get(CONF_HEADERS))
+    probe_type = data.get(CONF_PROBE_TYPE, DEFAULT_PROBE_TYPE)
+    _validate_connect_target(data[CONF_URL], probe_type)
+
+    if connect and probe_type in (PROBE_TYPE_TCP, PROBE_TYPE_TLS):
+        await _validate_connect(hass, data, probe_type == PROBE_TYPE_TLS)
+    elif connect:
+        await _validate_request(hass, data, probe_type, expected_status, headers)
+
+    return {
+        CONF_NAME: data[CONF_NAME],
+        CONF_URL: data[CONF_URL],
+        CONF_PROBE_TYPE: probe_type,
+        CONF_METHOD: data[CONF_METHOD],
+        CONF_TIMEOUT: data[CONF_TIMEOUT],
+        CONF_UPDATE_INTERVAL: data[CONF_UPDATE_INTERVAL],
+        CONF_VERIFY_SSL: data[CONF_VERIFY_SSL],
+        CONF_EXPECTED_STATUS: expected_status,
+        CONF_HEADERS: headers,
+        CONF_RESOLVE: pinned or "",
+    }
+
+
+async def _validate_connect(
+    hass: HomeAssistant, data: dict[str, Any], tls: bool
+) -> None:
+    """Test that a connection-level probe can connect."""
+    try:
+        await async_probe_connect(data, resolver=async_get_resolver(hass), tls=tls)
+    except ValueError as err:
+        raise InvalidHost(str(err)) from err
+    except (OSError, asyncio.TimeoutError) as err:
+        _LOGGER.error("Failed to connect to %s: %s", data[CONF_URL], err)
+        raise CannotConnect(str(err)) from err
+
+
+async def _validate_request(
+    hass: HomeAssistant,
+    data: dict[str, Any],
+    probe_type: str,
+    expected_status: list[int],
+    headers: dict[str, str],
+) -> None:
+    """Test that an HTTP probe gets a response."""
+    method = "HEAD" if probe_type == PROBE_TYPE_HEAD else data[CONF_METHOD]
+    # The pooled sessions of the probes are reused, so validating many
+    # endpoints does not open a connector per endpoint
+    session = async_get_session_manager(hass).get_session(
+        data[CONF_VERIFY_SSL], data[CONF_TIMEOUT]
+    )
 
-    # Test the connection
-    timeout = aiohttp.ClientTimeout(total=data[CONF_TIMEOUT])
-    connector = aiohttp.TCPConnector(verify_ssl=data[CONF_VERIFY_SSL])
-    
     try:
-        async with aiohttp.ClientSession(
-            timeout=timeout, connector=connector, headers=headers
-        ) as session:
-            async with session.request(
-                data[CONF_METHOD], data[CONF_URL]
-            ) as response:
-                if response.status not in expected_status:
-                    _LOGGER.warning(
-                        "Unexpected status code %s for %s (expected: %s)", 
-                        response.status, 
-                        data[CONF_URL],
-                        expected_status
-                    )
+        async with session.request(method, data[CONF_URL], headers=headers) as response:
+            if response.status not in expected_status:
+                _LOGGER.warning(
+                    "Unexpected status code %s for %s (expected: %s)",
+                    response.status,
+                    data[CONF_URL],
+                    expected_status
+                )
     except aiohttp.ClientError as err:
         _LOGGER.error("Failed to connect to %s: %s", data[CONF_URL], err)
         raise
@@ -103,18 +371,46 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         _LOGGER.error("Unexpected error connecting to %s: %s", data[CONF_URL], err)
         raise
 
+
+def validate_batch_input(data: dict[str, Any]) -> dict[str, Any]:
+    """Validate the user input for a batch of endpoints.
+
+    Endpoints are not contacted here; with hundreds of URLs that is left to
+    the first refresh of the batch coordinator.
+    """
+    _validate_content(data)
+    probe_type = data.get(CONF_PROBE_TYPE, DEFAULT_PROBE_TYPE)
     return {
         CONF_NAME: data[CONF_NAME],
-        CONF_URL: data[CONF_URL],
+        CONF_ENDPOINTS: _parse_endpoints(data[CONF_ENDPOINTS], probe_type),
+        CONF_PROBE_TYPE: probe_type,
         CONF_METHOD: data[CONF_METHOD],
         CONF_TIMEOUT: data[CONF_TIMEOUT],
         CONF_UPDATE_INTERVAL: data[CONF_UPDATE_INTERVAL],
         CONF_VERIFY_SSL: data[CONF_VERIFY_SSL],
-        CONF_EXPECTED_STATUS: expected_status,
-        CONF_HEADERS: headers,
+        CONF_EXPECTED_STATUS: _parse_expected_status(data[CONF_EXPECTED_STATUS]),
+        CONF_HEADERS: _parse_headers(data.get(CONF_HEADERS)),
+        CONF_BATCH_CONCURRENCY: data[CONF_BATCH_CONCURRENCY],
+        **{key: data[key] for key in ADVANCED_OPTIONS if key in data},
     }
 
 
+class InvalidEndpoints(HomeAssistantError):
+    """Error to indicate the endpoint list could not be parsed."""
+
+
+class InvalidContentCheck(HomeAssistantError):
+    """Error to indicate a response body assertion is invalid."""
+
+
+class InvalidHost(HomeAssistantError):
+    """Error to indicate a host, port or pinned address is invalid."""
+
+
+class CannotConnect(HomeAssistantError):
+    """Error to indicate a connection-level probe could not connect."""
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for HTTP Uptime Monitor."""
 
@@ -124,6 +420,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["endpoint", "batch"])
+
+    async def async_step_endpoint(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle adding a single endpoint."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -134,7 +436,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             
             try:
                 info = await validate_input(self.hass, user_input)
-            except aiohttp.ClientError:
+            except InvalidHost:
+                errors["base"] = "invalid_host"
+            except (aiohttp.ClientError, CannotConnect):
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
@@ -143,9 +447,41 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(title=info[CONF_NAME], data=info)
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="endpoint", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_batch(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle adding a batch of endpoints probed by one coordinator."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            await self.async_set_unique_id(f"batch_{user_input[CONF_NAME]}")
+            self._abort_if_unique_id_configured()
+
+            try:
+                info = validate_batch_input(user_input)
+            except InvalidEndpoints:
+                errors["base"] = "invalid_endpoints"
+            else:
+                return self.async_create_entry(title=info[CONF_NAME], data=info)
+
+        return self.async_show_form(
+            step_id="batch", data_schema=STEP_BATCH_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create an entry from endpoints validated by the import service."""
+        if CONF_ENDPOINTS in import_data:
+            await self.async_set_unique_id(f"batch_{import_data[CONF_NAME]}")
+        else:
+            await self.async_set_unique_id(
+                f"{import_data[CONF_URL]}_{import_data[CONF_NAME]}"
+            )
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=import_data[CONF_NAME], data=import_data)
+
     @staticmethod
     def async_get_options_flow(config_entry: config_entries.ConfigEntry):
         """Return the options flow."""
@@ -163,14 +499,25 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        if CONF_ENDPOINTS in self.config_entry.data:
+            return await self.async_step_batch(user_input)
+
         errors: dict[str, str] = {}
 
         if user_input is not None:
             try:
                 # Validate the new configuration
-                updated_data = {**self.config_entry.data, **user_input}
-                await validate_input(self.hass, updated_data)
-            except aiohttp.ClientError:
+                updated_data = {
+                    **self.config_entry.data,
+                    **dict.fromkeys(CLEARABLE_OPTIONS, ""),
+                    **user_input,
+                }
+                updated_data.update(await validate_input(self.hass, updated_data))
+            except InvalidContentCheck:
+                errors["base"] = "invalid_content_check"
+            except InvalidHost:
+                errors["base"] = "invalid_host"
+            except (aiohttp.ClientError, CannotConnect):
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
@@ -185,6 +532,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         # Create options schema with current values as defaults
         options_schema = vol.Schema(
             {
+                vol.Optional(
+                    CONF_PROBE_TYPE,
+                    default=self.config_entry.data.get(CONF_PROBE_TYPE, DEFAULT_PROBE_TYPE),
+                ): vol.In(PROBE_TYPES),
                 vol.Optional(
                     CONF_METHOD, 
                     default=self.config_entry.data.get(CONF_METHOD, DEFAULT_METHOD)
@@ -209,9 +560,84 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_HEADERS,
                     default="\n".join([f"{k}: {v}" for k, v in self.config_entry.data.get(CONF_HEADERS, {}).items()])
                 ): str,
+                **_advanced_options_schema(self.config_entry.data),
+                **_content_options_schema(self.config_entry.data),
+                vol.Optional(
+                    CONF_RESOLVE,
+                    description={
+                        "suggested_value": self.config_entry.data.get(CONF_RESOLVE, "")
+                    },
+                ): str,
+                **_adaptive_options_schema(self.config_entry.data),
             }
         )
 
         return self.async_show_form(
             step_id="init", data_schema=options_schema, errors=errors
         )
+
+    async def async_step_batch(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options of a batch entry."""
+        errors: dict[str, str] = {}
+        data = self.config_entry.data
+
+        if user_input is not None:
+            try:
+                updated_data = validate_batch_input(
+                    {**data, **dict.fromkeys(CONTENT_OPTIONS, ""), **user_input}
+                )
+            except InvalidEndpoints:
+                errors["base"] = "invalid_endpoints"
+            except InvalidContentCheck:
+                errors["base"] = "invalid_content_check"
+            else:
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry, data=updated_data
+                )
+                return self.async_create_entry(title="", data={})
+
+        options_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_ENDPOINTS, default=_format_endpoints(data[CONF_ENDPOINTS])
+                ): str,
+                vol.Optional(
+                    CONF_PROBE_TYPE, default=data.get(CONF_PROBE_TYPE, DEFAULT_PROBE_TYPE)
+                ): vol.In(PROBE_TYPES),
+                vol.Optional(
+                    CONF_METHOD, default=data.get(CONF_METHOD, DEFAULT_METHOD)
+                ): vol.In(["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"]),
+                vol.Optional(
+                    CONF_TIMEOUT, default=data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+                vol.Optional(
+                    CONF_UPDATE_INTERVAL,
+                    default=data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                vol.Optional(
+                    CONF_VERIFY_SSL, default=data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
+                ): bool,
+                vol.Optional(
+                    CONF_EXPECTED_STATUS,
+                    default=",".join(map(str, data.get(CONF_EXPECTED_STATUS, [200]))),
+                ): str,
+                vol.Optional(
+                    CONF_HEADERS,
+                    default="\n".join(
+                        [f"{k}: {v}" for k, v in data.get(CONF_HEADERS, {}).items()]
+                    ),
+                ): str,
+                vol.Optional(
+                    CONF_BATCH_CONCURRENCY,
+                    default=data.get(CONF_BATCH_CONCURRENCY, DEFAULT_BATCH_CONCURRENCY),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=500)),
+                **_advanced_options_schema(data),
+                **_content_options_schema(data),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="batch", data_schema=options_schema, errors=errors
+        )
@@ -12,6 +12,24 @@ CONF_UPDATE_INTERVAL = "update_interval"
 CONF_METHOD = "method"
 CONF_HEADERS = "headers"
 CONF_EXPECTED_STATUS = "expected_status"
+CONF_BATCH_CONCURRENCY = "batch_concurrency"
+CONF_MAX_IN_FLIGHT = "max_in_flight"
+CONF_PROBE_TYPE = "probe_type"
+CONF_RESOLVE = "resolve"
+CONF_WORKERS = "workers"
+CONF_QUORUM = "quorum"
+CONF_DEFERRED_STARTUP = "deferred_startup"
+CONF_STARTUP_RATE = "startup_rate"
+CONF_PROFILE_RATE = "profile_rate"
+
+# Probe types
+PROBE_TYPE_HTTP = "http"
+PROBE_TYPE_HEAD = "head"
+PROBE_TYPE_TCP = "tcp"
+PROBE_TYPE_TLS = "tls"
+PROBE_TYPES = [PROBE_TYPE_HTTP, PROBE_TYPE_HEAD, PROBE_TYPE_TCP, PROBE_TYPE_TLS]
+# Status codes after which a HEAD probe retries with a ranged GET
+HEAD_FALLBACK_STATUS = (405, 501)
 
 # Default values
 DEFAULT_TIMEOUT = 10
@@ -19,6 +37,150 @@ DEFAULT_UPDATE_INTERVAL = 60
 DEFAULT_METHOD = "GET"
 DEFAULT_VERIFY_SSL = True
 DEFAULT_EXPECTED_STATUS = [200]
+DEFAULT_BATCH_CONCURRENCY = 20
+DEFAULT_MAX_IN_FLIGHT = 50
+DEFAULT_PROBE_TYPE = PROBE_TYPE_HTTP
+DEFAULT_WORKERS = 0
+DEFAULT_QUORUM = 0
+DEFAULT_DEFERRED_STARTUP = True
+# First probes of deferred entries started per second
+DEFAULT_STARTUP_RATE = 10
+# Share of updates run under the profiler; 0 disables it
+DEFAULT_PROFILE_RATE = 0.0
+
+# Integration-wide data
+DATA_CERT_CACHE = "cert_cache"
+DATA_CONFIG = "config"
+DATA_COORDINATORS = "coordinators"
+DATA_ENGINE_MONITOR = "engine_monitor"
+DATA_ENGINE_PLATFORM = "engine_platform"
+DATA_ENGINE_SENSORS = "engine_sensors"
+DATA_LOCATIONS = "locations"
+DATA_METRICS = "metrics"
+DATA_PROBE_REGISTRY = "probe_registry"
+DATA_RESOLVER = "resolver"
+DATA_SCHEDULER = "scheduler"
+DATA_SESSION_MANAGER = "session_manager"
+DATA_STARTUP = "startup"
+DATA_WORKER_POOL = "worker_pool"
+
+# Shared connection pool
+POOL_LIMIT = 200
+POOL_LIMIT_PER_HOST = 8
+POOL_KEEPALIVE_TIMEOUT = 75
+
+# Identical probes completing within this many seconds share one request
+COALESCE_WINDOW = 5
+
+# Engine self-monitoring
+HEALTH_TICK = 0.5
+# Event loop lag above this many seconds counts as blocked time
+HEALTH_BLOCK_THRESHOLD = 0.1
+HEALTH_SMOOTHING = 0.2
+PROFILE_TOP_FUNCTIONS = 30
+
+# Worker processes
+WORKER_MAX_IN_FLIGHT = 200
+WORKER_STOP_TIMEOUT = 5
+
+# Probe agents
+AGENT_API_PATH = "/api/http_uptime/agent"
+AGENT_MAX_BATCH = 500
+AGENT_BUFFER_LIMIT = 10000
+AGENT_FLUSH_INTERVAL = 10
+AGENT_SYNC_INTERVAL = 300
+# Agent results expire after this many probe intervals, but never sooner
+# than AGENT_STALE_MIN seconds
+AGENT_STALE_FACTOR = 3
+AGENT_STALE_MIN = 60
+
+# OpenMetrics export
+METRICS_API_PATH = "/api/http_uptime/metrics"
+METRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+# Upper bounds of the response time histogram buckets, in seconds
+METRICS_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# DNS cache, in seconds
+DNS_MIN_TTL = 30
+DNS_MAX_TTL = 3600
+DNS_NEGATIVE_TTL = 30
+# Used when the system resolver does not report TTLs
+DNS_DEFAULT_TTL = 300
+
+# Bulk import service
+SERVICE_IMPORT_ENDPOINTS = "import_endpoints"
+SERVICE_CHECK_NOW = "check_now"
+ATTR_FILE = "file"
+ATTR_BATCH_NAME = "batch_name"
+ATTR_VALIDATE = "validate"
+ATTR_CONCURRENCY = "concurrency"
+ATTR_VALIDATION_TIMEOUT = "validation_timeout"
+IMPORT_CONCURRENCY = 50
+IMPORT_TIMEOUT = 15
+
+# Bytes of a response body drained so its connection can be kept alive
+PROBE_BODY_LIMIT = 1024 * 1024
+
+# Response body assertions
+CONF_BODY_KEYWORD = "body_keyword"
+CONF_BODY_REGEX = "body_regex"
+CONF_JSON_PATH = "json_path"
+CONF_JSON_VALUE = "json_value"
+# Bytes of a body searched at most when assertions are configured
+CONTENT_LIMIT = 256 * 1024
+
+# Certificate cache
+CERT_REFRESH_INTERVAL = 12 * 3600
+CERT_FETCH_TIMEOUT = 10
+
+# Rolling statistics
+CONF_STATS_WINDOWS = "stats_windows"
+STATS_WINDOWS = {"1h": 3600, "24h": 86400, "7d": 604800}
+DEFAULT_STATS_WINDOWS = ["1h", "24h", "7d"]
+STATS_MAX_SAMPLES = 720
+
+# State write throttling
+CONF_LATENCY_THRESHOLD_MS = "latency_threshold_ms"
+CONF_LATENCY_THRESHOLD_PCT = "latency_threshold_pct"
+CONF_STATE_HEARTBEAT = "state_heartbeat"
+CONF_LATENCY_SENSORS = "latency_sensors"
+DEFAULT_LATENCY_THRESHOLD_MS = 100
+DEFAULT_LATENCY_THRESHOLD_PCT = 25
+DEFAULT_STATE_HEARTBEAT = 900
+DEFAULT_LATENCY_SENSORS = False
+
+# Adaptive polling interval
+CONF_ADAPTIVE_INTERVAL = "adaptive_interval"
+CONF_MAX_INTERVAL = "max_interval"
+CONF_CONFIRM_COUNT = "confirm_count"
+CONF_CONFIRM_INTERVAL = "confirm_interval"
+CONF_ADAPTIVE_LATENCY_MS = "adaptive_latency_ms"
+DEFAULT_ADAPTIVE_INTERVAL = False
+DEFAULT_MAX_INTERVAL = 600
+DEFAULT_CONFIRM_COUNT = 3
+DEFAULT_CONFIRM_INTERVAL = 5
+DEFAULT_ADAPTIVE_LATENCY_MS = 100
+ADAPTIVE_STABLE_PROBES = 10
+ADAPTIVE_GROWTH = 1.5
+ADAPTIVE_LATENCY_FACTOR = 2
+
+# Circuit breaker for endpoints that stop answering
+BREAKER_THRESHOLD = 3
+BREAKER_MAX_INTERVAL = 900
+BREAKER_CONNECT_TIMEOUT = 3
+
+# Incidents
+INCIDENT_LOG_SIZE = 20
+EVENT_INCIDENT_OPENED = "http_uptime_incident_opened"
+EVENT_INCIDENT_CLOSED = "http_uptime_incident_closed"
+
+# Persistent history
+HISTORY_DIR = "http_uptime_history"
+LEGACY_HISTORY_DIR = ".storage/http_uptime_history"
+HISTORY_BATCH_SIZE = 60
+HISTORY_FLUSH_INTERVAL = 300
+HISTORY_COMPACT_INTERVAL = 3600
+HISTORY_RETENTION = {"raw": 2 * 86400, "1m": 14 * 86400, "1h": 400 * 86400}
 
 # Attributes
 ATTR_STATUS_CODE = "status_code"
@@ -27,3 +189,17 @@ ATTR_URL = "url"
 ATTR_LAST_SUCCESS = "last_success"
 ATTR_LAST_FAILURE = "last_failure"
 ATTR_SSL_EXPIRES = "ssl_expires"
+ATTR_DNS_TIME = "dns_time"
+ATTR_CONNECT_TIME = "connect_time"
+ATTR_TTFB = "ttfb"
+ATTR_TRANSFER_TIME = "transfer_time"
+ATTR_HANDSHAKE_TIME = "handshake_time"
+ATTR_CONNECTION_REUSED = "connection_reused"
+ATTR_EFFECTIVE_INTERVAL = "effective_interval"
+ATTR_RESTORED = "restored"
+ATTR_LOCATIONS = "locations"
+ATTR_CONTENT_MATCH = "content_match"
+ATTR_BYTES_READ = "bytes_read"
+ATTR_MATCH_TIME = "match_time"
+ATTR_CIRCUIT = "circuit"
+ATTR_FAILURE_REASON = "failure_reason"
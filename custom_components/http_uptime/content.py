@@ -0,0 +1,151 @@
+"""Response body assertions for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+import json
+import re
+from time import perf_counter_ns
+from typing import Any
+
+from .const import (
+    CONF_BODY_KEYWORD,
+    CONF_BODY_REGEX,
+    CONF_JSON_PATH,
+    CONF_JSON_VALUE,
+    CONTENT_LIMIT,
+)
+
+_MISSING = object()
+
+
+def resolve_json_path(document: Any, path: str) -> Any:
+    """Return the value at a dotted path such as ``checks.0.status``.
+
+    A leading ``$`` is ignored. Returns ``_MISSING`` when the path does not
+    exist.
+    """
+    value = document
+    for part in path.removeprefix("$").strip(".").split("."):
+        if not part:
+            continue
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif isinstance(value, list) and part.lstrip("-").isdigit():
+            try:
+                value = value[int(part)]
+            except IndexError:
+                return _MISSING
+        else:
+            return _MISSING
+    return value
+
+
+def _json_text(value: Any) -> str:
+    """Return a JSON value as the text it is compared with."""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+class ContentCheck:
+    """Evaluate body assertions incrementally over response chunks.
+
+    The keyword is searched in each chunk together with the tail of the
+    previous one, so reading stops as soon as it is found. A regular
+    expression and a JSON path need the whole body, which is buffered up to
+    ``limit`` bytes, so anchors and long matches behave as on the complete
+    body. Reading stops as soon as every assertion is decided.
+    """
+
+    def __init__(
+        self,
+        keyword: str | None = None,
+        regex: str | None = None,
+        json_path: str | None = None,
+        json_value: str | None = None,
+        limit: int = CONTENT_LIMIT,
+    ) -> None:
+        """Initialize the check."""
+        self.limit = limit
+        self._keyword = keyword.encode() if keyword else None
+        self._regex = re.compile(regex.encode()) if regex else None
+        self._json_path = json_path or None
+        self._json_value = json_value or None
+        self._overlap = len(self._keyword) - 1 if self._keyword else 0
+        self._tail = b""
+        self._buffer = bytearray() if self._json_path or self._regex else None
+        self.keyword_found = self._keyword is None
+        self.regex_found = self._regex is None
+        self.json_match: bool | None = None
+        self.bytes_read = 0
+        self.match_ns = 0
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> ContentCheck | None:
+        """Return the check configured for an endpoint, if any."""
+        if not any(
+            config.get(key) for key in (CONF_BODY_KEYWORD, CONF_BODY_REGEX, CONF_JSON_PATH)
+        ):
+            return None
+        return cls(
+            config.get(CONF_BODY_KEYWORD),
+            config.get(CONF_BODY_REGEX),
+            config.get(CONF_JSON_PATH),
+            config.get(CONF_JSON_VALUE),
+        )
+
+    @property
+    def done(self) -> bool:
+        """Return whether no more data is needed."""
+        return (
+            self.keyword_found and self._buffer is None
+        ) or self.bytes_read >= self.limit
+
+    def feed(self, chunk: bytes) -> None:
+        """Evaluate the next chunk of the body."""
+        start = perf_counter_ns()
+        chunk = chunk[: self.limit - self.bytes_read]
+        self.bytes_read += len(chunk)
+
+        if not self.keyword_found:
+            window = self._tail + chunk
+            if self._keyword in window:
+                self.keyword_found = True
+            self._tail = window[-self._overlap :] if self._overlap else b""
+
+        if self._buffer is not None:
+            self._buffer += chunk
+        self.match_ns += perf_counter_ns() - start
+
+    def finish(self) -> bool:
+        """Evaluate what needs the complete body and return the verdict."""
+        start = perf_counter_ns()
+        if self._buffer is not None:
+            body = bytes(self._buffer)
+            self._buffer = None
+            if self._regex is not None:
+                self.regex_found = self._regex.search(body) is not None
+            if self._json_path is not None:
+                self.json_match = self._match_json(body)
+        self.match_ns += perf_counter_ns() - start
+        return self.keyword_found and self.regex_found and self.json_match is not False
+
+    def _match_json(self, body: bytes) -> bool:
+        """Return whether the JSON path holds the expected value."""
+        try:
+            document = json.loads(body)
+        except ValueError:
+            return False
+        value = resolve_json_path(document, self._json_path)
+        if value is _MISSING:
+            return False
+        if self._json_value is None:
+            return bool(value)
+        return _json_text(value) == self._json_value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the verdict and its cost."""
+        return {
+            "content_match": self.finish(),
+            "bytes_read": self.bytes_read,
+            "match_time": round(self.match_ns / 1_000_000, 3),
+        }
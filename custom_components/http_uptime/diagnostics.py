@@ -0,0 +1,91 @@
+"""Diagnostics support for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_HEADERS,
+    DATA_CERT_CACHE,
+    DATA_COORDINATORS,
+    DATA_ENGINE_MONITOR,
+    DATA_LOCATIONS,
+    DATA_METRICS,
+    DATA_PROBE_REGISTRY,
+    DATA_RESOLVER,
+    DATA_SCHEDULER,
+    DATA_SESSION_MANAGER,
+    DATA_STARTUP,
+    DATA_WORKER_POOL,
+    DOMAIN,
+)
+
+TO_REDACT = {CONF_HEADERS}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics of a config entry and of the shared probe engine.
+
+    The engine's parts are looked up, not created: downloading diagnostics
+    must not start a monitor or worker pool that nothing would stop.
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+
+    def _stats(key: str) -> dict[str, Any] | None:
+        part = domain_data.get(key)
+        return None if part is None else part.stats
+
+    diagnostics: dict[str, Any] = {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "engine": {
+            "health": _stats(DATA_ENGINE_MONITOR),
+            "scheduler": _stats(DATA_SCHEDULER),
+            "sessions": _stats(DATA_SESSION_MANAGER),
+            "resolver": _stats(DATA_RESOLVER),
+            "registry": _stats(DATA_PROBE_REGISTRY),
+            "certificates": _stats(DATA_CERT_CACHE),
+            "locations": _stats(DATA_LOCATIONS),
+            "metrics": _stats(DATA_METRICS),
+            "workers": _stats(DATA_WORKER_POOL),
+            "startup": _stats(DATA_STARTUP),
+        },
+    }
+    monitor = domain_data.get(DATA_ENGINE_MONITOR)
+    if monitor is not None and monitor.profiler is not None:
+        diagnostics["engine"]["profile"] = monitor.profiler.top_functions()
+
+    coordinator = domain_data.get(DATA_COORDINATORS, {}).get(entry.entry_id)
+    if coordinator is not None:
+        now = time.time()
+        diagnostics["endpoints"] = {
+            str(key): {
+                "interval": coordinator.interval,
+                "circuit": tracker.breaker.state,
+                "failures": tracker.breaker.failures,
+                "statistics": {
+                    window: statistics.as_dict()
+                    for window, statistics in tracker.statistics.windows.items()
+                },
+                "incidents": {
+                    window: tracker.incidents.stats(window, now)
+                    for window in tracker.statistics.windows
+                },
+                "incident_log": [
+                    incident.as_dict(now) for incident in tracker.incidents.incidents
+                ],
+            }
+            for key, tracker in coordinator.trackers.items()
+        }
+        if isinstance(coordinator.data, dict):
+            diagnostics["data"] = {
+                key: result.as_dict() for key, result in coordinator.data.items()
+            }
+        elif coordinator.data is not None:
+            diagnostics["data"] = coordinator.data.as_dict()
+    return diagnostics
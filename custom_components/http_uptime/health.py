@@ -0,0 +1,212 @@
+"""Self-monitoring of the HTTP Uptime Monitor probe engine."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+import cProfile
+import logging
+import pstats
+import random
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .const import (
+    CONF_PROFILE_RATE,
+    DATA_CONFIG,
+    DATA_ENGINE_MONITOR,
+    DEFAULT_PROFILE_RATE,
+    DOMAIN,
+    HEALTH_BLOCK_THRESHOLD,
+    HEALTH_SMOOTHING,
+    HEALTH_TICK,
+    PROFILE_TOP_FUNCTIONS,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class SamplingProfiler:
+    """Profile a random share of coordinator updates with cProfile.
+
+    While a sampled update runs, everything the event loop does is profiled,
+    so the results also show the cost of other tasks interleaved with it.
+    Only one update is profiled at a time.
+    """
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the profiler."""
+        self._rate = rate
+        self._stats: pstats.Stats | None = None
+        self._active = False
+        self.sampled = 0
+        self.profiled_time = 0.0
+
+    async def async_run(self, action: Callable[[], Awaitable[_T]]) -> _T:
+        """Run ``action``, under the profiler if it is sampled."""
+        if self._active or random.random() >= self._rate:
+            return await action()
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler, e.g. Home Assistant's, is running
+            return await action()
+        self._active = True
+        start = time.perf_counter()
+        try:
+            return await action()
+        finally:
+            profile.disable()
+            self._active = False
+            self.sampled += 1
+            self.profiled_time += time.perf_counter() - start
+            if self._stats is None:
+                self._stats = pstats.Stats(profile)
+            else:
+                self._stats.add(profile)
+
+    def top_functions(self, limit: int = PROFILE_TOP_FUNCTIONS) -> list[dict[str, Any]]:
+        """Return the functions with the highest cumulative time."""
+        if self._stats is None:
+            return []
+        entries = sorted(
+            self._stats.stats.items(),  # type: ignore[attr-defined]
+            key=lambda item: item[1][3],
+            reverse=True,
+        )
+        return [
+            {
+                "function": f"{file}:{line}({name})",
+                "calls": calls,
+                "total_ms": round(total * 1000, 3),
+                "cumulative_ms": round(cumulative * 1000, 3),
+            }
+            for (file, line, name), (_, calls, total, cumulative, _) in entries[:limit]
+        ]
+
+
+class EngineMonitor:
+    """Measure the health of the probe engine itself.
+
+    A timer fires every ``tick`` seconds; how late it fires is the event
+    loop lag, and lag above ``HEALTH_BLOCK_THRESHOLD`` is counted as time
+    the loop was blocked. Probe throughput and process CPU usage are
+    smoothed over the same ticks, and synchronous work is attributed to
+    named phases by thread CPU time.
+    """
+
+    def __init__(self, profile_rate: float = DEFAULT_PROFILE_RATE, tick: float = HEALTH_TICK) -> None:
+        """Initialize the monitor."""
+        self._tick = tick
+        self._timer: asyncio.TimerHandle | None = None
+        self._expected = 0.0
+        self._last_probes = 0
+        self._last_cpu = 0.0
+        self.profiler = SamplingProfiler(profile_rate) if profile_rate else None
+        self.probes = 0
+        self.probe_rate = 0.0
+        self.cpu_percent = 0.0
+        self.loop_lag_last = 0.0
+        self.loop_lag_avg = 0.0
+        self.loop_lag_max = 0.0
+        self.loop_blocked = 0.0
+        self.phase_cpu: dict[str, float] = {}
+
+    def async_start(self) -> None:
+        """Start measuring."""
+        if self._timer is not None:
+            return
+        self._last_cpu = time.process_time()
+        self._last_probes = self.probes
+        self._schedule(asyncio.get_running_loop())
+
+    def async_stop(self) -> None:
+        """Stop measuring."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def record_probe(self) -> None:
+        """Count a completed probe."""
+        self.probes += 1
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Attribute the CPU time of the enclosed synchronous code to a phase."""
+        start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.phase_cpu[name] = self.phase_cpu.get(name, 0.0) + time.thread_time() - start
+
+    def add_phase_time(self, name: str, seconds: float) -> None:
+        """Attribute CPU time measured elsewhere to a phase."""
+        self.phase_cpu[name] = self.phase_cpu.get(name, 0.0) + seconds
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the engine health metrics."""
+        return {
+            "probes": self.probes,
+            "probe_rate": round(self.probe_rate, 2),
+            "cpu_percent": round(self.cpu_percent, 1),
+            "loop_lag_last": round(self.loop_lag_last, 4),
+            "loop_lag_avg": round(self.loop_lag_avg, 4),
+            "loop_lag_max": round(self.loop_lag_max, 4),
+            "loop_blocked": round(self.loop_blocked, 3),
+            "phase_cpu": {
+                name: round(seconds, 3) for name, seconds in sorted(self.phase_cpu.items())
+            },
+            "profiler": None
+            if self.profiler is None
+            else {
+                "sampled": self.profiler.sampled,
+                "profiled_time": round(self.profiler.profiled_time, 3),
+            },
+        }
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Arm the timer for the next tick."""
+        self._expected = loop.time() + self._tick
+        self._timer = loop.call_at(self._expected, self._on_tick)
+
+    def _on_tick(self) -> None:
+        """Measure how late the tick fired and update the rates."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        lag = max(now - self._expected, 0.0)
+        elapsed = self._tick + lag
+        self.loop_lag_last = lag
+        self.loop_lag_max = max(self.loop_lag_max, lag)
+        self.loop_lag_avg += (lag - self.loop_lag_avg) * HEALTH_SMOOTHING
+        if lag > HEALTH_BLOCK_THRESHOLD:
+            self.loop_blocked += lag
+
+        cpu = time.process_time()
+        rate = (self.probes - self._last_probes) / elapsed
+        self.probe_rate += (rate - self.probe_rate) * HEALTH_SMOOTHING
+        self.cpu_percent += (
+            (cpu - self._last_cpu) / elapsed * 100 - self.cpu_percent
+        ) * HEALTH_SMOOTHING
+        self._last_probes = self.probes
+        self._last_cpu = cpu
+        self._schedule(loop)
+
+
+def async_get_engine_monitor(hass: HomeAssistant) -> EngineMonitor:
+    """Return the integration-wide engine monitor, starting it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (monitor := domain_data.get(DATA_ENGINE_MONITOR)) is None:
+        config = domain_data.get(DATA_CONFIG, {})
+        monitor = domain_data[DATA_ENGINE_MONITOR] = EngineMonitor(
+            config.get(CONF_PROFILE_RATE, DEFAULT_PROFILE_RATE)
+        )
+        monitor.async_start()
+    return monitor
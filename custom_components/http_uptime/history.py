@@ -0,0 +1,302 @@
+"""Persistent probe history for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+import glob
+import logging
+import math
+import os
+import struct
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from .const import (
+    HISTORY_BATCH_SIZE,
+    HISTORY_COMPACT_INTERVAL,
+    HISTORY_DIR,
+    HISTORY_FLUSH_INTERVAL,
+    HISTORY_RETENTION,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# timestamp, latency (NaN without response), status code, flags
+RAW_RECORD = struct.Struct("<dfHB")
+# bucket start, probes, probes up, latency sum, latency max
+ROLLUP_RECORD = struct.Struct("<dIIdf")
+
+FLAG_UP = 0x01
+
+ROLLUP_RESOLUTIONS = {"1m": 60, "1h": 3600}
+
+
+class RawRecord(NamedTuple):
+    """A single probe result."""
+
+    timestamp: float
+    latency: float
+    status: int
+    flags: int
+
+    @property
+    def is_up(self) -> bool:
+        """Return whether the endpoint was up."""
+        return bool(self.flags & FLAG_UP)
+
+
+class RollupRecord(NamedTuple):
+    """Aggregated probe results of one bucket."""
+
+    start: float
+    count: int
+    up: int
+    latency_sum: float
+    latency_max: float
+
+
+class HistorySnapshot(NamedTuple):
+    """State restored from the history files."""
+
+    last: RawRecord | None
+    last_success: float | None
+    last_failure: float | None
+    hourly: list[RollupRecord]
+    minutely: list[RollupRecord]
+    raw: list[RawRecord]
+
+
+class RecordFile:
+    """Append-only file of fixed-size records ordered by their first field."""
+
+    def __init__(self, path: str, record: struct.Struct) -> None:
+        """Initialize the file."""
+        self.path = path
+        self._record = record
+
+    def append(self, rows: Iterable[tuple]) -> None:
+        """Append records, dropping a torn record left by a crash."""
+        data = b"".join(self._record.pack(*row) for row in rows)
+        if not data:
+            return
+        with open(self.path, "ab") as file:
+            if torn := file.tell() % self._record.size:
+                file.truncate(file.tell() - torn)
+                file.seek(0, os.SEEK_END)
+            file.write(data)
+
+    def read_since(self, since: float) -> list[tuple]:
+        """Return all records whose first field is at least ``since``."""
+        try:
+            with open(self.path, "rb") as file:
+                count = os.fstat(file.fileno()).st_size // self._record.size
+                start = self._bisect(file, count, since)
+                file.seek(start * self._record.size)
+                data = file.read((count - start) * self._record.size)
+        except FileNotFoundError:
+            return []
+        return list(self._record.iter_unpack(data))
+
+    def truncate_before(self, cutoff: float) -> None:
+        """Drop records older than ``cutoff`` by rewriting the file."""
+        try:
+            with open(self.path, "rb") as file:
+                count = os.fstat(file.fileno()).st_size // self._record.size
+                start = self._bisect(file, count, cutoff)
+                if not start:
+                    return
+                file.seek(start * self._record.size)
+                data = file.read((count - start) * self._record.size)
+        except FileNotFoundError:
+            return
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, self.path)
+
+    def _bisect(self, file, count: int, value: float) -> int:
+        """Return the index of the first record not older than ``value``."""
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            file.seek(mid * self._record.size)
+            if self._record.unpack(file.read(self._record.size))[0] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class HistoryStore:
+    """Raw probe records with 1-minute and 1-hour rollups of one endpoint.
+
+    Rollup buckets are written once they are complete; the open buckets are
+    rebuilt from the raw records when the store is loaded.
+    """
+
+    def __init__(self, directory: str, key: str) -> None:
+        """Initialize the store."""
+        self._directory = directory
+        self.raw = RecordFile(os.path.join(directory, f"{key}.raw"), RAW_RECORD)
+        self.rollups = {
+            name: RecordFile(os.path.join(directory, f"{key}.{name}"), ROLLUP_RECORD)
+            for name in ROLLUP_RESOLUTIONS
+        }
+        self._open: dict[str, list[float] | None] = dict.fromkeys(ROLLUP_RESOLUTIONS)
+        self._last_compact = 0.0
+
+    def load(self, since: float) -> HistorySnapshot:
+        """Load the records needed to restore state back to ``since``."""
+        raw = [RawRecord(*row) for row in self.raw.read_since(since)]
+        minutely = list(map(RollupRecord._make, self.rollups["1m"].read_since(since)))
+        if minutely:
+            first_minute = minutely[0].start
+        else:
+            first_minute = raw[0].timestamp if raw else math.inf
+        hourly = [
+            record
+            for record in map(RollupRecord._make, self.rollups["1h"].read_since(since))
+            if record.start + ROLLUP_RESOLUTIONS["1h"] <= first_minute
+        ]
+
+        if raw:
+            for name, resolution in ROLLUP_RESOLUTIONS.items():
+                bucket_start = raw[-1].timestamp // resolution * resolution
+                self._open[name] = None
+                self._roll(
+                    name,
+                    resolution,
+                    [record for record in raw if record.timestamp >= bucket_start],
+                    write=False,
+                )
+
+        last_success = last_failure = None
+        for record in reversed(raw):
+            if record.is_up and last_success is None:
+                last_success = record.timestamp
+            elif not record.is_up and last_failure is None:
+                last_failure = record.timestamp
+            if last_success is not None and last_failure is not None:
+                break
+        for record in (*reversed(minutely), *reversed(hourly)):
+            if last_success is not None and last_failure is not None:
+                break
+            if last_success is None and record.up:
+                last_success = record.start
+            if last_failure is None and record.up < record.count:
+                last_failure = record.start
+
+        return HistorySnapshot(
+            raw[-1] if raw else None, last_success, last_failure, hourly, minutely, raw
+        )
+
+    def append(self, rows: list[RawRecord]) -> None:
+        """Append probe records and update the rollups."""
+        os.makedirs(self._directory, exist_ok=True)
+        self.raw.append(rows)
+        for name, resolution in ROLLUP_RESOLUTIONS.items():
+            self._roll(name, resolution, rows)
+
+        now = time.time()
+        if now - self._last_compact >= HISTORY_COMPACT_INTERVAL:
+            self._last_compact = now
+            self.raw.truncate_before(now - HISTORY_RETENTION["raw"])
+            for name, file in self.rollups.items():
+                file.truncate_before(now - HISTORY_RETENTION[name])
+
+    def _roll(
+        self, name: str, resolution: int, rows: list[RawRecord], write: bool = True
+    ) -> None:
+        """Fold records into the open bucket, writing completed buckets."""
+        completed = []
+        bucket = self._open[name]
+        for record in rows:
+            start = record.timestamp // resolution * resolution
+            if bucket is not None and bucket[0] != start:
+                completed.append(tuple(bucket))
+                bucket = None
+            if bucket is None:
+                bucket = [start, 0, 0, 0.0, 0.0]
+            bucket[1] += 1
+            bucket[2] += record.is_up
+            if not math.isnan(record.latency):
+                bucket[3] += record.latency
+                bucket[4] = max(bucket[4], record.latency)
+        self._open[name] = bucket
+        if write:
+            self.rollups[name].append(completed)
+
+
+class ProbeHistory:
+    """Batch probe results of one endpoint into its history store."""
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the history."""
+        self.hass = hass
+        self._store = HistoryStore(hass.config.path(HISTORY_DIR), key)
+        self._pending: list[RawRecord] = []
+        self._last_flush = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def async_replay(
+        self, since: float, replay: Callable[[HistorySnapshot], None]
+    ) -> None:
+        """Load the stored history back to ``since`` and pass it to ``replay``.
+
+        Both run in the executor, so rebuilding state from a long history
+        does not block the event loop, and the snapshot is released as soon
+        as it was replayed.
+        """
+
+        def _replay() -> None:
+            replay(self._store.load(since))
+
+        await self.hass.async_add_executor_job(_replay)
+
+    def add(
+        self, timestamp: float, latency: float | None, status: int | None, is_up: bool
+    ) -> None:
+        """Queue a probe result, flushing when the batch is due."""
+        self._pending.append(
+            RawRecord(
+                timestamp,
+                math.nan if latency is None else latency,
+                status or 0,
+                FLAG_UP if is_up else 0,
+            )
+        )
+        if (
+            len(self._pending) >= HISTORY_BATCH_SIZE
+            or time.monotonic() - self._last_flush >= HISTORY_FLUSH_INTERVAL
+        ):
+            self.hass.async_create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        """Write queued results to disk."""
+        self._last_flush = time.monotonic()
+        async with self._lock:
+            if not self._pending:
+                return
+            rows, self._pending = self._pending, []
+            try:
+                await self.hass.async_add_executor_job(self._store.append, rows)
+            except OSError as err:
+                _LOGGER.warning("Could not write probe history: %s", err)
+
+
+def migrate_history(legacy: str, directory: str) -> None:
+    """Move history files from the legacy directory into ``directory``."""
+    if not os.path.isdir(legacy) or os.path.exists(directory):
+        return
+    os.replace(legacy, directory)
+    _LOGGER.info("Moved probe history from %s to %s", legacy, directory)
+
+
+def remove_history(directory: str, entry_id: str) -> None:
+    """Delete the history files of a config entry."""
+    for path in glob.glob(os.path.join(glob.escape(directory), f"{entry_id}*")):
+        os.remove(path)
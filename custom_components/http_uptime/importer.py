@@ -0,0 +1,231 @@
+"""Bulk endpoint import for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+import asyncio
+import csv
+import logging
+import math
+import time
+from typing import Any
+
+import aiohttp
+import voluptuous as vol
+import yaml
+
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.const import CONF_NAME, CONF_URL
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .config_flow import (
+    CONTENT_OPTIONS,
+    METHODS,
+    CannotConnect,
+    InvalidContentCheck,
+    InvalidEndpoints,
+    InvalidHost,
+    validate_batch_input,
+    validate_input,
+)
+from .const import (
+    CONF_ENDPOINTS,
+    CONF_EXPECTED_STATUS,
+    CONF_HEADERS,
+    CONF_METHOD,
+    CONF_PROBE_TYPE,
+    CONF_TIMEOUT,
+    CONF_UPDATE_INTERVAL,
+    CONF_VERIFY_SSL,
+    DOMAIN,
+    IMPORT_CONCURRENCY,
+    IMPORT_TIMEOUT,
+    PROBE_TYPES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Settings of one imported endpoint; missing ones come from the import call
+ENDPOINT_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_URL): cv.string,
+        vol.Optional(CONF_NAME): cv.string,
+        vol.Optional(CONF_PROBE_TYPE): vol.In(PROBE_TYPES),
+        vol.Optional(CONF_METHOD): vol.All(vol.Upper, vol.In(METHODS)),
+        vol.Optional(CONF_TIMEOUT): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+        vol.Optional(CONF_UPDATE_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=10, max=3600)
+        ),
+        vol.Optional(CONF_VERIFY_SSL): cv.boolean,
+        vol.Optional(CONF_EXPECTED_STATUS): vol.Any(cv.string, [vol.Coerce(int)]),
+        vol.Optional(CONF_HEADERS): vol.Any(cv.string, {cv.string: cv.string}),
+        **{vol.Optional(key): cv.string for key in CONTENT_OPTIONS},
+    }
+)
+
+
+def load_endpoints(path: str) -> list[dict[str, Any]]:
+    """Read endpoints from a YAML list or a CSV file with a header row."""
+    with open(path, encoding="utf-8") as file:
+        if path.lower().endswith(".csv"):
+            # Empty cells fall back to the defaults of the import call
+            return [
+                {key.strip(): value.strip() for key, value in row.items() if key and value}
+                for row in csv.DictReader(file)
+            ]
+        data = yaml.safe_load(file)
+
+    if isinstance(data, dict):
+        data = data.get(CONF_ENDPOINTS)
+    if not isinstance(data, list):
+        raise ValueError("Expected a list of endpoints")
+    return data
+
+
+def _entry_unique_id(data: dict[str, Any]) -> str:
+    """Return the unique id the config flow gives an entry."""
+    if CONF_ENDPOINTS in data:
+        return f"batch_{data[CONF_NAME]}"
+    return f"{data[CONF_URL]}_{data[CONF_NAME]}"
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of sorted values."""
+    return values[max(math.ceil(len(values) * percent / 100) - 1, 0)]
+
+
+async def async_import_endpoints(
+    hass: HomeAssistant,
+    endpoints: list[Any],
+    defaults: dict[str, Any],
+    batch_name: str | None = None,
+    connect: bool = True,
+    concurrency: int = IMPORT_CONCURRENCY,
+    timeout: float = IMPORT_TIMEOUT,
+) -> dict[str, Any]:
+    """Validate endpoints concurrently, create entries and report the outcome.
+
+    Every endpoint becomes its own entry, or with ``batch_name`` all valid
+    endpoints go into one batch entry. Validation shares the pooled probe
+    sessions; at most ``concurrency`` endpoints are contacted at once, each
+    for at most ``timeout`` seconds.
+    """
+    start = time.monotonic()
+    configured = {entry.unique_id for entry in hass.config_entries.async_entries(DOMAIN)}
+    if batch_name is not None and f"batch_{batch_name}" in configured:
+        raise HomeAssistantError(f"A batch named {batch_name} already exists")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    seen: set[str] = set()
+    failed: list[dict[str, Any]] = []
+    skipped: list[dict[str, Any]] = []
+    latencies: list[float] = []
+
+    async def _async_validate(raw: Any) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        try:
+            endpoint = ENDPOINT_SCHEMA(raw)
+        except vol.Invalid as err:
+            url = raw.get(CONF_URL) if isinstance(raw, dict) else raw
+            failed.append({CONF_URL: url, "error": str(err)})
+            return None
+
+        data = {CONF_NAME: endpoint[CONF_URL], **defaults, **endpoint}
+        summary = {CONF_NAME: data[CONF_NAME], CONF_URL: data[CONF_URL]}
+        unique_id = _entry_unique_id(data)
+        if unique_id in seen or (batch_name is None and unique_id in configured):
+            skipped.append(summary)
+            return None
+        seen.add(unique_id)
+
+        async with semaphore:
+            probe_start = time.monotonic()
+            try:
+                info = await asyncio.wait_for(validate_input(hass, data, connect), timeout)
+            except asyncio.TimeoutError:
+                error = f"No answer within {timeout} s"
+            except (
+                aiohttp.ClientError,
+                CannotConnect,
+                InvalidContentCheck,
+                InvalidHost,
+                OSError,
+            ) as err:
+                error = str(err) or type(err).__name__
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected error validating %s", data[CONF_URL])
+                error = str(err) or type(err).__name__
+            else:
+                error = None
+            if connect:
+                latencies.append((time.monotonic() - probe_start) * 1000)
+
+        if error is not None:
+            failed.append({**summary, "error": error})
+            return None
+        info.update({key: data[key] for key in CONTENT_OPTIONS if data.get(key)})
+        return endpoint, info
+
+    validated = [
+        result
+        for result in await asyncio.gather(*(_async_validate(raw) for raw in endpoints))
+        if result is not None
+    ]
+
+    if batch_name is None:
+        entries = [info for _, info in validated]
+    elif validated:
+        try:
+            entries = [
+                validate_batch_input(
+                    {
+                        **defaults,
+                        CONF_NAME: batch_name,
+                        # Settings given per endpoint override the batch's
+                        CONF_ENDPOINTS: [
+                            {key: info.get(key, endpoint[key]) for key in (CONF_NAME, *endpoint)}
+                            for endpoint, info in validated
+                        ],
+                    }
+                )
+            ]
+        except (InvalidContentCheck, InvalidEndpoints) as err:
+            raise HomeAssistantError(f"Invalid batch: {err}") from err
+    else:
+        entries = []
+
+    results = await asyncio.gather(
+        *(
+            hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": SOURCE_IMPORT}, data=entry
+            )
+            for entry in entries
+        )
+    )
+    created = sum(result["type"] == FlowResultType.CREATE_ENTRY for result in results)
+
+    latencies.sort()
+    report = {
+        "total": len(endpoints),
+        "valid": len(validated),
+        "created": created,
+        "failed": failed,
+        "skipped": skipped,
+        "validation_time": {
+            "avg": round(sum(latencies) / len(latencies), 2),
+            "p95": round(_percentile(latencies, 95), 2),
+            "max": round(latencies[-1], 2),
+        }
+        if latencies
+        else None,
+        "duration": round(time.monotonic() - start, 3),
+    }
+    _LOGGER.info(
+        "Imported %s of %s endpoints in %.1f s (%s failed, %s skipped)",
+        len(validated),
+        len(endpoints),
+        report["duration"],
+        len(failed),
+        len(skipped),
+    )
+    return report
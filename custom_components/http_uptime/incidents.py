@@ -0,0 +1,123 @@
+"""Incident tracking for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from .const import INCIDENT_LOG_SIZE, STATS_WINDOWS
+from .result import isoformat
+
+
+class Incident:
+    """An outage, from the first failed probe to the next passing one."""
+
+    __slots__ = ("start", "end", "status_code", "reason")
+
+    def __init__(self, start: float, status_code: int | None, reason: str | None) -> None:
+        """Initialize the incident."""
+        self.start = start
+        self.end: float | None = None
+        self.status_code = status_code
+        self.reason = reason
+
+    def duration(self, now: float) -> float:
+        """Return how long the incident lasted, or lasts so far."""
+        return (now if self.end is None else self.end) - self.start
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the incident with times in ISO 8601."""
+        return {
+            "start": isoformat(int(self.start)),
+            "end": None if self.end is None else isoformat(int(self.end)),
+            "duration": round(self.duration(now), 1),
+            "status_code": self.status_code,
+            "reason": self.reason,
+        }
+
+
+class _Window:
+    """Incidents closed within a rolling window and their total repair time."""
+
+    __slots__ = ("duration", "closed", "repair_time")
+
+    def __init__(self, duration: float) -> None:
+        self.duration = duration
+        self.closed: deque[Incident] = deque()
+        self.repair_time = 0.0
+
+    def add(self, incident: Incident, now: float) -> None:
+        """Add a closed incident and drop the ones that left the window."""
+        self.closed.append(incident)
+        self.repair_time += incident.duration(now)
+        self.evict(now)
+
+    def evict(self, now: float) -> None:
+        """Drop incidents that closed before the window."""
+        cutoff = now - self.duration
+        while self.closed and self.closed[0].end < cutoff:  # type: ignore[operator]
+            self.repair_time -= self.closed.popleft().duration(now)
+        if not self.closed:
+            self.repair_time = 0.0
+
+
+class IncidentLog:
+    """Outages of one endpoint and their aggregates over rolling windows.
+
+    Closed incidents are kept per window with a running total of their
+    durations, so recording a probe and reading the aggregates never scan
+    the history. An incident counts towards a window when it closed within
+    it, or is still open; its full duration counts as repair time.
+    """
+
+    def __init__(self, windows: list[str], size: int = INCIDENT_LOG_SIZE) -> None:
+        """Initialize the log."""
+        self.incidents: deque[Incident] = deque(maxlen=size)
+        self.open: Incident | None = None
+        self._windows = {window: _Window(STATS_WINDOWS[window]) for window in windows}
+        self._first_seen: float | None = None
+
+    def record(
+        self,
+        now: float,
+        is_up: bool,
+        status_code: int | None = None,
+        reason: str | None = None,
+    ) -> Incident | None:
+        """Record a probe and return the incident it opened or closed, if any."""
+        if self._first_seen is None:
+            self._first_seen = now
+        if is_up:
+            if (incident := self.open) is None:
+                return None
+            incident.end = now
+            self.open = None
+            for window in self._windows.values():
+                window.add(incident, now)
+            return incident
+
+        if self.open is not None:
+            return None
+        incident = self.open = Incident(now, status_code, reason)
+        self.incidents.append(incident)
+        return incident
+
+    def stats(self, window: str, now: float) -> dict[str, Any]:
+        """Return the outage count, MTTR, MTBF and downtime of a window."""
+        aggregate = self._windows[window]
+        aggregate.evict(now)
+        repairs = len(aggregate.closed)
+        outages = repairs
+        downtime = aggregate.repair_time
+        if self.open is not None:
+            outages += 1
+            downtime += now - max(self.open.start, now - aggregate.duration)
+        observed = 0.0
+        if self._first_seen is not None:
+            observed = min(aggregate.duration, now - self._first_seen)
+
+        return {
+            "outages": outages,
+            "mttr": round(aggregate.repair_time / repairs, 1) if repairs else None,
+            "mtbf": round(max(observed - downtime, 0) / outages, 1) if outages else None,
+            "downtime": round(downtime, 1),
+        }
@@ -0,0 +1,186 @@
+"""OpenMetrics export of HTTP Uptime Monitor probe results."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable
+import time
+from typing import TYPE_CHECKING, Any
+
+from .const import DATA_METRICS, DOMAIN, METRICS_LATENCY_BUCKETS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .result import ProbeResult
+
+# Metric family headers, in the order the samples of each series are rendered
+FAMILIES = (
+    "# TYPE http_uptime_up gauge\n"
+    "# HELP http_uptime_up Whether the endpoint passed its last check.\n",
+    "# TYPE http_uptime_status_code gauge\n"
+    "# HELP http_uptime_status_code HTTP status code of the last check.\n",
+    "# TYPE http_uptime_response_time_seconds histogram\n"
+    "# UNIT http_uptime_response_time_seconds seconds\n"
+    "# HELP http_uptime_response_time_seconds Response time of successful requests.\n",
+    "# TYPE http_uptime_ssl_expiry_timestamp_seconds gauge\n"
+    "# UNIT http_uptime_ssl_expiry_timestamp_seconds seconds\n"
+    "# HELP http_uptime_ssl_expiry_timestamp_seconds Expiry of the certificate.\n",
+    "# TYPE http_uptime_last_check_timestamp_seconds gauge\n"
+    "# UNIT http_uptime_last_check_timestamp_seconds seconds\n"
+    "# HELP http_uptime_last_check_timestamp_seconds Time of the last check.\n",
+    "# TYPE http_uptime_checks counter\n"
+    "# HELP http_uptime_checks Checks run since Home Assistant started.\n",
+    "# TYPE http_uptime_failures counter\n"
+    "# HELP http_uptime_failures Failed checks since Home Assistant started.\n",
+)
+
+
+# The "le" label of every histogram bucket
+BUCKET_BOUNDS = (*map(str, METRICS_LATENCY_BUCKETS), "+Inf")
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    """Render a label set without the surrounding braces."""
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+class EndpointSeries:
+    """Latest values and latency histogram of one endpoint.
+
+    The samples are rendered on the first scrape after a check and reused
+    until the next one, so scraping endpoints that did not change costs a
+    list lookup each.
+    """
+
+    __slots__ = (
+        "_labels",
+        "_buckets",
+        "_samples",
+        "is_up",
+        "status_code",
+        "latency_sum",
+        "latency_count",
+        "ssl_expires",
+        "last_check",
+        "checks",
+        "failures",
+    )
+
+    def __init__(self, labels: dict[str, str]) -> None:
+        """Initialize the series."""
+        self._labels = _labels(labels)
+        self._buckets = [0] * (len(METRICS_LATENCY_BUCKETS) + 1)
+        self._samples: tuple[str, ...] | None = None
+        self.is_up = False
+        self.status_code: int | None = None
+        self.latency_sum = 0.0
+        self.latency_count = 0
+        self.ssl_expires: int | None = None
+        self.last_check = 0.0
+        self.checks = 0
+        self.failures = 0
+
+    def update(self, result: ProbeResult | None) -> None:
+        """Add a check result, or a failed check when ``result`` is None."""
+        self.checks += 1
+        self.last_check = time.time()
+        self.is_up = bool(result and result.is_up)
+        if not self.is_up:
+            self.failures += 1
+        self.status_code = result.status_code if result else None
+        self._samples = None
+        if result is None:
+            return
+
+        if self.is_up and result.response_time is not None:
+            seconds = result.response_time / 1000
+            self._buckets[bisect_left(METRICS_LATENCY_BUCKETS, seconds)] += 1
+            self.latency_sum += seconds
+            self.latency_count += 1
+        if result.ssl_expires is not None:
+            self.ssl_expires = result.ssl_expires
+
+    def samples(self) -> tuple[str, ...]:
+        """Return the rendered samples of every metric family."""
+        if self._samples is not None:
+            return self._samples
+
+        labels = self._labels
+        histogram = []
+        cumulative = 0
+        for bound, count in zip(BUCKET_BOUNDS, self._buckets):
+            cumulative += count
+            histogram.append(
+                f'http_uptime_response_time_seconds_bucket{{{labels},le="{bound}"}} {cumulative}\n'
+            )
+        histogram.append(
+            f"http_uptime_response_time_seconds_count{{{labels}}} {self.latency_count}\n"
+            f"http_uptime_response_time_seconds_sum{{{labels}}} {self.latency_sum!r}\n"
+        )
+        self._samples = (
+            f"http_uptime_up{{{labels}}} {int(self.is_up)}\n",
+            ""
+            if self.status_code is None
+            else f"http_uptime_status_code{{{labels}}} {self.status_code}\n",
+            "".join(histogram),
+            ""
+            if self.ssl_expires is None
+            else f"http_uptime_ssl_expiry_timestamp_seconds{{{labels}}} {self.ssl_expires!r}\n",
+            f"http_uptime_last_check_timestamp_seconds{{{labels}}} {self.last_check!r}\n",
+            f"http_uptime_checks_total{{{labels}}} {self.checks}\n",
+            f"http_uptime_failures_total{{{labels}}} {self.failures}\n",
+        )
+        return self._samples
+
+
+class MetricsSnapshot:
+    """In-memory snapshot of all endpoints, rendered as OpenMetrics.
+
+    Coordinators register a series per endpoint and update it after every
+    check; a scrape only joins the rendered samples and never touches the
+    entities or the state machine.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the snapshot."""
+        self._series: dict[int, EndpointSeries] = {}
+        self.scrapes = 0
+
+    def register(self, labels: dict[str, str]) -> tuple[EndpointSeries, Callable[[], None]]:
+        """Add a series and return it with a function removing it."""
+        series = EndpointSeries(labels)
+        self._series[id(series)] = series
+
+        def _unregister() -> None:
+            self._series.pop(id(series), None)
+
+        return series, _unregister
+
+    def render(self) -> str:
+        """Return the OpenMetrics exposition of all checked endpoints."""
+        self.scrapes += 1
+        samples = [series.samples() for series in self._series.values() if series.checks]
+        lines: list[str] = []
+        for index, header in enumerate(FAMILIES):
+            lines.append(header)
+            lines.extend(family[index] for family in samples)
+        lines.append("# EOF\n")
+        return "".join(lines)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return export counters."""
+        return {"series": len(self._series), "scrapes": self.scrapes}
+
+
+def async_get_metrics(hass: HomeAssistant) -> MetricsSnapshot:
+    """Return the integration-wide metrics snapshot, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (metrics := domain_data.get(DATA_METRICS)) is None:
+        metrics = domain_data[DATA_METRICS] = MetricsSnapshot()
+    return metrics
@@ -0,0 +1,363 @@
+"""HTTP probe logic shared by the HTTP Uptime Monitor coordinators."""
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from datetime import datetime, timezone
+import logging
+import socket
+import ssl
+from time import perf_counter_ns
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from aiohttp.abc import AbstractResolver
+from aiohttp.helpers import is_ip_address
+from yarl import URL
+
+from .certs import CertificateCache
+from .content import ContentCheck
+from .const import (
+    CONF_EXPECTED_STATUS,
+    CONF_HEADERS,
+    CONF_METHOD,
+    CONF_PROBE_TYPE,
+    CONF_RESOLVE,
+    CONF_TIMEOUT,
+    CONF_URL,
+    CONF_VERIFY_SSL,
+    DEFAULT_PROBE_TYPE,
+    HEAD_FALLBACK_STATUS,
+    PROBE_BODY_LIMIT,
+    PROBE_TYPE_HEAD,
+    PROBE_TYPE_TCP,
+    PROBE_TYPE_TLS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Created at import, as loading the CA bundle blocks
+_VERIFIED_CONTEXT = ssl.create_default_context()
+_UNVERIFIED_CONTEXT = ssl.create_default_context()
+_UNVERIFIED_CONTEXT.check_hostname = False
+_UNVERIFIED_CONTEXT.verify_mode = ssl.CERT_NONE
+
+
+class ProbeTimings:
+    """Monotonic timestamps of the phases of one request, in nanoseconds.
+
+    An instance is passed as ``trace_request_ctx`` and filled in by the hooks
+    of the trace config returned by :func:`build_trace_config`. ``connect``
+    covers the TCP connect and, for HTTPS, the TLS handshake, as aiohttp
+    does not report those separately.
+    """
+
+    __slots__ = (
+        "start",
+        "dns_start",
+        "dns_end",
+        "connect_start",
+        "connect_end",
+        "headers",
+        "end",
+        "reused",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty timings."""
+        self.start = perf_counter_ns()
+        self.dns_start = self.dns_end = 0
+        self.connect_start = self.connect_end = 0
+        self.headers = self.end = 0
+        self.reused = False
+
+    @staticmethod
+    def _ms(start: int, end: int) -> float | None:
+        """Return the duration between two timestamps in milliseconds."""
+        if not start or not end:
+            return None
+        return round((end - start) / 1_000_000, 2)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the phase durations in milliseconds."""
+        # Server time starts once a connection is ready to send the request
+        ready = self.connect_end or self.dns_end or self.start
+        return {
+            "dns_time": self._ms(self.dns_start, self.dns_end),
+            "connect_time": self._ms(self.connect_start, self.connect_end),
+            "ttfb": self._ms(ready, self.headers),
+            "transfer_time": self._ms(self.headers, self.end),
+            "connection_reused": self.reused,
+        }
+
+
+def _timings(context: SimpleNamespace) -> ProbeTimings | None:
+    """Return the timings attached to a traced request, if any."""
+    timings = context.trace_request_ctx
+    return timings if isinstance(timings, ProbeTimings) else None
+
+
+async def _on_dns_start(_session, context, _params) -> None:
+    if timings := _timings(context):
+        timings.dns_start = perf_counter_ns()
+
+
+async def _on_dns_end(_session, context, _params) -> None:
+    if timings := _timings(context):
+        timings.dns_end = perf_counter_ns()
+
+
+async def _on_dns_cache_hit(_session, context, _params) -> None:
+    if timings := _timings(context):
+        timings.dns_start = timings.dns_end = perf_counter_ns()
+
+
+async def _on_connect_start(_session, context, _params) -> None:
+    if timings := _timings(context):
+        timings.connect_start = perf_counter_ns()
+
+
+async def _on_connect_end(_session, context, _params) -> None:
+    if timings := _timings(context):
+        timings.connect_end = perf_counter_ns()
+
+
+async def _on_connection_reused(_session, context, _params) -> None:
+    if timings := _timings(context):
+        timings.reused = True
+
+
+async def _on_request_end(_session, context, _params) -> None:
+    if timings := _timings(context):
+        timings.headers = perf_counter_ns()
+
+
+def build_trace_config() -> aiohttp.TraceConfig:
+    """Return a trace config recording :class:`ProbeTimings`."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(_on_dns_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_end)
+    trace_config.on_dns_cache_hit.append(_on_dns_cache_hit)
+    trace_config.on_connection_create_start.append(_on_connect_start)
+    trace_config.on_connection_create_end.append(_on_connect_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reused)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
+
+
+def status_ok(result: dict[str, Any], config: dict[str, Any]) -> bool:
+    """Return whether a result's status code is one of the expected codes.
+
+    Connection-level probes have no status code and pass once connected. A
+    ranged GET fallback answering 206 counts as 200.
+    """
+    status = result.get("status_code")
+    if status is None:
+        return True
+    expected = config[CONF_EXPECTED_STATUS]
+    return status in expected or (
+        status == 206 and result.get("ranged", False) and 200 in expected
+    )
+
+
+async def async_probe(
+    session: aiohttp.ClientSession,
+    config: dict[str, Any],
+    certificates: CertificateCache | None = None,
+    resolver: AbstractResolver | None = None,
+) -> dict[str, Any]:
+    """Probe a single endpoint with its configured probe type.
+
+    ``resolver`` is only used by connection-level probes; HTTP probes
+    resolve through the session's connector. Connection errors and timeouts
+    are propagated to the caller.
+    """
+    probe_type = config.get(CONF_PROBE_TYPE, DEFAULT_PROBE_TYPE)
+    if probe_type == PROBE_TYPE_TCP:
+        return await async_probe_connect(config, resolver=resolver)
+    if probe_type == PROBE_TYPE_TLS:
+        return await async_probe_connect(config, certificates, resolver, tls=True)
+    if probe_type == PROBE_TYPE_HEAD:
+        result = await _async_request(session, config, certificates, "HEAD")
+        if result["status_code"] in HEAD_FALLBACK_STATUS:
+            result = await _async_request(
+                session, config, certificates, "GET", {"Range": "bytes=0-0"}
+            )
+            result["ranged"] = True
+            result["is_up"] = status_ok(result, config)
+        return result
+    return await _async_request(
+        session, config, certificates, config[CONF_METHOD], check_content=True
+    )
+
+
+async def _async_request(
+    session: aiohttp.ClientSession,
+    config: dict[str, Any],
+    certificates: CertificateCache | None,
+    method: str,
+    extra_headers: dict[str, str] | None = None,
+    check_content: bool = False,
+) -> dict[str, Any]:
+    """Send one HTTP request and return its result.
+
+    With a pinned address the request goes to that address, while the Host
+    header, SNI and certificate check keep using the host name of the URL.
+    """
+    timings = ProbeTimings()
+    headers = config.get(CONF_HEADERS, {})
+    if extra_headers:
+        headers = {**headers, **extra_headers}
+
+    url = URL(config[CONF_URL])
+    target = url
+    kwargs: dict[str, Any] = {}
+    if pinned := config.get(CONF_RESOLVE):
+        target = url.with_host(pinned)
+        headers = {
+            "Host": url.host if url.is_default_port() else f"{url.host}:{url.port}",
+            **headers,
+        }
+        if url.scheme == "https":
+            kwargs["server_hostname"] = url.host
+
+    async with session.request(
+        method,
+        target,
+        headers=headers,
+        trace_request_ctx=timings,
+        **kwargs,
+    ) as response:
+        if not timings.headers:
+            timings.headers = perf_counter_ns()
+        response_time = (timings.headers - timings.start) / 1_000_000
+
+        # Certificate expiry is served from the cache, never parsed here
+        ssl_expires = None
+        if certificates is not None and response.url.scheme == "https":
+            host, port = (url if pinned else response.url).host, response.url.port
+            if response.connection and response.connection.transport:
+                ssl_object = response.connection.transport.get_extra_info("ssl_object")
+                if ssl_object is not None:
+                    certificates.observe(
+                        host, port, ssl_object.getpeercert(binary_form=True), pinned
+                    )
+            ssl_expires = certificates.get(host, port, pinned)
+
+        # Drain a bounded amount of the body so the connection can be reused,
+        # or as much as the content check needs to reach a verdict
+        check = ContentCheck.from_config(config) if check_content else None
+        limit = PROBE_BODY_LIMIT if check is None else check.limit
+        read = 0
+        async for chunk in response.content.iter_any():
+            read += len(chunk)
+            if check is not None:
+                check.feed(chunk)
+                if check.done:
+                    break
+            if read >= limit:
+                break
+        timings.end = perf_counter_ns()
+
+        content = {} if check is None else check.as_dict()
+        result = {
+            "status_code": response.status,
+            "response_time": round(response_time, 2),
+            "ssl_expires": ssl_expires,
+            "url": config[CONF_URL],
+            "bytes_read": read,
+            **content,
+            **timings.as_dict(),
+        }
+        is_up = status_ok(result, config) and content.get("content_match") is not False
+        now = datetime.now(timezone.utc)
+        result["is_up"] = is_up
+        result["last_success"] = now if is_up else None
+        result["last_failure"] = now if not is_up else None
+        return result
+
+
+def connect_target(config: dict[str, Any], tls: bool = False) -> tuple[str, int]:
+    """Return the host and port a connection-level probe connects to.
+
+    Besides HTTP(S) URLs, ``tcp://host:port`` is accepted.
+    """
+    url = URL(config[CONF_URL])
+    port = url.port or (443 if tls else None)
+    if not url.host or port is None:
+        raise ValueError(f"No host and port in {config[CONF_URL]}")
+    return url.host, port
+
+
+async def async_probe_connect(
+    config: dict[str, Any],
+    certificates: CertificateCache | None = None,
+    resolver: AbstractResolver | None = None,
+    tls: bool = False,
+) -> dict[str, Any]:
+    """Open a TCP connection, optionally complete a TLS handshake, and close it.
+
+    No request is sent, so the monitored service does no more work than
+    accepting the connection. A TLS handshake hands the peer certificate to
+    the certificate cache.
+    """
+    host, port = connect_target(config, tls)
+    start = perf_counter_ns()
+    address = config.get(CONF_RESOLVE) or host
+    dns_time = None
+    if resolver is not None and not config.get(CONF_RESOLVE) and not is_ip_address(host):
+        addresses = await asyncio.wait_for(
+            resolver.resolve(host, port, socket.AF_UNSPEC), config[CONF_TIMEOUT]
+        )
+        address = addresses[0]["host"]
+        dns_time = round((perf_counter_ns() - start) / 1_000_000, 2)
+    resolved = perf_counter_ns()
+    _, writer = await asyncio.wait_for(
+        asyncio.open_connection(address, port), config[CONF_TIMEOUT]
+    )
+    connected = perf_counter_ns()
+    handshake_time = ssl_expires = None
+    try:
+        if tls:
+            context = _ssl_context(config[CONF_VERIFY_SSL])
+            await asyncio.wait_for(
+                writer.start_tls(context, server_hostname=host),
+                max(config[CONF_TIMEOUT] - (connected - start) / 1e9, 0.001),
+            )
+            handshake_time = round((perf_counter_ns() - connected) / 1_000_000, 2)
+            if certificates is not None:
+                ssl_object = writer.get_extra_info("ssl_object")
+                if ssl_object is not None:
+                    certificates.observe(
+                        host,
+                        port,
+                        ssl_object.getpeercert(binary_form=True),
+                        config.get(CONF_RESOLVE),
+                    )
+                ssl_expires = certificates.get(host, port, config.get(CONF_RESOLVE))
+        end = perf_counter_ns()
+    finally:
+        writer.close()
+        # Wait for the transport to go away, a failed TLS shutdown is not a failed probe
+        with suppress(OSError, asyncio.TimeoutError):
+            await asyncio.wait_for(writer.wait_closed(), config[CONF_TIMEOUT])
+
+    now = datetime.now(timezone.utc)
+    return {
+        "status_code": None,
+        "response_time": round((end - start) / 1_000_000, 2),
+        "is_up": True,
+        "last_success": now,
+        "last_failure": None,
+        "ssl_expires": ssl_expires,
+        "url": config[CONF_URL],
+        "dns_time": dns_time,
+        "connect_time": round((connected - resolved) / 1_000_000, 2),
+        "handshake_time": handshake_time,
+    }
+
+
+def _ssl_context(verify_ssl: bool) -> ssl.SSLContext:
+    """Return the shared client SSL context for a verification mode."""
+    return _VERIFIED_CONTEXT if verify_ssl else _UNVERIFIED_CONTEXT
@@ -0,0 +1,134 @@
+"""Coalescing of identical probes for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from itertools import takewhile
+import time
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    COALESCE_WINDOW,
+    CONF_BODY_KEYWORD,
+    CONF_BODY_REGEX,
+    CONF_HEADERS,
+    CONF_JSON_PATH,
+    CONF_JSON_VALUE,
+    CONF_METHOD,
+    CONF_PROBE_TYPE,
+    CONF_RESOLVE,
+    CONF_TIMEOUT,
+    CONF_URL,
+    CONF_VERIFY_SSL,
+    DATA_PROBE_REGISTRY,
+    DEFAULT_PROBE_TYPE,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+def probe_key(config: dict[str, Any]) -> tuple[Hashable, ...]:
+    """Return the key under which identical probes are coalesced."""
+    return (
+        config.get(CONF_PROBE_TYPE, DEFAULT_PROBE_TYPE),
+        config[CONF_METHOD],
+        config[CONF_URL],
+        frozenset(config.get(CONF_HEADERS, {}).items()),
+        config[CONF_VERIFY_SSL],
+        config[CONF_TIMEOUT],
+        config.get(CONF_RESOLVE),
+        config.get(CONF_BODY_KEYWORD),
+        config.get(CONF_BODY_REGEX),
+        config.get(CONF_JSON_PATH),
+        config.get(CONF_JSON_VALUE),
+    )
+
+
+class ProbeRegistry:
+    """Share one request among identical probes due within the same window.
+
+    A probe joins a request that is already in flight for its key, or reuses
+    a result that completed less than ``window`` seconds ago. The request
+    runs as its own task, so a cancelled subscriber does not cancel it for
+    the others. Every subscriber gets its own copy of the result. Results
+    are dropped once they are older than the window, so keys of removed
+    endpoints do not accumulate.
+    """
+
+    def __init__(self, window: float = COALESCE_WINDOW) -> None:
+        """Initialize the registry."""
+        self._window = window
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._recent: dict[Hashable, tuple[float, dict[str, Any]]] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    async def async_probe(
+        self,
+        key: Hashable,
+        request: Callable[[], Awaitable[dict[str, Any]]],
+        max_age: float | None = None,
+    ) -> dict[str, Any]:
+        """Return the result for ``key``, issuing ``request`` only if needed.
+
+        ``max_age`` shortens the window for reusing a completed result; pass
+        0 to only join a request that is still in flight.
+        """
+        window = self._window if max_age is None else min(max_age, self._window)
+        recent = self._recent.get(key)
+        if recent is not None and time.monotonic() - recent[0] < window:
+            self.coalesced += 1
+            return dict(recent[1])
+
+        if (task := self._in_flight.get(key)) is not None:
+            self.coalesced += 1
+        else:
+            self.requests += 1
+            task = self._in_flight[key] = asyncio.get_running_loop().create_task(
+                self._async_run(key, request)
+            )
+            # Retrieve the error even if every subscriber was cancelled
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        return dict(await asyncio.shield(task))
+
+    async def _async_run(
+        self, key: Hashable, request: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Run a request and remember its result for the window."""
+        try:
+            result = await request()
+        finally:
+            del self._in_flight[key]
+        now = time.monotonic()
+        # Results are kept in completion order, so the expired ones come first
+        self._recent.pop(key, None)
+        self._recent[key] = (now, result)
+        expired = [
+            stale
+            for stale, _ in takewhile(
+                lambda item: now - item[1][0] >= self._window, self._recent.items()
+            )
+        ]
+        for stale in expired:
+            del self._recent[stale]
+        return result
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return request and coalescing counters."""
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+            "cached": len(self._recent),
+        }
+
+
+def async_get_probe_registry(hass: HomeAssistant) -> ProbeRegistry:
+    """Return the integration-wide probe registry, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (registry := domain_data.get(DATA_PROBE_REGISTRY)) is None:
+        registry = domain_data[DATA_PROBE_REGISTRY] = ProbeRegistry()
+    return registry
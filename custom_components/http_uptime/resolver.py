@@ -0,0 +1,238 @@
+"""Shared caching DNS resolver for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import time
+from typing import TYPE_CHECKING, Any
+
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import ThreadedResolver
+
+from .const import (
+    DATA_RESOLVER,
+    DNS_DEFAULT_TTL,
+    DNS_MAX_TTL,
+    DNS_MIN_TTL,
+    DNS_NEGATIVE_TTL,
+    DOMAIN,
+)
+
+try:
+    import aiodns
+except ImportError:  # TTLs fall back to DNS_DEFAULT_TTL
+    aiodns = None
+    _DNS_ERRORS: tuple[type[Exception], ...] = (OSError, ValueError)
+else:
+    _DNS_ERRORS = (OSError, ValueError, aiodns.error.DNSError)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Flags telling the connector the address needs no further resolution
+_NUMERIC_FLAGS = socket.AI_NUMERICHOST | socket.AI_NUMERICSERV
+
+# Weight of the newest lookup in the average resolution time
+RESOLVE_SMOOTHING = 0.1
+
+_QUERY_TYPES = {socket.AF_INET: ("A",), socket.AF_INET6: ("AAAA",)}
+
+
+class _DnsEntry:
+    """Cached answer for one host and address family."""
+
+    __slots__ = ("expires", "addresses", "error")
+
+    def __init__(
+        self,
+        expires: float,
+        addresses: list[tuple[str, int]],
+        error: str | None = None,
+    ) -> None:
+        self.expires = expires
+        self.addresses = addresses
+        self.error = error
+
+
+class CachingResolver(AbstractResolver):
+    """Resolve host names once for all probe sessions, honouring record TTLs.
+
+    Answers are cached for their TTL clamped to ``[min_ttl, max_ttl]``, and
+    failed lookups for ``negative_ttl``. Concurrent lookups of the same name
+    share one query. With ``aiodns`` installed the TTLs come from the DNS
+    answers; otherwise the system resolver is used and every answer is kept
+    for ``default_ttl``. Names unknown to DNS are retried with the system
+    resolver, so hosts file and mDNS names keep working.
+    """
+
+    def __init__(
+        self,
+        min_ttl: float = DNS_MIN_TTL,
+        max_ttl: float = DNS_MAX_TTL,
+        negative_ttl: float = DNS_NEGATIVE_TTL,
+        default_ttl: float = DNS_DEFAULT_TTL,
+    ) -> None:
+        """Initialize the resolver."""
+        self._min_ttl = min_ttl
+        self._max_ttl = max_ttl
+        self._negative_ttl = negative_ttl
+        self._default_ttl = default_ttl
+        self._cache: dict[tuple[str, int], _DnsEntry] = {}
+        self._pending: dict[tuple[str, int], asyncio.Task] = {}
+        self._dns: Any = None
+        self._fallback: ThreadedResolver | None = None
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.failures = 0
+        self.resolve_time_avg = 0.0
+        self.resolve_time_max = 0.0
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[dict[str, Any]]:
+        """Return the addresses of ``host`` from the cache or a new lookup."""
+        key = (host, int(family))
+        entry = self._cache.get(key)
+        if entry is not None and entry.expires > time.monotonic():
+            self.hits += 1
+            if entry.error is not None:
+                self.negative_hits += 1
+        else:
+            if (task := self._pending.get(key)) is None:
+                self.misses += 1
+                task = self._pending[key] = asyncio.get_running_loop().create_task(
+                    self._async_lookup(key)
+                )
+                # Retrieve the error even if every caller was cancelled
+                task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            entry = await asyncio.shield(task)
+
+        if entry.error is not None:
+            raise socket.gaierror(socket.EAI_NONAME, entry.error)
+        return [
+            {
+                "hostname": host,
+                "host": address,
+                "port": port,
+                "family": address_family,
+                "proto": 0,
+                "flags": _NUMERIC_FLAGS,
+            }
+            for address, address_family in entry.addresses
+        ]
+
+    async def close(self) -> None:
+        """Cancel pending lookups and drop the cache."""
+        tasks = list(self._pending.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._cache.clear()
+        if self._fallback is not None:
+            await self._fallback.close()
+            self._fallback = None
+        if self._dns is not None and hasattr(self._dns, "close"):
+            await self._dns.close()
+        self._dns = None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return cache and resolution time metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "negative_hits": self.negative_hits,
+            "failures": self.failures,
+            "hit_rate": round(self.hits / lookups * 100, 1) if lookups else None,
+            "resolve_time_avg": round(self.resolve_time_avg, 2),
+            "resolve_time_max": round(self.resolve_time_max, 2),
+            "backend": "aiodns" if aiodns is not None else "system",
+        }
+
+    async def _async_lookup(self, key: tuple[str, int]) -> _DnsEntry:
+        """Resolve a name and cache the answer or the failure."""
+        host, family = key
+        start = time.monotonic()
+        try:
+            addresses: list[tuple[str, int]] = []
+            if aiodns is not None:
+                try:
+                    addresses, ttl = await self._async_query(host, family)
+                except _DNS_ERRORS:
+                    # Not in DNS; the name may be in /etc/hosts or on mDNS
+                    pass
+            if not addresses:
+                addresses, ttl = await self._async_getaddrinfo(host, family)
+            if not addresses:
+                raise OSError(f"No addresses found for {host}")
+            entry = _DnsEntry(
+                time.monotonic() + min(max(ttl, self._min_ttl), self._max_ttl),
+                addresses,
+            )
+        except _DNS_ERRORS as err:
+            self.failures += 1
+            _LOGGER.debug("Could not resolve %s: %s", host, err)
+            entry = _DnsEntry(
+                time.monotonic() + self._negative_ttl,
+                [],
+                f"Could not resolve {host}: {err}",
+            )
+        finally:
+            del self._pending[key]
+            elapsed = (time.monotonic() - start) * 1000
+            self.resolve_time_max = max(self.resolve_time_max, elapsed)
+            self.resolve_time_avg += (elapsed - self.resolve_time_avg) * RESOLVE_SMOOTHING
+
+        self._cache[key] = entry
+        return entry
+
+    async def _async_query(
+        self, host: str, family: int
+    ) -> tuple[list[tuple[str, int]], float]:
+        """Query A and/or AAAA records, returning the addresses and lowest TTL."""
+        if self._dns is None:
+            self._dns = aiodns.DNSResolver()
+        query_types = _QUERY_TYPES.get(family, ("A", "AAAA"))
+        answers = await asyncio.gather(
+            *(self._dns.query(host, query_type) for query_type in query_types),
+            return_exceptions=True,
+        )
+
+        addresses: list[tuple[str, int]] = []
+        ttls: list[float] = []
+        errors: list[BaseException] = []
+        for query_type, answer in zip(query_types, answers):
+            if isinstance(answer, BaseException):
+                errors.append(answer)
+                continue
+            address_family = socket.AF_INET if query_type == "A" else socket.AF_INET6
+            for record in answer:
+                addresses.append((record.host, address_family))
+                ttls.append(record.ttl)
+        if not addresses and errors:
+            raise errors[0]
+        return addresses, min(ttls, default=self._default_ttl)
+
+    async def _async_getaddrinfo(
+        self, host: str, family: int
+    ) -> tuple[list[tuple[str, int]], float]:
+        """Resolve with the system resolver, which reports no TTL."""
+        if self._fallback is None:
+            self._fallback = ThreadedResolver()
+        results = await self._fallback.resolve(host, 0, socket.AddressFamily(family))
+        addresses = list(dict.fromkeys((result["host"], result["family"]) for result in results))
+        return addresses, self._default_ttl
+
+
+def async_get_resolver(hass: HomeAssistant) -> CachingResolver:
+    """Return the integration-wide DNS resolver, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (resolver := domain_data.get(DATA_RESOLVER)) is None:
+        resolver = domain_data[DATA_RESOLVER] = CachingResolver()
+    return resolver
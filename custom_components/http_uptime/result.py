@@ -0,0 +1,130 @@
+"""Compact probe result records for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+from .const import (
+    ATTR_BYTES_READ,
+    ATTR_CONNECT_TIME,
+    ATTR_CONNECTION_REUSED,
+    ATTR_CONTENT_MATCH,
+    ATTR_DNS_TIME,
+    ATTR_HANDSHAKE_TIME,
+    ATTR_MATCH_TIME,
+    ATTR_TRANSFER_TIME,
+    ATTR_TTFB,
+)
+
+# Phase timing and body values kept in ProbeResult.timings, in this order
+TIMING_FIELDS = (
+    ATTR_DNS_TIME,
+    ATTR_CONNECT_TIME,
+    ATTR_HANDSHAKE_TIME,
+    ATTR_TTFB,
+    ATTR_TRANSFER_TIME,
+    ATTR_BYTES_READ,
+    ATTR_MATCH_TIME,
+    ATTR_CONNECTION_REUSED,
+)
+
+
+def isoformat(timestamp: int | None) -> str | None:
+    """Return a timestamp in seconds since the epoch as ISO 8601 UTC time."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class ProbeResult:
+    """Latest result of an endpoint, shared by its coordinator and entities.
+
+    Probes return plain dicts, which travel between worker processes and
+    coalesced subscribers; coordinators turn each one into this record once.
+    Times are whole seconds since the epoch rather than datetime objects,
+    and the phase timings share one tuple.
+    """
+
+    __slots__ = (
+        "url",
+        "is_up",
+        "status_code",
+        "response_time",
+        "ssl_expires",
+        "content_match",
+        "timings",
+        "failure_reason",
+        "circuit",
+        "restored",
+        "last_success",
+        "last_failure",
+        "locations",
+        "effective_interval",
+    )
+
+    def __init__(
+        self,
+        url: str,
+        is_up: bool,
+        status_code: int | None = None,
+        response_time: float | None = None,
+        ssl_expires: int | None = None,
+        content_match: bool | None = None,
+        timings: tuple[Any, ...] | None = None,
+        failure_reason: str | None = None,
+        circuit: str | None = None,
+        restored: bool = False,
+    ) -> None:
+        """Initialize the result."""
+        self.url = url
+        self.is_up = is_up
+        self.status_code = status_code
+        self.response_time = response_time
+        self.ssl_expires = ssl_expires
+        self.content_match = content_match
+        self.timings = timings
+        self.failure_reason = failure_reason
+        self.circuit = circuit
+        self.restored = restored
+        self.last_success: int | None = None
+        self.last_failure: int | None = None
+        self.locations: dict[str, str] | None = None
+        self.effective_interval: float | None = None
+
+    @classmethod
+    def from_probe(cls, result: dict[str, Any], is_up: bool) -> ProbeResult:
+        """Return the record of a probe result dict."""
+        expires = result.get("ssl_expires")
+        return cls(
+            result["url"],
+            is_up,
+            result.get("status_code"),
+            result.get("response_time"),
+            None if expires is None else int(expires.timestamp()),
+            result.get(ATTR_CONTENT_MATCH),
+            tuple(map(result.get, TIMING_FIELDS)),
+        )
+
+    def phase_timings(self) -> dict[str, Any]:
+        """Return the phase timing and body attributes that were measured."""
+        if self.timings is None:
+            return {}
+        return {
+            field: value
+            for field, value in zip(TIMING_FIELDS, self.timings)
+            if value is not None
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the values that are set, with times in ISO 8601."""
+        values: dict[str, Any] = {}
+        for field in self.__slots__:
+            value = getattr(self, field)
+            if field == "timings":
+                values.update(self.phase_timings())
+            elif field in ("ssl_expires", "last_success", "last_failure"):
+                if value is not None:
+                    values[field] = isoformat(value)
+            elif value is not None and (value or field != "restored"):
+                values[field] = value
+        return values
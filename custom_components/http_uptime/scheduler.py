@@ -0,0 +1,228 @@
+"""Central probe scheduler for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+import heapq
+import logging
+from typing import TYPE_CHECKING, Any
+import zlib
+
+from .const import (
+    CONF_MAX_IN_FLIGHT,
+    DATA_CONFIG,
+    DATA_SCHEDULER,
+    DEFAULT_MAX_IN_FLIGHT,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Weight of the newest sample in the exponentially weighted lag averages
+LAG_SMOOTHING = 0.1
+
+
+class _Job:
+    """A periodically scheduled probe."""
+
+    __slots__ = ("key", "interval", "action", "due", "generation", "task")
+
+    def __init__(
+        self, key: str, interval: float, action: Callable[[], Awaitable[Any]]
+    ) -> None:
+        self.key = key
+        self.interval = interval
+        self.action = action
+        self.due = 0.0
+        self.generation = 0
+        self.task: asyncio.Task | None = None
+
+
+class ProbeScheduler:
+    """Spread probes across their interval and bound how many run at once.
+
+    Jobs live in a heap ordered by due time and a single loop timer is armed
+    for the earliest one. Every job runs at a fixed phase of its interval,
+    a deterministic jitter derived from its key and counted from the loop
+    clock, so restarting does not make all probes fire in the same second
+    and jobs sharing a jitter key stay aligned whenever they are added.
+    """
+
+    def __init__(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> None:
+        """Initialize the scheduler."""
+        self.max_in_flight = max_in_flight
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._heap: list[tuple[float, int, int, _Job]] = []
+        self._jobs: dict[str, _Job] = {}
+        self._counter = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self.in_flight = 0
+        self.dispatched = 0
+        self.overruns = 0
+        self.lag_last = 0.0
+        self.lag_max = 0.0
+        self.lag_avg = 0.0
+        self.slot_wait_avg = 0.0
+        self.slot_wait_max = 0.0
+
+    def async_add(
+        self,
+        key: str,
+        interval: float,
+        action: Callable[[], Awaitable[Any]],
+        jitter_key: str | None = None,
+        delay: float = 0.0,
+    ) -> Callable[[], None]:
+        """Schedule ``action`` every ``interval`` seconds and return a remover.
+
+        The first run is the first time in the job's phase at least ``delay``
+        seconds away; pass the interval as ``delay`` for a job whose action
+        just ran. The phase is derived from ``jitter_key`` (default ``key``);
+        jobs sharing it and the interval run at the same times.
+        """
+        self.async_remove(key)
+        job = self._jobs[key] = _Job(key, interval, action)
+        self._push(job, self._phase_due(jitter_key or key, interval, delay))
+
+        return lambda: self.async_remove(key)
+
+    def async_remove(self, key: str) -> None:
+        """Stop scheduling a job."""
+        if (job := self._jobs.pop(key, None)) is not None:
+            # Invalidate the heap entry; it is discarded when popped
+            job.generation += 1
+
+    def async_set_interval(self, key: str, interval: float, delay: float | None = None) -> None:
+        """Change a job's interval and run it next after ``delay`` seconds."""
+        if (job := self._jobs.get(key)) is None:
+            return
+        job.interval = interval
+        job.generation += 1
+        self._push(
+            job,
+            asyncio.get_running_loop().time() + (interval if delay is None else delay),
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the global in-flight probe slots."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with self._semaphore:
+            wait = loop.time() - start
+            self.slot_wait_max = max(self.slot_wait_max, wait)
+            self.slot_wait_avg += (wait - self.slot_wait_avg) * LAG_SMOOTHING
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return scheduling and concurrency metrics."""
+        return {
+            "jobs": len(self._jobs),
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "dispatched": self.dispatched,
+            "overruns": self.overruns,
+            "lag_last": round(self.lag_last, 3),
+            "lag_avg": round(self.lag_avg, 3),
+            "lag_max": round(self.lag_max, 3),
+            "slot_wait_avg": round(self.slot_wait_avg, 3),
+            "slot_wait_max": round(self.slot_wait_max, 3),
+        }
+
+    async def async_stop(self) -> None:
+        """Cancel the timer and any running probes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        tasks = [job.task for job in self._jobs.values() if job.task and not job.task.done()]
+        self._jobs.clear()
+        self._heap.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _phase_due(self, jitter_key: str, interval: float, delay: float) -> float:
+        """Return the first time in a key's phase at least ``delay`` seconds away."""
+        phase = zlib.crc32(jitter_key.encode()) / 0xFFFFFFFF * interval
+        start = asyncio.get_running_loop().time() + delay
+        return start + (phase - start) % interval
+
+    def _push(self, job: _Job, due: float) -> None:
+        """Add a job to the heap and re-arm the timer if it is now first."""
+        job.due = due
+        self._counter += 1
+        heapq.heappush(self._heap, (due, self._counter, job.generation, job))
+        if self._heap[0][3] is job:
+            self._arm()
+
+    def _arm(self) -> None:
+        """Arm the loop timer for the earliest job."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._heap:
+            self._timer = asyncio.get_running_loop().call_at(
+                self._heap[0][0], self._dispatch
+            )
+
+    def _dispatch(self) -> None:
+        """Start every job that is due."""
+        self._timer = None
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        while self._heap and self._heap[0][0] <= now:
+            due, _, generation, job = heapq.heappop(self._heap)
+            if generation != job.generation or job.key not in self._jobs:
+                continue
+
+            lag = now - due
+            self.lag_last = lag
+            self.lag_max = max(self.lag_max, lag)
+            self.lag_avg += (lag - self.lag_avg) * LAG_SMOOTHING
+
+            if job.task is None or job.task.done():
+                self.dispatched += 1
+                job.task = loop.create_task(self._run(job))
+            else:
+                self.overruns += 1
+                _LOGGER.debug("Skipping %s, previous probe still running", job.key)
+
+            # Keep the phase, but never queue up missed runs
+            next_due = due + job.interval
+            if next_due <= now:
+                next_due += ((now - next_due) // job.interval + 1) * job.interval
+            job.due = next_due
+            self._counter += 1
+            heapq.heappush(self._heap, (next_due, self._counter, job.generation, job))
+
+        self._arm()
+
+    async def _run(self, job: _Job) -> None:
+        """Run a job, logging unexpected errors."""
+        try:
+            await job.action()
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error running scheduled probe %s", job.key)
+
+
+def async_get_scheduler(hass: HomeAssistant) -> ProbeScheduler:
+    """Return the integration-wide probe scheduler, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := domain_data.get(DATA_SCHEDULER)) is None:
+        config = domain_data.get(DATA_CONFIG, {})
+        scheduler = domain_data[DATA_SCHEDULER] = ProbeScheduler(
+            config.get(CONF_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT)
+        )
+    return scheduler
@@ -1,127 +1,614 @@
 """Sensor platform for HTTP Uptime Monitor."""
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 import asyncio
+from collections.abc import Callable
+from functools import partial
+import hashlib
 import logging
-import ssl
-from datetime import datetime, timedelta
+import math
+import time
 from typing import Any
 
-import aiohttp
-
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME, CONF_URL
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_NAME,
+    CONF_URL,
+    EVENT_HOMEASSISTANT_STOP,
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfTime,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
-    UpdateFailed,
 )
-from homeassistant.util import dt as dt_util
 
+from .adaptive import AdaptiveInterval
+from .aggregate import LOCATION_LOCAL, LocationResult, async_get_location_results
+from .certs import async_get_certificate_cache
 from .const import (
+    ATTR_BYTES_READ,
+    ATTR_CIRCUIT,
+    ATTR_CONNECT_TIME,
+    ATTR_CONNECTION_REUSED,
+    ATTR_CONTENT_MATCH,
+    ATTR_DNS_TIME,
+    ATTR_EFFECTIVE_INTERVAL,
+    ATTR_FAILURE_REASON,
+    ATTR_HANDSHAKE_TIME,
     ATTR_LAST_FAILURE,
     ATTR_LAST_SUCCESS,
+    ATTR_LOCATIONS,
+    ATTR_MATCH_TIME,
     ATTR_RESPONSE_TIME,
+    ATTR_RESTORED,
     ATTR_SSL_EXPIRES,
     ATTR_STATUS_CODE,
+    ATTR_TRANSFER_TIME,
+    ATTR_TTFB,
     ATTR_URL,
-    CONF_EXPECTED_STATUS,
-    CONF_HEADERS,
-    CONF_METHOD,
+    BREAKER_CONNECT_TIMEOUT,
+    CONF_ADAPTIVE_INTERVAL,
+    CONF_ADAPTIVE_LATENCY_MS,
+    CONF_BATCH_CONCURRENCY,
+    CONF_CONFIRM_COUNT,
+    CONF_CONFIRM_INTERVAL,
+    CONF_ENDPOINTS,
+    CONF_LATENCY_SENSORS,
+    CONF_LATENCY_THRESHOLD_MS,
+    CONF_LATENCY_THRESHOLD_PCT,
+    CONF_MAX_INTERVAL,
+    CONF_QUORUM,
+    CONF_STATE_HEARTBEAT,
+    CONF_STATS_WINDOWS,
     CONF_TIMEOUT,
     CONF_UPDATE_INTERVAL,
     CONF_VERIFY_SSL,
+    DEFAULT_ADAPTIVE_INTERVAL,
+    DEFAULT_ADAPTIVE_LATENCY_MS,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_CONFIRM_COUNT,
+    DEFAULT_CONFIRM_INTERVAL,
+    DEFAULT_LATENCY_SENSORS,
+    DEFAULT_LATENCY_THRESHOLD_MS,
+    DEFAULT_LATENCY_THRESHOLD_PCT,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_QUORUM,
+    DATA_COORDINATORS,
+    DATA_ENGINE_PLATFORM,
+    DATA_ENGINE_SENSORS,
+    DEFAULT_STATE_HEARTBEAT,
+    DEFAULT_STATS_WINDOWS,
     DOMAIN,
+    EVENT_INCIDENT_CLOSED,
+    EVENT_INCIDENT_OPENED,
+    STATS_WINDOWS,
 )
+from .health import async_get_engine_monitor
+from .history import HistorySnapshot, ProbeHistory, RawRecord
+from .incidents import Incident
+from .metrics import async_get_metrics
+from .probe import async_probe, async_probe_connect, status_ok
+from .registry import async_get_probe_registry, probe_key
+from .result import ProbeResult, isoformat
+from .resolver import async_get_resolver
+from .scheduler import async_get_scheduler
+from .session import async_get_session_manager
+from .startup import async_get_startup_batch
+from .tracker import EndpointTracker
+from .worker import async_get_worker_pool
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class HTTPUptimeCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching HTTP endpoint data."""
+def endpoint_id(endpoint: dict[str, Any]) -> str:
+    """Return the identifier of an endpoint within a batch entry."""
+    return f"{endpoint[CONF_URL]}_{endpoint[CONF_NAME]}"
+
+
+def _history_key(entry_id: str, endpoint_key: str | None) -> str:
+    """Return the file name prefix of an endpoint's history."""
+    if endpoint_key is None:
+        return entry_id
+    return f"{entry_id}-{hashlib.sha1(endpoint_key.encode()).hexdigest()[:12]}"
+
+
+class _EndpointCoordinator(DataUpdateCoordinator, ABC):
+    """Bookkeeping shared by the single endpoint and batch coordinators."""
 
     def __init__(
         self,
         hass: HomeAssistant,
         config: dict[str, Any],
+        entry_id: str,
+        endpoints: dict[str | None, dict[str, Any]],
     ) -> None:
         """Initialize the coordinator."""
         self.config = config
-        self._session: aiohttp.ClientSession | None = None
-        
+        self.entry_id = entry_id
+        self.endpoints = endpoints
+        self._windows = config.get(CONF_STATS_WINDOWS, DEFAULT_STATS_WINDOWS)
+        self.trackers: dict[str | None, EndpointTracker] = {
+            key: EndpointTracker(config[CONF_UPDATE_INTERVAL], self._windows)
+            for key in endpoints
+        }
+        self.history: dict[str | None, ProbeHistory] = {
+            key: ProbeHistory(hass, _history_key(entry_id, key)) for key in endpoints
+        }
+        self._quorum = config.get(CONF_QUORUM, DEFAULT_QUORUM)
+        self._restored: dict[str | None, RawRecord | None] = dict.fromkeys(endpoints)
+        # Endpoint of every entity, by unique id, for the check_now service
+        self.unique_ids: dict[str, str | None] = {}
+        self._checks: dict[str | None, asyncio.Task[ProbeResult]] = {}
+
+        # Updates are triggered by the shared ProbeScheduler, not by a timer
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{config[CONF_NAME]}",
-            update_interval=timedelta(seconds=config[CONF_UPDATE_INTERVAL]),
+            update_interval=None,
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from the HTTP endpoint."""
-        if self._session is None:
-            timeout = aiohttp.ClientTimeout(total=self.config[CONF_TIMEOUT])
-            connector = aiohttp.TCPConnector(verify_ssl=self.config[CONF_VERIFY_SSL])
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector,
-                headers=self.config.get(CONF_HEADERS, {}),
+    async def async_restore(self) -> None:
+        """Restore last success/failure, statistics and incidents from the history files.
+
+        The history of each endpoint is replayed in the executor before any
+        entity is added, so nothing else touches the state being rebuilt.
+        """
+        since = time.time() - max(
+            (STATS_WINDOWS[window] for window in self._windows), default=0
+        )
+        await asyncio.gather(
+            *(
+                history.async_replay(since, partial(self._replay, key))
+                for key, history in self.history.items()
+            )
+        )
+
+    def _replay(self, key: str | None, snapshot: HistorySnapshot) -> None:
+        """Restore the state of an endpoint from its history snapshot, without events."""
+        self._restored[key] = snapshot.last
+        self.trackers[key].replay(snapshot)
+
+    def restored_result(self, key: str | None) -> ProbeResult | None:
+        """Return the last result recorded before the restart, if any."""
+        if (record := self._restored[key]) is None:
+            return None
+        result = ProbeResult(
+            self.endpoints[key][CONF_URL],
+            record.is_up,
+            record.status or None,
+            None if math.isnan(record.latency) else record.latency,
+            restored=True,
+        )
+        tracker = self.trackers[key]
+        result.last_success = tracker.last_success
+        result.last_failure = tracker.last_failure
+        return result
+
+    @property
+    def interval(self) -> float:
+        """Return the current interval between probes."""
+        return self.config[CONF_UPDATE_INTERVAL]
+
+    async def async_flush_history(self) -> None:
+        """Write all queued probe results to disk."""
+        await asyncio.gather(*(history.async_flush() for history in self.history.values()))
+
+    async def _async_update_data(self) -> Any:
+        """Probe the endpoints, under the sampling profiler when enabled."""
+        if (profiler := async_get_engine_monitor(self.hass).profiler) is not None:
+            return await profiler.async_run(self._async_probe_endpoints)
+        return await self._async_probe_endpoints()
+
+    @abstractmethod
+    async def _async_probe_endpoints(self) -> Any:
+        """Probe the endpoints and return the coordinator data."""
+
+    @abstractmethod
+    async def async_check_now(
+        self, keys: set[str | None]
+    ) -> dict[str | None, ProbeResult]:
+        """Probe endpoints immediately and return their results.
+
+        Probes already in flight for an endpoint are joined instead of
+        duplicated, but completed results are never reused.
+        """
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the entities, accounting the time spent to the engine."""
+        with async_get_engine_monitor(self.hass).phase("state_updates"):
+            super().async_update_listeners()
+
+    async def _async_probe(
+        self, config: dict[str, Any], max_age: float | None = None
+    ) -> ProbeResult:
+        """Probe an endpoint, sharing the request with identical probes.
+
+        The expected status codes are applied per subscriber, so entries
+        watching the same URL with different expectations still coalesce.
+        """
+
+        async def _async_request() -> dict[str, Any]:
+            if (pool := async_get_worker_pool(self.hass)) is not None:
+                async with async_get_scheduler(self.hass).slot():
+                    return await pool.async_probe(config)
+
+            session = async_get_session_manager(self.hass).get_session(
+                config[CONF_VERIFY_SSL], config[CONF_TIMEOUT]
             )
+            async with async_get_scheduler(self.hass).slot():
+                return await async_probe(
+                    session,
+                    config,
+                    async_get_certificate_cache(self.hass),
+                    async_get_resolver(self.hass),
+                )
 
-        start_time = dt_util.utcnow()
-        
+        monitor = async_get_engine_monitor(self.hass)
         try:
-            async with self._session.request(
-                self.config[CONF_METHOD],
-                self.config[CONF_URL],
-            ) as response:
-                end_time = dt_util.utcnow()
-                response_time = (end_time - start_time).total_seconds() * 1000
-                
-                # Check SSL certificate expiration if HTTPS
-                ssl_expires = None
-                if (
-                    self.config[CONF_URL].startswith("https://")
-                    and self.config[CONF_VERIFY_SSL]
-                    and response.connection
-                ):
-                    try:
-                        transport = response.connection.transport
-                        if hasattr(transport, "get_extra_info"):
-                            ssl_object = transport.get_extra_info("ssl_object")
-                            if ssl_object:
-                                cert = ssl_object.getpeercert()
-                                if cert:
-                                    ssl_expires = datetime.strptime(
-                                        cert["notAfter"], "%b %d %H:%M:%S %Y %Z"
-                                    )
-                    except Exception as err:
-                        _LOGGER.debug("Could not get SSL info: %s", err)
-
-                is_up = response.status in self.config[CONF_EXPECTED_STATUS]
-                
-                return {
-                    "status_code": response.status,
-                    "response_time": round(response_time, 2),
-                    "is_up": is_up,
-                    "last_success": dt_util.utcnow() if is_up else None,
-                    "last_failure": dt_util.utcnow() if not is_up else None,
-                    "ssl_expires": ssl_expires,
-                    "url": self.config[CONF_URL],
-                }
-                
+            result = await async_get_probe_registry(self.hass).async_probe(
+                probe_key(config), _async_request, max_age
+            )
+        finally:
+            monitor.record_probe()
+        if (match_time := result.get(ATTR_MATCH_TIME)) is not None:
+            monitor.add_phase_time("content_match", match_time / 1000)
+        return ProbeResult.from_probe(
+            result,
+            status_ok(result, config) and result.get("content_match") is not False,
+        )
+
+    async def _async_guarded_probe(
+        self, key: str | None, config: dict[str, Any], max_age: float | None = None
+    ) -> ProbeResult:
+        """Probe an endpoint through its circuit breaker.
+
+        A probe that got no response is reported as a down result with the
+        reason. While the circuit is open, a quick connection attempt must
+        succeed before the full probe is sent.
+        """
+        breaker = self.trackers[key].breaker
+        try:
+            if breaker.is_open:
+                async with async_get_scheduler(self.hass).slot():
+                    await async_probe_connect(
+                        {
+                            **config,
+                            CONF_TIMEOUT: min(config[CONF_TIMEOUT], BREAKER_CONNECT_TIMEOUT),
+                        },
+                        resolver=async_get_resolver(self.hass),
+                    )
+            result = await self._async_probe(config, max_age)
         except asyncio.TimeoutError as err:
-            raise UpdateFailed(f"Timeout connecting to {self.config[CONF_URL]}") from err
-        except Exception as err:
-            raise UpdateFailed(f"Error connecting to {self.config[CONF_URL]}: {err}") from err
+            error: Exception = err
+            reason = f"Timeout connecting to {config[CONF_URL]}"
+        except Exception as err:  # pylint: disable=broad-except
+            error = err
+            reason = f"Error connecting to {config[CONF_URL]}: {err}"
+        else:
+            breaker.record_success()
+            return result
+
+        _LOGGER.debug("%s", reason, exc_info=error)
+        breaker.record_failure(reason)
+        return ProbeResult(
+            config[CONF_URL], False, failure_reason=reason, circuit=breaker.state
+        )
+
+    async def _async_check(
+        self, key: str | None, max_age: float | None = None
+    ) -> ProbeResult:
+        """Probe and record an endpoint, joining a check of it already in flight.
+
+        A scheduled update and a check_now call that overlap on an endpoint
+        share one probe, which is recorded once.
+        """
+
+        async def _async_run() -> ProbeResult:
+            try:
+                return await self._async_run_check(key, max_age)
+            finally:
+                # Before the task is done, so later calls never join a finished check
+                self._checks.pop(key, None)
+
+        if (task := self._checks.get(key)) is None or task.done():
+            task = self._checks[key] = asyncio.get_running_loop().create_task(
+                _async_run()
+            )
+        return await asyncio.shield(task)
+
+    async def _async_run_check(self, key: str | None, max_age: float | None) -> ProbeResult:
+        """Probe an endpoint and record the result under the location quorum."""
+        result = await self._async_probe_endpoint(key, max_age)
+        self._merge_locations(key, result)
+        self._record(key, result)
+        return result
+
+    async def _async_probe_endpoint(
+        self, key: str | None, max_age: float | None = None
+    ) -> ProbeResult:
+        """Probe one endpoint."""
+        return await self._async_guarded_probe(key, self.endpoints[key], max_age)
+
+    def agent_key(self, key: str | None) -> str:
+        """Return the key under which agents probe an endpoint."""
+        return self.entry_id if key is None else f"{self.entry_id}/{key}"
+
+    def async_offer_to_agents(self) -> Callable[[], None]:
+        """Let probe agents fetch the endpoints and return a withdrawing function."""
+        locations = async_get_location_results(self.hass)
+        removers = [
+            locations.register(self.agent_key(key), dict(config))
+            for key, config in self.endpoints.items()
+        ]
+
+        def _withdraw() -> None:
+            for remove in removers:
+                remove()
+
+        return _withdraw
+
+    def async_export_metrics(self) -> Callable[[], None]:
+        """Add the endpoints to the metrics export and return a removing function."""
+        metrics = async_get_metrics(self.hass)
+        removers = []
+        for key, config in self.endpoints.items():
+            self.trackers[key].series, remove = metrics.register(
+                {
+                    "entry_id": self.entry_id,
+                    "entry": self.config[CONF_NAME],
+                    "endpoint": config[CONF_NAME],
+                    "url": config[CONF_URL],
+                }
+            )
+            removers.append(remove)
+
+        def _remove() -> None:
+            for tracker in self.trackers.values():
+                tracker.series = None
+            for remove in removers:
+                remove()
+
+        return _remove
+
+    def _merge_locations(self, key: str | None, result: ProbeResult) -> bool:
+        """Replace the local up/down state by the quorum of all locations.
+
+        Return whether other locations reported fresh results, so that the
+        quorum decided the state.
+        """
+        locations = async_get_location_results(self.hass)
+        agent_key = self.agent_key(key)
+        locations.update(
+            agent_key,
+            LOCATION_LOCAL,
+            LocationResult(
+                time.time(), result.is_up, result.status_code, result.response_time
+            ),
+        )
+        is_up, fresh = locations.verdict(agent_key, self.interval, self._quorum)
+        if len(fresh) <= 1:
+            return False
+        result.is_up = bool(is_up)
+        result.locations = {
+            location: "up" if location_result.is_up else "down"
+            for location, location_result in sorted(fresh.items())
+        }
+        return True
+
+    def _record(self, key: str | None, result: ProbeResult) -> None:
+        """Record a probe result."""
+        with async_get_engine_monitor(self.hass).phase("bookkeeping"):
+            self._record_result(key, result)
+
+    def _record_result(self, key: str | None, result: ProbeResult) -> None:
+        """Update the tracker and history, firing the event of a changed incident."""
+        now = time.time()
+        self.history[key].add(now, result.response_time, result.status_code, result.is_up)
+        if (incident := self.trackers[key].record(result, now)) is not None:
+            self._fire_incident(key, incident)
+
+    def _fire_incident(self, key: str | None, incident: Incident) -> None:
+        """Fire the event of an incident that opened or closed."""
+        endpoint = self.endpoints[key]
+        self.hass.bus.async_fire(
+            EVENT_INCIDENT_CLOSED if incident.end is not None else EVENT_INCIDENT_OPENED,
+            {
+                "entry_id": self.entry_id,
+                "entity_id": er.async_get(self.hass).async_get_entity_id(
+                    "sensor", DOMAIN, _endpoint_unique_id(self.entry_id, key)
+                ),
+                "name": endpoint[CONF_NAME],
+                "url": endpoint[CONF_URL],
+                **incident.as_dict(time.time()),
+            },
+        )
+
+
+class HTTPUptimeCoordinator(_EndpointCoordinator):
+    """Class to manage fetching HTTP endpoint data."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: dict[str, Any],
+        entry_id: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, config, entry_id, {None: config})
+        self.adaptive: AdaptiveInterval | None = None
+        if config.get(CONF_ADAPTIVE_INTERVAL, DEFAULT_ADAPTIVE_INTERVAL):
+            self.adaptive = AdaptiveInterval(
+                config[CONF_UPDATE_INTERVAL],
+                config.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL),
+                config.get(CONF_CONFIRM_COUNT, DEFAULT_CONFIRM_COUNT),
+                config.get(CONF_CONFIRM_INTERVAL, DEFAULT_CONFIRM_INTERVAL),
+                config.get(CONF_ADAPTIVE_LATENCY_MS, DEFAULT_ADAPTIVE_LATENCY_MS),
+            )
+
+    @property
+    def interval(self) -> float:
+        """Return the current interval between probes."""
+        if (breaker := self.trackers[None].breaker).is_open:
+            return breaker.interval
+        if self.adaptive is not None:
+            return self.adaptive.interval
+        return super().interval
+
+    async def _async_probe_endpoints(self, max_age: float | None = None) -> ProbeResult:
+        """Fetch data from the HTTP endpoint."""
+        # Confirmation re-probes must not be answered from a coalesced result
+        if self.adaptive and self.adaptive.confirming:
+            max_age = 0
+        return await self._async_check(None, max_age)
+
+    async def async_check_now(
+        self, keys: set[str | None]
+    ) -> dict[str | None, ProbeResult]:
+        """Probe the endpoint immediately and return its result."""
+        result = await self._async_check(None, 0)
+        self.async_set_updated_data(result)
+        return {None: result}
+
+    @callback
+    def async_set_restored(self) -> None:
+        """Show the last known result until the first probe completes."""
+        if (result := self.restored_result(None)) is not None:
+            self.async_set_updated_data(result)
+
+    async def _async_run_check(self, key: str | None, max_age: float | None) -> ProbeResult:
+        """Probe and record the endpoint, then adapt the interval to the result."""
+        previous = self.interval
+        result = await super()._async_run_check(key, max_age)
+        self._adapt(result, previous)
+        return result
+
+    def _adapt(self, result: ProbeResult, previous: float) -> None:
+        """Reschedule the next probe in adaptive mode or behind an open circuit."""
+        if self.adaptive is not None:
+            self.adaptive.update(result.is_up, result.response_time)
+        interval = self.interval
+        if interval != previous:
+            async_get_scheduler(self.hass).async_set_interval(self.entry_id, interval)
+        if self.adaptive is not None or self.trackers[None].breaker.is_open:
+            result.effective_interval = round(interval, 1)
+
+
+class HTTPUptimeBatchCoordinator(_EndpointCoordinator):
+    """Class to probe all endpoints of a batch entry in a single update."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: dict[str, Any],
+        entry_id: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        shared = {k: v for k, v in config.items() if k != CONF_ENDPOINTS}
+        super().__init__(
+            hass,
+            config,
+            entry_id,
+            {
+                endpoint_id(endpoint): {**shared, **endpoint}
+                for endpoint in config[CONF_ENDPOINTS]
+            },
+        )
+        self._semaphore = asyncio.Semaphore(
+            config.get(CONF_BATCH_CONCURRENCY, DEFAULT_BATCH_CONCURRENCY)
+        )
+
+    async def _async_probe_endpoints(
+        self, keys: list[str] | None = None, max_age: float | None = None
+    ) -> dict[str, ProbeResult]:
+        """Probe every endpoint, or only ``keys``, concurrently and collect the results.
+
+        Without ``keys``, endpoints behind an open circuit are skipped until
+        their retry is due and keep their last result.
+        """
+        data: dict[str, ProbeResult] = {}
+        if keys is None:
+            # Retries due before the next update are run in this one
+            now = time.monotonic() + self.interval / 2
+            keys = [key for key, tracker in self.trackers.items() if tracker.breaker.due(now)]
+            data.update(self.data or {})
+        results = await asyncio.gather(*(self._async_check(key, max_age) for key in keys))
+        data.update(zip(keys, results))
+        return data
+
+    async def async_check_now(
+        self, keys: set[str | None]
+    ) -> dict[str | None, ProbeResult]:
+        """Probe the given endpoints immediately and return their results."""
+        results = await self._async_probe_endpoints(
+            [key for key in self.endpoints if key in keys], max_age=0
+        )
+        self.async_set_updated_data({**(self.data or {}), **results})
+        return dict(results)
+
+    @callback
+    def async_set_restored(self) -> None:
+        """Show the last known results until the first probes complete."""
+        restored = {
+            key: result
+            for key in self.endpoints
+            if (result := self.restored_result(key)) is not None
+        }
+        if restored:
+            self.async_set_updated_data(restored)
 
-    async def async_close(self) -> None:
-        """Close the aiohttp session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+    async def _async_probe_endpoint(
+        self, key: str | None, max_age: float | None = None
+    ) -> ProbeResult:
+        """Probe one endpoint within the batch concurrency limit."""
+        async with self._semaphore:
+            return await super()._async_probe_endpoint(key, max_age)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the platform of the probe engine sensors, which belong to no entry."""
+    if discovery_info is None:
+        return
+    hass.data.setdefault(DOMAIN, {})[DATA_ENGINE_PLATFORM] = async_add_entities
+    _async_add_engine_sensors(hass)
+
+
+@callback
+def _async_add_engine_sensors(hass: HomeAssistant) -> None:
+    """Add the engine sensors once the platform is set up and an entry runs.
+
+    They are removed again with the shared engine when the last entry is
+    unloaded.
+    """
+    domain_data = hass.data[DOMAIN]
+    if (
+        (async_add_entities := domain_data.get(DATA_ENGINE_PLATFORM)) is None
+        or DATA_ENGINE_SENSORS in domain_data
+        or not domain_data.get(DATA_COORDINATORS)
+    ):
+        return
+    sensors = domain_data[DATA_ENGINE_SENSORS] = [
+        HTTPUptimeEngineSensor(*description) for description in ENGINE_SENSORS
+    ]
+    async_add_entities(sensors)
 
 
 async def async_setup_entry(
@@ -130,70 +617,533 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the HTTP Uptime Monitor sensors."""
-    coordinator = HTTPUptimeCoordinator(hass, config_entry.data)
-    
-    await coordinator.async_config_entry_first_refresh()
-    
-    async_add_entities([HTTPUptimeSensor(coordinator, config_entry)], True)
+    setup_start = time.monotonic()
+    coordinator: HTTPUptimeCoordinator | HTTPUptimeBatchCoordinator
+    if CONF_ENDPOINTS in config_entry.data:
+        coordinator = HTTPUptimeBatchCoordinator(
+            hass, config_entry.data, config_entry.entry_id
+        )
+    else:
+        coordinator = HTTPUptimeCoordinator(
+            hass, config_entry.data, config_entry.entry_id
+        )
+
+    entities: list[SensorEntity] = []
+    for key, tracker in coordinator.trackers.items():
+        endpoint_entities: list[SensorEntity] = [
+            HTTPUptimeSensor(coordinator, config_entry, key)
+        ]
+        if config_entry.data.get(CONF_LATENCY_SENSORS, DEFAULT_LATENCY_SENSORS):
+            endpoint_entities.append(
+                HTTPUptimeLatencySensor(coordinator, config_entry, key)
+            )
+        endpoint_entities.extend(
+            HTTPUptimeStatisticsSensor(coordinator, config_entry, window, key)
+            for window in tracker.statistics.windows
+        )
+        endpoint_entities.extend(
+            HTTPUptimeIncidentSensor(coordinator, config_entry, window, key)
+            for window in tracker.statistics.windows
+        )
+        for entity in endpoint_entities:
+            coordinator.unique_ids[entity.unique_id] = key
+        entities.extend(endpoint_entities)
 
+    config_entry.async_on_unload(coordinator.async_export_metrics())
+    await coordinator.async_restore()
 
-class HTTPUptimeSensor(CoordinatorEntity, SensorEntity):
+    coordinators = hass.data[DOMAIN].setdefault(DATA_COORDINATORS, {})
+    coordinators[config_entry.entry_id] = coordinator
+    config_entry.async_on_unload(
+        lambda: coordinators.pop(config_entry.entry_id, None)
+    )
+    _async_add_engine_sensors(hass)
+    scheduler = async_get_scheduler(hass)
+    config_entry.async_on_unload(lambda: scheduler.async_remove(config_entry.entry_id))
+
+    @callback
+    def _async_schedule() -> None:
+        """Schedule the probes in the phase of the URL, an interval after the first."""
+        # The entry may have been unloaded while its deferred first probe ran
+        if coordinators.get(config_entry.entry_id) is not coordinator:
+            return
+        scheduler.async_add(
+            config_entry.entry_id,
+            coordinator.interval,
+            coordinator.async_refresh,
+            # Entries watching the same URL share a phase, so their probes coalesce
+            jitter_key=config_entry.data.get(CONF_URL),
+            delay=coordinator.interval,
+        )
+
+    async def _async_first_refresh() -> None:
+        await coordinator.async_refresh()
+        _async_schedule()
+
+    startup = async_get_startup_batch(hass)
+    if startup.deferred:
+        # Start from the last known state and probe in the background
+        coordinator.async_set_restored()
+        config_entry.async_on_unload(
+            startup.async_add(config_entry.entry_id, _async_first_refresh)
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+        _async_schedule()
+
+    async def _async_flush_history(_event: Event) -> None:
+        await coordinator.async_flush_history()
+
+    config_entry.async_on_unload(coordinator.async_flush_history)
+    config_entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_history)
+    )
+    config_entry.async_on_unload(coordinator.async_offer_to_agents())
+
+    async_add_entities(entities)
+    startup.record_setup(time.monotonic() - setup_start)
+
+
+def _endpoint_name(
+    coordinator: HTTPUptimeCoordinator | HTTPUptimeBatchCoordinator,
+    config_entry: ConfigEntry,
+    endpoint_key: str | None,
+) -> str:
+    """Return the display name of an endpoint."""
+    if endpoint_key is None:
+        return config_entry.data[CONF_NAME]
+    return coordinator.endpoints[endpoint_key][CONF_NAME]
+
+
+def _endpoint_unique_id(entry_id: str, endpoint_key: str | None) -> str:
+    """Return the unique id of an endpoint's status sensor."""
+    if endpoint_key is None:
+        return f"{DOMAIN}_{entry_id}"
+    return f"{DOMAIN}_{entry_id}_{endpoint_key}"
+
+
+class _ThrottledWriteMixin:
+    """Only write state on significant changes or once a heartbeat is due."""
+
+    _heartbeat: int = DEFAULT_STATE_HEARTBEAT
+    _written_at: float = -math.inf
+
+    def _async_write_if(self, significant: bool) -> bool:
+        """Write the state if it changed significantly or the heartbeat is due."""
+        now = time.monotonic()
+        if significant or not self._heartbeat or now - self._written_at >= self._heartbeat:
+            self._written_at = now
+            self.async_write_ha_state()
+            return True
+        return False
+
+
+class HTTPUptimeSensor(_ThrottledWriteMixin, CoordinatorEntity, SensorEntity):
     """Representation of an HTTP Uptime Monitor sensor."""
 
     def __init__(
         self,
-        coordinator: HTTPUptimeCoordinator,
+        coordinator: HTTPUptimeCoordinator | HTTPUptimeBatchCoordinator,
         config_entry: ConfigEntry,
+        endpoint_key: str | None = None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
-        self._attr_name = config_entry.data[CONF_NAME]
-        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}"
+        self._endpoint_key = endpoint_key
+        self._attr_name = _endpoint_name(coordinator, config_entry, endpoint_key)
+        self._attr_unique_id = _endpoint_unique_id(config_entry.entry_id, endpoint_key)
         self._attr_device_class = SensorDeviceClass.ENUM
         self._attr_options = ["up", "down"]
 
+        data = config_entry.data
+        self._heartbeat = data.get(CONF_STATE_HEARTBEAT, DEFAULT_STATE_HEARTBEAT)
+        self._threshold_ms = data.get(
+            CONF_LATENCY_THRESHOLD_MS, DEFAULT_LATENCY_THRESHOLD_MS
+        )
+        self._threshold_pct = data.get(
+            CONF_LATENCY_THRESHOLD_PCT, DEFAULT_LATENCY_THRESHOLD_PCT
+        )
+        self._latency_sensors = data.get(CONF_LATENCY_SENSORS, DEFAULT_LATENCY_SENSORS)
+        self._written_state: tuple | None = None
+        self._written_latency: float | None = None
+        self._attributes: dict[str, Any] | None = None
+        self._attributes_of: ProbeResult | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state when it changed significantly."""
+        state: tuple = (self.available,)
+        latency = None
+        if (data := self._data) is not None:
+            state = (
+                self.available,
+                data.is_up,
+                data.status_code,
+                data.content_match,
+                data.ssl_expires,
+                data.effective_interval,
+                data.locations,
+                data.restored,
+                data.circuit,
+            )
+            if not self._latency_sensors:
+                latency = data.response_time
+
+        if self._async_write_if(
+            state != self._written_state or self._latency_changed(latency)
+        ):
+            self._written_state = state
+            self._written_latency = latency
+
+    def _latency_changed(self, latency: float | None) -> bool:
+        """Return whether the response time moved past both thresholds."""
+        previous = self._written_latency
+        if latency is None or previous is None:
+            return latency != previous
+        delta = abs(latency - previous)
+        return (
+            delta >= self._threshold_ms
+            and delta * 100 >= self._threshold_pct * previous
+        )
+
+    @property
+    def _data(self) -> ProbeResult | None:
+        """Return the latest result for this sensor's endpoint."""
+        data = self.coordinator.data
+        if data is None or self._endpoint_key is None:
+            return data
+        return data.get(self._endpoint_key)
+
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
+        if self._data is None:
             return None
-        return "up" if self.coordinator.data.get("is_up") else "down"
+        return "up" if self._data.is_up else "down"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return the state attributes."""
-        if self.coordinator.data is None:
+        """Return the state attributes, built once per probe result."""
+        if (data := self._data) is None:
             return None
-            
-        data = self.coordinator.data
+        if data is not self._attributes_of:
+            self._attributes = self._build_attributes(data)
+            self._attributes_of = data
+        return self._attributes
+
+    def _build_attributes(self, data: ProbeResult) -> dict[str, Any]:
+        """Return the state attributes of a probe result."""
         attributes = {
-            ATTR_STATUS_CODE: data.get("status_code"),
-            ATTR_RESPONSE_TIME: data.get("response_time"),
-            ATTR_URL: data.get("url"),
+            ATTR_STATUS_CODE: data.status_code,
+            ATTR_URL: data.url,
         }
-        
-        if data.get("last_success"):
-            attributes[ATTR_LAST_SUCCESS] = data["last_success"].isoformat()
-        if data.get("last_failure"):
-            attributes[ATTR_LAST_FAILURE] = data["last_failure"].isoformat()
-        if data.get("ssl_expires"):
-            attributes[ATTR_SSL_EXPIRES] = data["ssl_expires"].isoformat()
-            
+        if data.content_match is not None:
+            attributes[ATTR_CONTENT_MATCH] = data.content_match
+        if data.failure_reason is not None:
+            attributes[ATTR_FAILURE_REASON] = data.failure_reason
+            attributes[ATTR_CIRCUIT] = data.circuit
+
+        # Volatile timings move to the latency sensor when it is enabled
+        if not self._latency_sensors:
+            attributes[ATTR_RESPONSE_TIME] = data.response_time
+            attributes.update(data.phase_timings())
+
+        if data.last_success:
+            attributes[ATTR_LAST_SUCCESS] = isoformat(data.last_success)
+        if data.last_failure:
+            attributes[ATTR_LAST_FAILURE] = isoformat(data.last_failure)
+        if data.ssl_expires:
+            attributes[ATTR_SSL_EXPIRES] = isoformat(data.ssl_expires)
+        if data.locations is not None:
+            attributes[ATTR_LOCATIONS] = data.locations
+        if data.effective_interval is not None:
+            attributes[ATTR_EFFECTIVE_INTERVAL] = data.effective_interval
+        if data.restored:
+            attributes[ATTR_RESTORED] = True
+
         return attributes
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        if not self.coordinator.last_update_success:
+            return False
+        return self._data is not None
 
     @property
     def icon(self) -> str:
         """Return the icon of the sensor."""
-        if self.coordinator.data is None:
+        if self._data is None:
             return "mdi:help-circle"
-        return "mdi:check-circle" if self.coordinator.data.get("is_up") else "mdi:close-circle"
+        return "mdi:check-circle" if self._data.is_up else "mdi:close-circle"
+
+
+class HTTPUptimeLatencySensor(CoordinatorEntity, SensorEntity):
+    """Response time of an endpoint, kept out of the status sensor.
+
+    This sensor changes on every probe; exclude it from the recorder if its
+    history is not needed. The phase timings are never recorded.
+    """
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-outline"
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_DNS_TIME,
+            ATTR_CONNECT_TIME,
+            ATTR_HANDSHAKE_TIME,
+            ATTR_TTFB,
+            ATTR_TRANSFER_TIME,
+            ATTR_CONNECTION_REUSED,
+            ATTR_BYTES_READ,
+            ATTR_MATCH_TIME,
+        }
+    )
+
+    def __init__(
+        self,
+        coordinator: HTTPUptimeCoordinator | HTTPUptimeBatchCoordinator,
+        config_entry: ConfigEntry,
+        endpoint_key: str | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._endpoint_key = endpoint_key
+        name = _endpoint_name(coordinator, config_entry, endpoint_key)
+        self._attr_name = f"{name} Response Time"
+        self._attr_unique_id = (
+            f"{_endpoint_unique_id(config_entry.entry_id, endpoint_key)}_response_time"
+        )
+        self._attributes: dict[str, Any] = {}
+        self._attributes_of: ProbeResult | None = None
+
+    @property
+    def _data(self) -> ProbeResult | None:
+        """Return the latest result for this sensor's endpoint."""
+        data = self.coordinator.data
+        if data is None or self._endpoint_key is None:
+            return data
+        return data.get(self._endpoint_key)
+
+    @property
+    def available(self) -> bool:
+        """Return if the last probe got a response."""
+        return (
+            self.coordinator.last_update_success
+            and self._data is not None
+            and self._data.response_time is not None
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the response time."""
+        return None if self._data is None else self._data.response_time
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the per-phase timings, built once per probe result."""
+        if (data := self._data) is None:
+            return {}
+        if data is not self._attributes_of:
+            self._attributes = data.phase_timings()
+            self._attributes_of = data
+        return self._attributes
+
+
+class HTTPUptimeStatisticsSensor(
+    _ThrottledWriteMixin, CoordinatorEntity, SensorEntity
+):
+    """Uptime percentage and latency percentiles over a rolling window."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:chart-line"
+
+    def __init__(
+        self,
+        coordinator: HTTPUptimeCoordinator | HTTPUptimeBatchCoordinator,
+        config_entry: ConfigEntry,
+        window: str,
+        endpoint_key: str | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._window = coordinator.trackers[endpoint_key].statistics.windows[window]
+        self._heartbeat = config_entry.data.get(
+            CONF_STATE_HEARTBEAT, DEFAULT_STATE_HEARTBEAT
+        )
+        self._written_value: float | None = None
+        name = _endpoint_name(coordinator, config_entry, endpoint_key)
+        self._attr_name = f"{name} Uptime {window}"
+        self._attr_unique_id = (
+            f"{_endpoint_unique_id(config_entry.entry_id, endpoint_key)}_uptime_{window}"
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state when the uptime percentage changed."""
+        value = self.native_value
+        if self._async_write_if(value != self._written_value):
+            self._written_value = value
+
+    @property
+    def available(self) -> bool:
+        """Return True, failed probes are part of the statistics."""
+        return True
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the uptime percentage."""
+        if (uptime := self._window.uptime) is None:
+            return None
+        return round(uptime, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the latency statistics of the window."""
+        attributes = self._window.as_dict()
+        del attributes["uptime"]
+        return attributes
+
+
+class HTTPUptimeIncidentSensor(_ThrottledWriteMixin, CoordinatorEntity, SensorEntity):
+    """Outages of an endpoint and their MTTR and MTBF over a rolling window."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:alert-octagon-outline"
+
+    def __init__(
+        self,
+        coordinator: HTTPUptimeCoordinator | HTTPUptimeBatchCoordinator,
+        config_entry: ConfigEntry,
+        window: str,
+        endpoint_key: str | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._incidents = coordinator.trackers[endpoint_key].incidents
+        self._window = window
+        self._heartbeat = config_entry.data.get(
+            CONF_STATE_HEARTBEAT, DEFAULT_STATE_HEARTBEAT
+        )
+        self._stats = self._incidents.stats(window, time.time())
+        self._written: tuple[int, float | None] | None = None
+        name = _endpoint_name(coordinator, config_entry, endpoint_key)
+        self._attr_name = f"{name} Outages {window}"
+        self._attr_unique_id = (
+            f"{_endpoint_unique_id(config_entry.entry_id, endpoint_key)}_outages_{window}"
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state when the outage count or MTTR changed."""
+        self._stats = self._incidents.stats(self._window, time.time())
+        written = (self._stats["outages"], self._stats["mttr"])
+        if self._async_write_if(written != self._written):
+            self._written = written
+
+    @property
+    def available(self) -> bool:
+        """Return True, outages are counted while the endpoint is down."""
+        return True
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of outages in the window."""
+        return self._stats["outages"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the MTTR, MTBF, downtime and latest incident."""
+        attributes = dict(self._stats)
+        del attributes["outages"]
+        incidents = self._incidents.incidents
+        attributes["last_incident"] = (
+            incidents[-1].as_dict(time.time()) if incidents else None
+        )
+        return attributes
+
+
+# Key, name, unit and value of the probe engine health sensors
+ENGINE_SENSORS: tuple[
+    tuple[str, str, str | None, Callable[[HomeAssistant], float | int]], ...
+] = (
+    (
+        "probe_rate",
+        "Probe Rate",
+        "probes/s",
+        lambda hass: round(async_get_engine_monitor(hass).probe_rate, 2),
+    ),
+    (
+        "in_flight",
+        "Probes In Flight",
+        None,
+        lambda hass: async_get_scheduler(hass).in_flight,
+    ),
+    (
+        "scheduling_lag",
+        "Scheduling Lag",
+        UnitOfTime.MILLISECONDS,
+        lambda hass: round(async_get_scheduler(hass).lag_avg * 1000, 1),
+    ),
+    (
+        "loop_lag",
+        "Event Loop Lag",
+        UnitOfTime.MILLISECONDS,
+        lambda hass: round(async_get_engine_monitor(hass).loop_lag_avg * 1000, 1),
+    ),
+    (
+        "loop_blocked",
+        "Event Loop Blocked Time",
+        UnitOfTime.SECONDS,
+        lambda hass: round(async_get_engine_monitor(hass).loop_blocked, 2),
+    ),
+    (
+        "pool_in_use",
+        "Pooled Connections In Use",
+        None,
+        lambda hass: async_get_session_manager(hass).stats["connections_in_use"],
+    ),
+    (
+        "cpu",
+        "Probe Engine CPU",
+        PERCENTAGE,
+        lambda hass: round(async_get_engine_monitor(hass).cpu_percent, 1),
+    ),
+)
+
+
+class HTTPUptimeEngineSensor(SensorEntity):
+    """Health metric of the probe engine shared by all entries.
+
+    These sensors tell an overloaded monitor apart from slow endpoints; they
+    are disabled by default and polled. They belong to the integration
+    rather than an entry, and exist while any entry runs the engine.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:heart-pulse"
+
+    def __init__(
+        self,
+        key: str,
+        name: str,
+        unit: str | None,
+        value: Callable[[HomeAssistant], float | int],
+    ) -> None:
+        """Initialize the sensor."""
+        self._value = value
+        self._attr_name = f"HTTP Uptime {name}"
+        self._attr_unique_id = f"{DOMAIN}_engine_{key}"
+        self._attr_native_unit_of_measurement = unit
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Clean up when entity is removed."""
-        await self.coordinator.async_close()
+    async def async_update(self) -> None:
+        """Read the current value."""
+        self._attr_native_value = self._value(self.hass)
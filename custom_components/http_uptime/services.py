@@ -0,0 +1,216 @@
+"""Services of HTTP Uptime Monitor."""
+from __future__ import annotations
+
+import asyncio
+import csv
+import os
+from typing import Any
+
+import voluptuous as vol
+import yaml
+
+from homeassistant.const import ATTR_ENTITY_ID, CONF_NAME, CONF_URL, ENTITY_MATCH_ALL
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .config_flow import METHODS
+from .const import (
+    ATTR_BATCH_NAME,
+    ATTR_CONCURRENCY,
+    ATTR_FILE,
+    ATTR_VALIDATE,
+    ATTR_VALIDATION_TIMEOUT,
+    CONF_BATCH_CONCURRENCY,
+    CONF_ENDPOINTS,
+    CONF_EXPECTED_STATUS,
+    CONF_HEADERS,
+    CONF_METHOD,
+    CONF_PROBE_TYPE,
+    CONF_TIMEOUT,
+    CONF_UPDATE_INTERVAL,
+    CONF_VERIFY_SSL,
+    DATA_COORDINATORS,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_METHOD,
+    DEFAULT_PROBE_TYPE,
+    DEFAULT_TIMEOUT,
+    DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_VERIFY_SSL,
+    DOMAIN,
+    IMPORT_CONCURRENCY,
+    IMPORT_TIMEOUT,
+    PROBE_TYPES,
+    SERVICE_CHECK_NOW,
+    SERVICE_IMPORT_ENDPOINTS,
+)
+from .importer import async_import_endpoints, load_endpoints
+
+# Settings applied to imported endpoints that do not set them
+IMPORT_DEFAULTS = [
+    CONF_PROBE_TYPE,
+    CONF_METHOD,
+    CONF_TIMEOUT,
+    CONF_UPDATE_INTERVAL,
+    CONF_VERIFY_SSL,
+    CONF_EXPECTED_STATUS,
+    CONF_HEADERS,
+    CONF_BATCH_CONCURRENCY,
+]
+
+IMPORT_ENDPOINTS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive(CONF_ENDPOINTS, "source"): vol.All(
+                cv.ensure_list, [vol.Any(dict, cv.string)]
+            ),
+            vol.Exclusive(ATTR_FILE, "source"): cv.string,
+            vol.Optional(ATTR_BATCH_NAME): cv.string,
+            vol.Optional(ATTR_VALIDATE, default=True): cv.boolean,
+            vol.Optional(ATTR_CONCURRENCY, default=IMPORT_CONCURRENCY): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=500)
+            ),
+            vol.Optional(ATTR_VALIDATION_TIMEOUT, default=IMPORT_TIMEOUT): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=300)
+            ),
+            vol.Optional(CONF_PROBE_TYPE, default=DEFAULT_PROBE_TYPE): vol.In(PROBE_TYPES),
+            vol.Optional(CONF_METHOD, default=DEFAULT_METHOD): vol.In(METHODS),
+            vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=300)
+            ),
+            vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
+                vol.Coerce(int), vol.Range(min=10, max=3600)
+            ),
+            vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): cv.boolean,
+            vol.Optional(CONF_EXPECTED_STATUS, default="200"): cv.string,
+            vol.Optional(CONF_HEADERS, default=""): vol.Any(
+                cv.string, {cv.string: cv.string}
+            ),
+            vol.Optional(
+                CONF_BATCH_CONCURRENCY, default=DEFAULT_BATCH_CONCURRENCY
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=500)),
+        }
+    ),
+    cv.has_at_least_one_key(CONF_ENDPOINTS, ATTR_FILE),
+)
+
+
+CHECK_NOW_SCHEMA = cv.make_entity_service_schema({})
+
+# Result fields returned by the check_now service
+CHECK_NOW_FIELDS = (
+    "url",
+    "is_up",
+    "status_code",
+    "response_time",
+    "failure_reason",
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def _async_import_endpoints(call: ServiceCall) -> ServiceResponse:
+        """Import endpoints given in the call or in a YAML or CSV file."""
+        if ATTR_FILE in call.data:
+            path = os.path.realpath(hass.config.path(call.data[ATTR_FILE]))
+            if not (
+                path.startswith(os.path.realpath(hass.config.config_dir) + os.sep)
+                or hass.config.is_allowed_path(path)
+            ):
+                raise HomeAssistantError(f"Reading {path} is not allowed")
+            try:
+                endpoints = await hass.async_add_executor_job(load_endpoints, path)
+            except (OSError, ValueError, yaml.YAMLError, csv.Error) as err:
+                raise HomeAssistantError(f"Could not read {path}: {err}") from err
+        else:
+            # Plain strings are URLs
+            endpoints = [
+                endpoint if isinstance(endpoint, dict) else {CONF_URL: endpoint}
+                for endpoint in call.data[CONF_ENDPOINTS]
+            ]
+
+        return await async_import_endpoints(
+            hass,
+            endpoints,
+            {key: call.data[key] for key in IMPORT_DEFAULTS},
+            call.data.get(ATTR_BATCH_NAME),
+            call.data[ATTR_VALIDATE],
+            call.data[ATTR_CONCURRENCY],
+            call.data[ATTR_VALIDATION_TIMEOUT],
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_ENDPOINTS,
+        _async_import_endpoints,
+        schema=IMPORT_ENDPOINTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _async_check_now(call: ServiceCall) -> ServiceResponse:
+        """Check the endpoints of the targeted entities immediately."""
+        coordinators = hass.data[DOMAIN].get(DATA_COORDINATORS, {})
+        registry = er.async_get(hass)
+        if call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL:
+            entity_ids = {
+                entity.entity_id
+                for entry_id in coordinators
+                for entity in er.async_entries_for_config_entry(registry, entry_id)
+            }
+        else:
+            selected = async_extract_referenced_entity_ids(hass, call)
+            entity_ids = selected.referenced | selected.indirectly_referenced
+
+        # Endpoints to check per coordinator, and the targeted entities of each
+        targets: dict[str, dict[str | None, list[str]]] = {}
+        for entity_id in entity_ids:
+            if (
+                (entity := registry.async_get(entity_id)) is None
+                or entity.platform != DOMAIN
+                or (coordinator := coordinators.get(entity.config_entry_id)) is None
+                or entity.unique_id not in coordinator.unique_ids
+            ):
+                continue
+            key = coordinator.unique_ids[entity.unique_id]
+            targets.setdefault(entity.config_entry_id, {}).setdefault(key, []).append(
+                entity_id
+            )
+        if not targets:
+            raise HomeAssistantError("No HTTP Uptime Monitor endpoints targeted")
+
+        # Probes share the global in-flight limit like scheduled ones
+        entry_ids = list(targets)
+        results = await asyncio.gather(
+            *(
+                coordinators[entry_id].async_check_now(set(targets[entry_id]))
+                for entry_id in entry_ids
+            )
+        )
+
+        response: dict[str, Any] = {}
+        for entry_id, entry_results in zip(entry_ids, results):
+            coordinator = coordinators[entry_id]
+            for key, result in entry_results.items():
+                summary = {
+                    "entry": coordinator.config[CONF_NAME],
+                    "endpoint": coordinator.endpoints[key][CONF_NAME],
+                    **{
+                        field: value
+                        for field in CHECK_NOW_FIELDS
+                        if (value := getattr(result, field)) is not None
+                    },
+                }
+                for entity_id in targets[entry_id][key]:
+                    response[entity_id] = summary
+        return {"results": response}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CHECK_NOW,
+        _async_check_now,
+        schema=CHECK_NOW_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
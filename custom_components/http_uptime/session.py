@@ -0,0 +1,141 @@
+"""Shared aiohttp session pool for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from aiohttp.abc import AbstractResolver
+
+from .const import (
+    DATA_SESSION_MANAGER,
+    DOMAIN,
+    POOL_KEEPALIVE_TIMEOUT,
+    POOL_LIMIT,
+    POOL_LIMIT_PER_HOST,
+)
+from .probe import build_trace_config
+from .resolver import async_get_resolver
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SessionManager:
+    """Hand out pooled client sessions shared by all coordinators.
+
+    Sessions are keyed by ``(verify_ssl, timeout)`` so endpoints with the same
+    connection profile share one connector and reuse keep-alive sockets. All
+    connectors resolve through one ``resolver``, whose cache replaces their
+    own. New and reused connections, and the requests holding one until
+    their response arrives, are counted through aiohttp's trace hooks.
+    """
+
+    def __init__(
+        self,
+        limit: int = POOL_LIMIT,
+        limit_per_host: int = POOL_LIMIT_PER_HOST,
+        keepalive_timeout: float = POOL_KEEPALIVE_TIMEOUT,
+        resolver: AbstractResolver | None = None,
+    ) -> None:
+        """Initialize the session manager."""
+        self._resolver = resolver
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._sessions: dict[tuple[bool, float], aiohttp.ClientSession] = {}
+        self._trace_config = self._build_trace_config()
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.connections_in_use = 0
+
+    def get_session(self, verify_ssl: bool, timeout: float) -> aiohttp.ClientSession:
+        """Return the pooled session for a connection profile."""
+        key = (verify_ssl, float(timeout))
+        session = self._sessions.get(key)
+        if session is not None and not session.closed:
+            return session
+
+        connector = aiohttp.TCPConnector(
+            verify_ssl=verify_ssl,
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            enable_cleanup_closed=True,
+            resolver=self._resolver,
+            use_dns_cache=self._resolver is None,
+        )
+        session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            connector=connector,
+            trace_configs=[build_trace_config(), self._trace_config],
+        )
+        self._sessions[key] = session
+        _LOGGER.debug(
+            "Created pooled session (verify_ssl=%s, timeout=%s)", verify_ssl, timeout
+        )
+        return session
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return pool usage counters."""
+        connections = self.connections_created + self.connections_reused
+        return {
+            "sessions": len(self._sessions),
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "reuse_rate": round(self.connections_reused / connections, 3)
+            if connections
+            else None,
+            "connections_in_use": self.connections_in_use,
+            "connection_limit": self._limit * len(self._sessions),
+        }
+
+    async def async_close(self) -> None:
+        """Close all pooled sessions."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            await session.close()
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """Return a trace config counting connections of the pooled sessions."""
+
+        async def _on_connection_created(_session, context, _params) -> None:
+            self.connections_created += 1
+            self._acquire(context)
+
+        async def _on_connection_reused(_session, context, _params) -> None:
+            self.connections_reused += 1
+            self._acquire(context)
+
+        async def _on_request_done(_session, context, _params) -> None:
+            if getattr(context, "connected", False):
+                context.connected = False
+                self.connections_in_use -= 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(_on_connection_created)
+        trace_config.on_connection_reuseconn.append(_on_connection_reused)
+        trace_config.on_request_end.append(_on_request_done)
+        trace_config.on_request_exception.append(_on_request_done)
+        return trace_config
+
+    def _acquire(self, context: SimpleNamespace) -> None:
+        """Count a request that got a connection, once per request."""
+        if not getattr(context, "connected", False):
+            context.connected = True
+            self.connections_in_use += 1
+
+
+def async_get_session_manager(hass: HomeAssistant) -> SessionManager:
+    """Return the integration-wide session manager, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (manager := domain_data.get(DATA_SESSION_MANAGER)) is None:
+        manager = domain_data[DATA_SESSION_MANAGER] = SessionManager(
+            resolver=async_get_resolver(hass)
+        )
+    return manager
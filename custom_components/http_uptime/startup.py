@@ -0,0 +1,144 @@
+"""Deferred first probes for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    CONF_DEFERRED_STARTUP,
+    CONF_STARTUP_RATE,
+    DATA_CONFIG,
+    DATA_STARTUP,
+    DEFAULT_DEFERRED_STARTUP,
+    DEFAULT_STARTUP_RATE,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StartupBatch:
+    """Run the first probes of deferred entries in the background.
+
+    With ``deferred`` set, entries are set up without waiting for a probe
+    and queue their first refresh here instead; the queue starts at most
+    ``rate`` of them per second. Setup times are recorded in both modes so
+    they can be compared.
+    """
+
+    def __init__(
+        self, deferred: bool = DEFAULT_DEFERRED_STARTUP, rate: float = DEFAULT_STARTUP_RATE
+    ) -> None:
+        """Initialize the batch."""
+        self.deferred = deferred
+        self._rate = rate
+        self._queue: dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._drain_task: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._queued_at = 0.0
+        self.entries = 0
+        self.setup_time_total = 0.0
+        self.setup_time_max = 0.0
+        self.queued = 0
+        self.completed = 0
+        self.first_probes_time: float | None = None
+
+    def record_setup(self, seconds: float) -> None:
+        """Record how long setting up an entry took."""
+        self.entries += 1
+        self.setup_time_total += seconds
+        self.setup_time_max = max(self.setup_time_max, seconds)
+
+    def async_add(
+        self, key: str, action: Callable[[], Awaitable[Any]]
+    ) -> Callable[[], None]:
+        """Queue an entry's first refresh and return a function dropping it."""
+        self._queue[key] = action
+        self.queued += 1
+        if self._drain_task is None:
+            self._queued_at = time.monotonic()
+            self._drain_task = asyncio.get_running_loop().create_task(
+                self._async_drain()
+            )
+
+        return lambda: self._queue.pop(key, None)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return setup and first probe timings."""
+        return {
+            "deferred": self.deferred,
+            "entries": self.entries,
+            "setup_time_total": round(self.setup_time_total, 3),
+            "setup_time_max": round(self.setup_time_max, 3),
+            "queued": self.queued,
+            "pending": len(self._queue) + len(self._tasks),
+            "completed": self.completed,
+            "first_probes_time": None
+            if self.first_probes_time is None
+            else round(self.first_probes_time, 3),
+        }
+
+    async def async_stop(self) -> None:
+        """Drop queued refreshes and cancel running ones."""
+        self._queue.clear()
+        tasks = [*self._tasks]
+        if self._drain_task is not None:
+            tasks.append(self._drain_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _async_drain(self) -> None:
+        """Start queued refreshes at the configured rate until none are left."""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._queue or self._tasks:
+                if not self._queue:
+                    # Entries set up meanwhile are still picked up
+                    await asyncio.wait(self._tasks, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+                key = next(iter(self._queue))
+                task = loop.create_task(self._async_run(key, self._queue.pop(key)))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                await asyncio.sleep(1 / self._rate)
+        finally:
+            self._drain_task = None
+
+        self.first_probes_time = time.monotonic() - self._queued_at
+        _LOGGER.debug(
+            "Set up %s entries in %.2f s (slowest %.2f s); first probes done %.2f s later",
+            self.entries,
+            self.setup_time_total,
+            self.setup_time_max,
+            self.first_probes_time,
+        )
+
+    async def _async_run(self, key: str, action: Callable[[], Awaitable[Any]]) -> None:
+        """Run one first refresh."""
+        try:
+            await action()
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error running first probe of %s", key)
+        self.completed += 1
+
+
+def async_get_startup_batch(hass: HomeAssistant) -> StartupBatch:
+    """Return the integration-wide startup batch, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (batch := domain_data.get(DATA_STARTUP)) is None:
+        config = domain_data.get(DATA_CONFIG, {})
+        batch = domain_data[DATA_STARTUP] = StartupBatch(
+            config.get(CONF_DEFERRED_STARTUP, DEFAULT_DEFERRED_STARTUP),
+            config.get(CONF_STARTUP_RATE, DEFAULT_STARTUP_RATE),
+        )
+    return batch
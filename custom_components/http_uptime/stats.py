@@ -0,0 +1,216 @@
+"""Rolling probe statistics for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+import math
+from typing import Any
+
+from .const import STATS_MAX_SAMPLES, STATS_WINDOWS
+
+_NAN = float("nan")
+
+
+class RollingWindow:
+    """Latency percentiles and uptime over a fixed time window.
+
+    The window is split into at most ``max_samples`` slots held in a ring of
+    ``array('f')`` latencies and two bit-packed arrays marking whether a slot
+    has data and whether the endpoint was up. Memory therefore stays constant
+    regardless of the probe interval; when probes arrive faster than the slot
+    length they are merged (worst latency, down if any probe failed).
+
+    Sums and a sorted copy of the latencies are maintained on every insert
+    and eviction, so no statistic requires a scan of the window.
+    """
+
+    def __init__(
+        self, duration: float, interval: float, max_samples: int = STATS_MAX_SAMPLES
+    ) -> None:
+        """Initialize the window."""
+        self.duration = duration
+        self.capacity = max(1, min(max_samples, math.ceil(duration / interval)))
+        self.slot_length = duration / self.capacity
+        self._latency = array("f", [_NAN]) * self.capacity
+        self._valid = bytearray((self.capacity + 7) // 8)
+        self._up = bytearray((self.capacity + 7) // 8)
+        self._sorted = array("f")
+        self._head = -1
+        self._slot_start: float | None = None
+        self._samples = 0
+        self._up_count = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._updates = 0
+
+    def record(self, now: float, latency: float | None, is_up: bool) -> None:
+        """Record a probe result taken at monotonic time ``now``."""
+        skipped = self.capacity + 1
+        if self._slot_start is not None:
+            elapsed = now - self._slot_start
+            if elapsed < self.slot_length:
+                self._merge(latency, is_up)
+                return
+            skipped = int(elapsed // self.slot_length)
+
+        # Advance over any slots without probes, evicting what they held
+        if skipped > self.capacity:
+            self.clear()
+            self._slot_start = now
+            skipped = 1
+        else:
+            self._slot_start += skipped * self.slot_length
+
+        for _ in range(skipped - 1):
+            self._head = (self._head + 1) % self.capacity
+            self._evict(self._head)
+
+        self._head = (self._head + 1) % self.capacity
+        self._evict(self._head)
+        self._set(self._head, latency, is_up)
+
+    def clear(self) -> None:
+        """Drop all recorded samples."""
+        self._latency = array("f", [_NAN]) * self.capacity
+        self._valid = bytearray(len(self._valid))
+        self._up = bytearray(len(self._up))
+        self._sorted = array("f")
+        self._samples = self._up_count = 0
+        self._sum = self._sum_sq = 0.0
+
+    @property
+    def samples(self) -> int:
+        """Return the number of slots holding data."""
+        return self._samples
+
+    @property
+    def uptime(self) -> float | None:
+        """Return the share of slots in which the endpoint was up, in percent."""
+        if not self._samples:
+            return None
+        return self._up_count / self._samples * 100
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean latency."""
+        if not self._sorted:
+            return None
+        return self._sum / len(self._sorted)
+
+    @property
+    def jitter(self) -> float | None:
+        """Return the latency standard deviation."""
+        if not self._sorted:
+            return None
+        mean = self._sum / len(self._sorted)
+        return math.sqrt(max(self._sum_sq / len(self._sorted) - mean * mean, 0.0))
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a latency percentile using the nearest-rank method."""
+        if not self._sorted:
+            return None
+        rank = max(math.ceil(percent / 100 * len(self._sorted)) - 1, 0)
+        return self._sorted[rank]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all statistics rounded for display."""
+
+        def _round(value: float | None) -> float | None:
+            return None if value is None else round(value, 2)
+
+        return {
+            "uptime": _round(self.uptime),
+            "p50": _round(self.percentile(50)),
+            "p95": _round(self.percentile(95)),
+            "p99": _round(self.percentile(99)),
+            "mean": _round(self.mean),
+            "jitter": _round(self.jitter),
+            "samples": self._samples,
+        }
+
+    def _bit(self, bits: bytearray, index: int) -> bool:
+        return bool(bits[index >> 3] & (1 << (index & 7)))
+
+    def _set_bit(self, bits: bytearray, index: int, value: bool) -> None:
+        if value:
+            bits[index >> 3] |= 1 << (index & 7)
+        else:
+            bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def _set(self, index: int, latency: float | None, is_up: bool) -> None:
+        """Fill an empty slot."""
+        self._set_bit(self._valid, index, True)
+        self._set_bit(self._up, index, is_up)
+        self._samples += 1
+        self._up_count += is_up
+        if latency is not None:
+            self._latency[index] = latency
+            self._add_latency(self._latency[index])
+
+    def _merge(self, latency: float | None, is_up: bool) -> None:
+        """Fold another probe into the current slot."""
+        index = self._head
+        if not is_up and self._bit(self._up, index):
+            self._set_bit(self._up, index, False)
+            self._up_count -= 1
+        if latency is None:
+            return
+        previous = self._latency[index]
+        if math.isnan(previous):
+            self._latency[index] = latency
+            self._add_latency(self._latency[index])
+        elif latency > previous:
+            self._remove_latency(previous)
+            self._latency[index] = latency
+            self._add_latency(self._latency[index])
+
+    def _evict(self, index: int) -> None:
+        """Empty a slot, removing its contribution to the statistics."""
+        if not self._bit(self._valid, index):
+            return
+        self._set_bit(self._valid, index, False)
+        self._samples -= 1
+        if self._bit(self._up, index):
+            self._set_bit(self._up, index, False)
+            self._up_count -= 1
+        latency = self._latency[index]
+        if not math.isnan(latency):
+            self._remove_latency(latency)
+            self._latency[index] = _NAN
+
+    def _add_latency(self, latency: float) -> None:
+        insort(self._sorted, latency)
+        self._sum += latency
+        self._sum_sq += latency * latency
+        self._track_update()
+
+    def _remove_latency(self, latency: float) -> None:
+        del self._sorted[bisect_left(self._sorted, latency)]
+        self._sum -= latency
+        self._sum_sq -= latency * latency
+        self._track_update()
+
+    def _track_update(self) -> None:
+        """Periodically recompute the running sums to shed rounding drift."""
+        self._updates += 1
+        if self._updates >= 4 * self.capacity:
+            self._updates = 0
+            self._sum = math.fsum(self._sorted)
+            self._sum_sq = math.fsum(value * value for value in self._sorted)
+
+
+class EndpointStatistics:
+    """Rolling statistics of one endpoint over several windows."""
+
+    def __init__(self, interval: float, windows: list[str] | None = None) -> None:
+        """Initialize the windows."""
+        self.windows: dict[str, RollingWindow] = {
+            name: RollingWindow(STATS_WINDOWS[name], interval)
+            for name in (windows if windows is not None else STATS_WINDOWS)
+            if name in STATS_WINDOWS
+        }
+
+    def record(self, now: float, latency: float | None, is_up: bool) -> None:
+        """Record a probe result in every window."""
+        for window in self.windows.values():
+            window.record(now, latency, is_up)
@@ -0,0 +1,144 @@
+"""Per-endpoint bookkeeping for HTTP Uptime Monitor."""
+from __future__ import annotations
+
+from bisect import bisect_left
+import math
+from operator import attrgetter
+import time
+from typing import TYPE_CHECKING
+
+from .breaker import CircuitBreaker
+from .history import ROLLUP_RESOLUTIONS, HistorySnapshot
+from .incidents import Incident, IncidentLog
+from .stats import EndpointStatistics, RollingWindow
+
+if TYPE_CHECKING:
+    from .metrics import EndpointSeries
+    from .result import ProbeResult
+
+
+def failure_reason(result: ProbeResult) -> str:
+    """Return why a probe result counts as down."""
+    if result.failure_reason:
+        return result.failure_reason
+    if result.locations:
+        return "Down by quorum of locations"
+    if result.content_match is False:
+        return "Content check failed"
+    return f"Unexpected status {result.status_code}"
+
+
+class EndpointTracker:
+    """Statistics, incidents, circuit and last success/failure of one endpoint.
+
+    Coordinators keep a tracker per endpoint and record every probe result
+    in it. It does not need Home Assistant, so the benchmarks run the same
+    bookkeeping.
+    """
+
+    def __init__(self, interval: float, windows: list[str]) -> None:
+        """Initialize the tracker."""
+        self.statistics = EndpointStatistics(interval, windows)
+        self.incidents = IncidentLog(windows)
+        self.breaker = CircuitBreaker(interval)
+        self.series: EndpointSeries | None = None
+        self.last_success: int | None = None
+        self.last_failure: int | None = None
+
+    def record(self, result: ProbeResult, now: float) -> Incident | None:
+        """Record a result taken at ``now`` and return the incident it opened or closed."""
+        is_up = result.is_up
+        self.statistics.record(time.monotonic(), result.response_time, is_up)
+        if self.series is not None:
+            self.series.update(result)
+
+        if is_up:
+            self.last_success = int(now)
+        else:
+            self.last_failure = int(now)
+        result.last_success = self.last_success
+        result.last_failure = self.last_failure
+        return self.incidents.record(
+            now, is_up, result.status_code, None if is_up else failure_reason(result)
+        )
+
+    def replay(self, snapshot: HistorySnapshot) -> None:
+        """Restore the state from a history snapshot, before any probe is recorded."""
+        wall_now = time.time()
+        monotonic_now = time.monotonic()
+        if snapshot.last_success is not None:
+            self.last_success = int(snapshot.last_success)
+        if snapshot.last_failure is not None:
+            self.last_failure = int(snapshot.last_failure)
+
+        for window in self.statistics.windows.values():
+            _replay_window(window, snapshot, wall_now, monotonic_now)
+        _replay_incidents(self.incidents, snapshot)
+
+
+def _replay_incidents(incidents: IncidentLog, snapshot: HistorySnapshot) -> None:
+    """Rebuild the incidents of a history snapshot.
+
+    The raw records only cover the last 2 days, so the buckets before them
+    are replayed from the rollups. A bucket with failed probes opens an
+    incident at its start that lasts for the failed share of the bucket.
+    """
+    raw = snapshot.raw
+    raw_start = raw[0].timestamp if raw else math.inf
+    rollups = [(rollup, ROLLUP_RESOLUTIONS["1h"]) for rollup in snapshot.hourly]
+    rollups += [(rollup, ROLLUP_RESOLUTIONS["1m"]) for rollup in snapshot.minutely]
+    for rollup, resolution in rollups:
+        if rollup.start + resolution > raw_start:
+            break
+        if rollup.up < rollup.count:
+            incidents.record(rollup.start, False)
+        if rollup.up:
+            down = (rollup.count - rollup.up) / rollup.count
+            incidents.record(rollup.start + resolution * down, True)
+
+    for record in raw:
+        incidents.record(record.timestamp, record.is_up, record.status or None)
+
+
+def _replay_window(
+    window: RollingWindow,
+    snapshot: HistorySnapshot,
+    wall_now: float,
+    monotonic_now: float,
+) -> None:
+    """Replay the part of the history inside a window.
+
+    Windows whose slots span a minute or more are fed the 1-minute rollups,
+    which merge into a slot like their probes would: slowest response, down
+    if any probe failed. Only the minutes not rolled up yet, and windows with
+    shorter slots, are replayed from the raw records.
+    """
+    offset = monotonic_now - wall_now
+    start = wall_now - window.duration
+    raw_from = start
+    if window.slot_length >= ROLLUP_RESOLUTIONS["1m"]:
+        # Hours before the 1-minute rollups are replayed as one sample each, up on majority
+        for rollup in snapshot.hourly:
+            if rollup.start >= start:
+                window.record(
+                    offset + rollup.start,
+                    rollup.latency_sum / rollup.up if rollup.up else None,
+                    rollup.up * 2 >= rollup.count,
+                )
+        for rollup in snapshot.minutely:
+            if rollup.start >= start:
+                window.record(
+                    offset + rollup.start,
+                    rollup.latency_max if rollup.latency_sum else None,
+                    rollup.up == rollup.count,
+                )
+        if snapshot.minutely:
+            raw_from = max(start, snapshot.minutely[-1].start + ROLLUP_RESOLUTIONS["1m"])
+
+    raw = snapshot.raw
+    for record in raw[bisect_left(raw, raw_from, key=attrgetter("timestamp")) :]:
+        window.record(
+            offset + record.timestamp,
+            None if math.isnan(record.latency) else record.latency,
+            record.is_up,
+        )
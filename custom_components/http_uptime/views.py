@@ -0,0 +1,114 @@
+"""HTTP API views of HTTP Uptime Monitor."""
+from __future__ import annotations
+
+from http import HTTPStatus
+import logging
+import time
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import Unauthorized
+
+from .aggregate import LOCATION_LOCAL, LocationResult, async_get_location_results
+from .const import (
+    AGENT_API_PATH,
+    AGENT_MAX_BATCH,
+    METRICS_API_PATH,
+    METRICS_CONTENT_TYPE,
+)
+from .metrics import async_get_metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AgentView(HomeAssistantView):
+    """Hand endpoints to probe agents and accept their results.
+
+    ``GET`` returns the endpoints to probe, including their request headers,
+    so both methods need an admin user. ``POST`` takes a batch of results as
+    ``{"location": name, "sent": timestamp, "results": [[key, timestamp,
+    is_up, status_code, response_time], ...]}``. Results are stamped with
+    the time they were received, minus how long the agent held them by its
+    own clock, so clock skew between agents does not make results stale.
+    """
+
+    url = AGENT_API_PATH
+    name = "api:http_uptime:agent"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the endpoints agents should probe."""
+        _require_admin(request)
+        return self.json(
+            {"endpoints": async_get_location_results(self.hass).endpoints}
+        )
+
+    async def post(self, request: web.Request) -> web.Response:
+        """Store a batch of agent results."""
+        _require_admin(request)
+        received = time.time()
+        try:
+            body: dict[str, Any] = await request.json()
+            location = str(body["location"])
+            sent = float(body.get("sent", received))
+            rows = body["results"]
+            if not isinstance(rows, list) or len(rows) > AGENT_MAX_BATCH:
+                raise ValueError("results must be a list of bounded length")
+        except (ValueError, KeyError, TypeError) as err:
+            return self.json_message(f"Invalid batch: {err}", HTTPStatus.BAD_REQUEST)
+        if not location or location == LOCATION_LOCAL:
+            return self.json_message("Invalid location", HTTPStatus.BAD_REQUEST)
+
+        results = async_get_location_results(self.hass)
+        accepted = 0
+        for row in rows:
+            try:
+                key, timestamp, is_up, status_code, response_time = row
+                accepted += results.update(
+                    str(key),
+                    location,
+                    LocationResult(
+                        received - max(sent - float(timestamp), 0.0),
+                        bool(is_up),
+                        None if status_code is None else int(status_code),
+                        None if response_time is None else float(response_time),
+                    ),
+                )
+            except (ValueError, TypeError):
+                results.rejected += 1
+
+        _LOGGER.debug("Accepted %s of %s results from %s", accepted, len(rows), location)
+        return self.json({"accepted": accepted})
+
+
+def _require_admin(request: web.Request) -> None:
+    """Reject requests of users that are not administrators."""
+    if not request["hass_user"].is_admin:
+        raise Unauthorized()
+
+
+class MetricsView(HomeAssistantView):
+    """Expose the latest results of all endpoints in OpenMetrics format.
+
+    Prometheus scrapes this with a long-lived access token as bearer token.
+    """
+
+    url = METRICS_API_PATH
+    name = "api:http_uptime:metrics"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics snapshot."""
+        return web.Response(
+            body=async_get_metrics(self.hass).render().encode(),
+            headers={"Content-Type": METRICS_CONTENT_TYPE},
+        )
@@ -0,0 +1,318 @@
+"""Probe worker processes for HTTP Uptime Monitor.
+
+With ``workers`` configured, probes run in child processes that each have
+their own event loop, session pool, DNS cache and certificate cache. The
+Home Assistant loop only writes probe requests to a worker's stdin and reads
+compact result records from its stdout, one JSON array per line.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+import json
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING, Any
+import zlib
+
+from .const import (
+    CONF_TIMEOUT,
+    CONF_URL,
+    CONF_VERIFY_SSL,
+    CONF_WORKERS,
+    DATA_CONFIG,
+    DATA_WORKER_POOL,
+    DEFAULT_WORKERS,
+    DOMAIN,
+    WORKER_MAX_IN_FLIGHT,
+    WORKER_STOP_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fields of a result record, in wire order; missing values are sent as null
+RESULT_FIELDS = (
+    "status_code",
+    "response_time",
+    "is_up",
+    "ssl_expires",
+    "bytes_read",
+    "content_match",
+    "match_time",
+    "dns_time",
+    "connect_time",
+    "handshake_time",
+    "ttfb",
+    "transfer_time",
+    "connection_reused",
+    "ranged",
+)
+
+# Record kinds
+RECORD_RESULT = 0
+RECORD_TIMEOUT = 1
+RECORD_ERROR = 2
+
+# Loads this directory as a package without running its __init__, which
+# needs Home Assistant, then serves probes on stdin/stdout
+WORKER_BOOTSTRAP = (
+    "import importlib, sys, types; "
+    "package = types.ModuleType('_http_uptime_engine'); "
+    "package.__path__ = [sys.argv[1]]; "
+    "sys.modules[package.__name__] = package; "
+    "importlib.import_module(package.__name__ + '.worker').main()"
+)
+
+# Longest line accepted from a worker or by it
+_LINE_LIMIT = 1024 * 1024
+
+
+class WorkerProbeError(Exception):
+    """A probe failed inside a worker process."""
+
+
+def encode_result(request_id: int, result: dict[str, Any]) -> list[Any]:
+    """Return the wire record of a probe result."""
+    values = [result.get(field) for field in RESULT_FIELDS]
+    if isinstance(expires := result.get("ssl_expires"), datetime):
+        values[RESULT_FIELDS.index("ssl_expires")] = expires.timestamp()
+    return [request_id, RECORD_RESULT, values]
+
+
+def decode_result(values: list[Any], config: dict[str, Any]) -> dict[str, Any]:
+    """Return the probe result held by a wire record."""
+    result = {
+        field: value
+        for field, value in zip(RESULT_FIELDS, values)
+        if value is not None
+    }
+    if "ssl_expires" in result:
+        result["ssl_expires"] = datetime.fromtimestamp(
+            result["ssl_expires"], timezone.utc
+        )
+    result["url"] = config[CONF_URL]
+    return result
+
+
+class _Worker:
+    """One worker process and the probes waiting for its answers."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.process: asyncio.subprocess.Process | None = None
+        self.reader_task: asyncio.Task | None = None
+        self.pending: dict[int, tuple[asyncio.Future, dict[str, Any]]] = {}
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+
+class WorkerPool:
+    """Run probes in worker processes sharded by endpoint URL.
+
+    Probes of the same URL always go to the same worker, so its keep-alive
+    connections and caches are reused. A worker that dies fails its pending
+    probes and is restarted on the next probe sent to it.
+    """
+
+    def __init__(self, workers: int, max_in_flight: int = WORKER_MAX_IN_FLIGHT) -> None:
+        """Initialize the pool."""
+        self._workers = [_Worker(index) for index in range(workers)]
+        self._max_in_flight = max_in_flight
+        self._lock = asyncio.Lock()
+        self._next_id = 0
+        self.sent = 0
+        self.received = 0
+        self.restarts = 0
+
+    async def async_probe(self, config: dict[str, Any]) -> dict[str, Any]:
+        """Probe an endpoint in its worker and return the result."""
+        worker = self._workers[
+            zlib.crc32(config[CONF_URL].encode()) % len(self._workers)
+        ]
+        if not worker.alive:
+            await self._async_start(worker)
+
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        worker.pending[request_id] = (future, config)
+        try:
+            worker.process.stdin.write(
+                json.dumps([request_id, config], separators=(",", ":")).encode() + b"\n"
+            )
+            # Wait while the pipe is full, so a slow worker cannot make the
+            # requests queue up in memory
+            await worker.process.stdin.drain()
+            self.sent += 1
+            # The worker enforces the probe timeout; this only guards a hung worker
+            return await asyncio.wait_for(future, config[CONF_TIMEOUT] * 2 + 5)
+        finally:
+            worker.pending.pop(request_id, None)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return worker and traffic counters."""
+        return {
+            "workers": len(self._workers),
+            "alive": sum(worker.alive for worker in self._workers),
+            "pending": sum(len(worker.pending) for worker in self._workers),
+            "sent": self.sent,
+            "received": self.received,
+            "restarts": self.restarts,
+        }
+
+    async def async_stop(self) -> None:
+        """Ask the workers to exit, killing those that do not."""
+        for worker in self._workers:
+            if not worker.alive:
+                continue
+            worker.process.stdin.close()
+            try:
+                await asyncio.wait_for(worker.process.wait(), WORKER_STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                worker.process.kill()
+                await worker.process.wait()
+        for worker in self._workers:
+            if worker.reader_task is not None:
+                worker.reader_task.cancel()
+                await asyncio.gather(worker.reader_task, return_exceptions=True)
+
+    async def _async_start(self, worker: _Worker) -> None:
+        """Start (or restart) a worker process."""
+        async with self._lock:
+            if worker.alive:
+                return
+            if worker.process is not None:
+                self.restarts += 1
+            worker.process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                WORKER_BOOTSTRAP,
+                os.path.dirname(os.path.abspath(__file__)),
+                str(self._max_in_flight),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                limit=_LINE_LIMIT,
+            )
+            worker.reader_task = asyncio.get_running_loop().create_task(
+                self._async_read(worker, worker.process)
+            )
+            _LOGGER.debug(
+                "Started probe worker %s (pid %s)", worker.index, worker.process.pid
+            )
+
+    async def _async_read(
+        self, worker: _Worker, process: asyncio.subprocess.Process
+    ) -> None:
+        """Resolve pending probes from the records a worker writes."""
+        try:
+            while line := await process.stdout.readline():
+                request_id, kind, payload = json.loads(line)
+                self.received += 1
+                if (pending := worker.pending.get(request_id)) is None:
+                    continue
+                future, config = pending
+                if future.done():
+                    continue
+                if kind == RECORD_RESULT:
+                    future.set_result(decode_result(payload, config))
+                elif kind == RECORD_TIMEOUT:
+                    future.set_exception(asyncio.TimeoutError())
+                else:
+                    future.set_exception(WorkerProbeError(payload))
+        finally:
+            for future, _ in worker.pending.values():
+                if not future.done():
+                    future.set_exception(
+                        WorkerProbeError(f"Probe worker {worker.index} exited")
+                    )
+            if process.returncode is None and process.stdout.at_eof():
+                await process.wait()
+            if process.returncode:
+                _LOGGER.warning(
+                    "Probe worker %s exited with code %s",
+                    worker.index,
+                    process.returncode,
+                )
+
+
+def async_get_worker_pool(hass: HomeAssistant) -> WorkerPool | None:
+    """Return the integration-wide worker pool, or None to probe in-process."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (pool := domain_data.get(DATA_WORKER_POOL)) is None:
+        workers = domain_data.get(DATA_CONFIG, {}).get(CONF_WORKERS, DEFAULT_WORKERS)
+        if not workers:
+            return None
+        pool = domain_data[DATA_WORKER_POOL] = WorkerPool(workers)
+    return pool
+
+
+async def _async_serve(max_in_flight: int) -> None:
+    """Answer probe requests from stdin until it is closed."""
+    # pylint: disable=import-outside-toplevel
+    from .certs import CertificateCache
+    from .probe import async_probe
+    from .resolver import CachingResolver
+    from .session import SessionManager
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=_LINE_LIMIT)
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer
+    )
+    transport, protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin, sys.stdout.buffer
+    )
+    writer = asyncio.StreamWriter(transport, protocol, None, loop)
+
+    resolver = CachingResolver()
+    sessions = SessionManager(resolver=resolver)
+    certificates = CertificateCache()
+    semaphore = asyncio.Semaphore(max_in_flight)
+    tasks: set[asyncio.Task] = set()
+
+    async def _async_handle(request_id: int, config: dict[str, Any]) -> None:
+        async with semaphore:
+            try:
+                session = sessions.get_session(
+                    config[CONF_VERIFY_SSL], config[CONF_TIMEOUT]
+                )
+                record = encode_result(
+                    request_id,
+                    await async_probe(session, config, certificates, resolver),
+                )
+            except asyncio.TimeoutError:
+                record = [request_id, RECORD_TIMEOUT, None]
+            except Exception as err:  # pylint: disable=broad-except
+                record = [request_id, RECORD_ERROR, str(err) or type(err).__name__]
+        writer.write(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+        await writer.drain()
+
+    try:
+        while line := await reader.readline():
+            request_id, config = json.loads(line)
+            task = loop.create_task(_async_handle(request_id, config))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    finally:
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await certificates.async_stop()
+        await sessions.async_close()
+        await resolver.close()
+
+
+def main() -> None:
+    """Run a probe worker; see ``WORKER_BOOTSTRAP``."""
+    logging.basicConfig(
+        level=logging.WARNING,
+        format=f"http_uptime worker {os.getpid()}: %(levelname)s %(message)s",
+    )
+    max_in_flight = int(sys.argv[2]) if len(sys.argv) > 2 else WORKER_MAX_IN_FLIGHT
+    asyncio.run(_async_serve(max_in_flight))
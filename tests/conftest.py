@@ -0,0 +1,64 @@
+"""Fixtures for the HTTP Uptime Monitor tests."""
+from datetime import datetime, timedelta, timezone
+import importlib
+import os
+import ssl
+import sys
+import types
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+import pytest
+
+ENGINE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "custom_components", "http_uptime"
+)
+
+# Load the integration as a package without running its __init__, which
+# needs Home Assistant
+_package = types.ModuleType("_http_uptime_engine")
+_package.__path__ = [ENGINE_DIR]
+sys.modules.setdefault(_package.__name__, _package)
+
+
+@pytest.fixture
+def engine():
+    """Return a function importing a module of the integration."""
+    return lambda name: importlib.import_module(f"_http_uptime_engine.{name}")
+
+
+@pytest.fixture
+def certificate(tmp_path):
+    """Return a self-signed certificate for localhost and a server context using it."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    expires = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(expires - timedelta(days=3650))
+        .not_valid_after(expires)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = tmp_path / "cert.pem"
+    key_path = tmp_path / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_path, key_path)
+    return types.SimpleNamespace(
+        der=cert.public_bytes(serialization.Encoding.DER),
+        expires=expires,
+        context=context,
+    )
@@ -0,0 +1,56 @@
+"""Tests for the adaptive polling interval."""
+
+
+class TestAdaptiveInterval:
+    """Test AdaptiveInterval."""
+
+    def test_grows_when_stable(self, engine):
+        """Test the interval grows after the stable probes, up to the maximum."""
+        adaptive = engine("adaptive")
+        interval = adaptive.AdaptiveInterval(60, 300)
+        intervals = [interval.update(True, 50) for _ in range(14)]
+
+        assert intervals[: adaptive.ADAPTIVE_STABLE_PROBES] == [60] * 10
+        assert intervals[10:] == [90, 135, 202.5, 300]
+
+    def test_confirms_failure(self, engine):
+        """Test a failure is re-probed quickly, then probed at the base interval."""
+        interval = engine("adaptive").AdaptiveInterval(60, 300, confirm_count=3)
+        for _ in range(12):
+            interval.update(True, 50)
+
+        intervals = []
+        for _ in range(5):
+            intervals.append(interval.update(False, None))
+            intervals.append(interval.confirming)
+
+        assert intervals == [5, True, 5, True, 5, True, 60, False, 60, False]
+        assert interval.update(True, 50) == 60
+        assert not interval.confirming
+
+    def test_recovery_during_confirmation(self, engine):
+        """Test a good probe ends the confirmation."""
+        interval = engine("adaptive").AdaptiveInterval(60, 300)
+        interval.update(False, None)
+
+        assert interval.update(True, 50) == 60
+        assert not interval.confirming
+        # A new problem is confirmed again
+        assert interval.update(False, None) == 5
+
+    def test_latency_jump(self, engine):
+        """Test a response time far above the baseline counts as a problem."""
+        interval = engine("adaptive").AdaptiveInterval(60, 300, latency_threshold=100)
+        interval.update(True, 50)
+
+        assert interval.update(True, 120) == 60
+        assert not interval.confirming
+        assert interval.update(True, 250) == 5
+        assert interval.confirming
+
+    def test_limits(self, engine):
+        """Test the maximum and confirmation interval are bounded by the base."""
+        interval = engine("adaptive").AdaptiveInterval(3, 1, confirm_interval=5)
+
+        assert interval.maximum == 3
+        assert interval.confirm_interval == 3
@@ -0,0 +1,99 @@
+"""Tests for the multi-location result aggregation."""
+import time
+
+
+def _results(aggregate, reports):
+    """Return location results of one endpoint, from (location, age, is_up) reports."""
+    results = aggregate.LocationResults()
+    results.register("entry/ep", {"url": "https://example.com"})
+    now = time.time()
+    for location, age, is_up in reports:
+        results.update(
+            "entry/ep",
+            location,
+            aggregate.LocationResult(now - age, is_up, 200 if is_up else None, None),
+        )
+    return results
+
+
+class TestLocationResults:
+    """Test LocationResults."""
+
+    def test_stale_reports_ignored(self, engine):
+        """Test reports older than the stale limit do not vote."""
+        aggregate = engine("aggregate")
+        results = _results(
+            aggregate,
+            [
+                (aggregate.LOCATION_LOCAL, 0, False),
+                ("berlin", 5, True),
+                ("tokyo", 600, True),
+                ("paris", 600, True),
+            ],
+        )
+
+        is_up, fresh = results.verdict("entry/ep", 10)
+
+        assert sorted(fresh) == ["berlin", aggregate.LOCATION_LOCAL]
+        # A majority of two fresh locations needs both
+        assert is_up is False
+
+    def test_majority(self, engine):
+        """Test fresh agents outvote a failing local probe."""
+        aggregate = engine("aggregate")
+        results = _results(
+            aggregate,
+            [
+                (aggregate.LOCATION_LOCAL, 0, False),
+                ("berlin", 5, True),
+                ("tokyo", 30, True),
+                ("paris", 600, False),
+            ],
+        )
+
+        is_up, fresh = results.verdict("entry/ep", 10)
+
+        assert is_up is True
+        assert len(fresh) == 3
+
+    def test_quorum(self, engine):
+        """Test an explicit quorum, capped at the number of fresh locations."""
+        aggregate = engine("aggregate")
+        results = _results(
+            aggregate,
+            [
+                (aggregate.LOCATION_LOCAL, 0, False),
+                ("berlin", 5, True),
+                ("tokyo", 600, True),
+            ],
+        )
+
+        assert results.verdict("entry/ep", 10, quorum=1)[0] is True
+        assert results.verdict("entry/ep", 10, quorum=2)[0] is False
+        assert _results(aggregate, [("berlin", 5, True)]).verdict("entry/ep", 10, 3)[0]
+
+    def test_stale_limit_follows_interval(self, engine):
+        """Test reports stay fresh for a few intervals of slow endpoints."""
+        results = _results(engine("aggregate"), [("berlin", 600, True)])
+
+        assert results.verdict("entry/ep", 60) == (None, {})
+        assert results.verdict("entry/ep", 300)[0] is True
+
+    def test_unknown_endpoint(self, engine):
+        """Test results of endpoints not offered to agents are rejected."""
+        aggregate = engine("aggregate")
+        results = aggregate.LocationResults()
+        remove = results.register("entry/ep", {})
+        report = aggregate.LocationResult(time.time(), True, 200, 12.0)
+
+        assert not results.update("other", "berlin", report)
+        assert results.update("entry/ep", "berlin", report)
+        remove()
+
+        assert results.endpoints == {}
+        assert results.stats == {
+            "endpoints": 0,
+            "locations": 0,
+            "received": 1,
+            "rejected": 1,
+        }
@@ -0,0 +1,62 @@
+"""Tests for the circuit breaker."""
+import time
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker."""
+
+    def test_opens_after_threshold(self, engine):
+        """Test the circuit opens after ``threshold`` failures in a row."""
+        breaker = engine("breaker")
+        circuit = breaker.CircuitBreaker(30, threshold=3)
+        states = []
+        for _ in range(3):
+            circuit.record_failure("Timeout")
+            states.append(circuit.state)
+
+        assert states == [
+            breaker.CIRCUIT_CLOSED,
+            breaker.CIRCUIT_CLOSED,
+            breaker.CIRCUIT_OPEN,
+        ]
+        assert circuit.is_open
+        assert circuit.reason == "Timeout"
+
+    def test_success_closes(self, engine):
+        """Test a response closes the circuit and resets the count."""
+        breaker = engine("breaker")
+        circuit = breaker.CircuitBreaker(30, threshold=2)
+        circuit.record_failure("Timeout")
+        circuit.record_failure("Timeout")
+        circuit.record_success()
+
+        assert circuit.state == breaker.CIRCUIT_CLOSED
+        assert circuit.reason is None
+        circuit.record_failure("Timeout")
+        assert not circuit.is_open
+
+    def test_backoff(self, engine):
+        """Test retries are spaced twice as far after every failure, up to a maximum."""
+        circuit = engine("breaker").CircuitBreaker(30, threshold=2, maximum=200)
+        intervals = []
+        for _ in range(6):
+            circuit.record_failure("Timeout")
+            intervals.append(circuit.interval)
+
+        assert intervals == [30, 30, 60, 120, 200, 200]
+
+    def test_due(self, engine):
+        """Test an open circuit is only due at its retry time."""
+        circuit = engine("breaker").CircuitBreaker(30, threshold=1)
+        now = time.monotonic()
+        assert circuit.due(now)
+
+        circuit.record_failure("Timeout")
+
+        assert circuit.retry_at >= now + 30
+        assert not circuit.due(now)
+        assert circuit.due(circuit.retry_at)
+
+    def test_maximum_below_base(self, engine):
+        """Test the maximum spacing is never below the base interval."""
+        assert engine("breaker").CircuitBreaker(600, maximum=300).maximum == 600
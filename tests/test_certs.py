@@ -0,0 +1,72 @@
+"""Tests for the certificate expiry cache."""
+import asyncio
+
+
+async def _serve(context, server_names):
+    """Start a TLS server on localhost and return it with its port."""
+    context.sni_callback = lambda ssl_object, name, _context: server_names.append(name)
+    server = await asyncio.start_server(
+        lambda reader, writer: writer.close(), "127.0.0.1", 0, ssl=context
+    )
+    return server, server.sockets[0].getsockname()[1]
+
+
+class TestCertificateCache:
+    """Test CertificateCache."""
+
+    def test_certificate_expiry(self, engine, certificate):
+        """Test the expiry is read from a DER certificate."""
+        certs = engine("certs")
+
+        assert certs.certificate_expiry(certificate.der) == certificate.expires
+
+    def test_observe(self, engine, certificate):
+        """Test an observed certificate is parsed once, then only compared."""
+        cache = engine("certs").CertificateCache()
+
+        async def _run():
+            cache.observe("example.com", 443, certificate.der)
+            await asyncio.sleep(0)
+            cache.observe("example.com", 443, certificate.der)
+            expires = cache.get("example.com", 443)
+            await cache.async_stop()
+            return expires
+
+        assert asyncio.run(_run()) == certificate.expires
+        assert cache.parsed == 1
+        assert cache.fetched == 0
+
+    def test_fetch(self, engine, certificate):
+        """Test a stale host is fetched in the background."""
+        cache = engine("certs").CertificateCache()
+        server_names = []
+
+        async def _run():
+            server, port = await _serve(certificate.context, server_names)
+            async with server:
+                assert cache.get("localhost", port) is None
+                await asyncio.gather(*(entry.task for entry in cache._entries.values()))
+                expires = cache.get("localhost", port)
+            await cache.async_stop()
+            return expires
+
+        assert asyncio.run(_run()) == certificate.expires
+        assert cache.fetched == 1
+        assert server_names == ["localhost"]
+
+    def test_fetch_pinned(self, engine, certificate):
+        """Test a pinned endpoint is fetched from its address with the host as SNI."""
+        cache = engine("certs").CertificateCache()
+        server_names = []
+
+        async def _run():
+            server, port = await _serve(certificate.context, server_names)
+            async with server:
+                cache.get("monitored.invalid", port, "127.0.0.1")
+                await asyncio.gather(*(entry.task for entry in cache._entries.values()))
+                expires = cache.get("monitored.invalid", port, "127.0.0.1")
+            await cache.async_stop()
+            return expires
+
+        assert asyncio.run(_run()) == certificate.expires
+        assert server_names == ["monitored.invalid"]
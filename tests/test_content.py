@@ -0,0 +1,112 @@
+"""Tests for the response body assertions."""
+import pytest
+
+
+def _check(content, chunks, **kwargs):
+    """Feed chunks to a new check and return it."""
+    check = content.ContentCheck(**kwargs)
+    for chunk in chunks:
+        if check.done:
+            break
+        check.feed(chunk)
+    return check
+
+
+class TestContentCheck:
+    """Test ContentCheck."""
+
+    def test_keyword_across_chunks(self, engine):
+        """Test a keyword split over two chunks is found."""
+        check = _check(
+            engine("content"), [b"status: hea", b"lthy and fine"], keyword="healthy"
+        )
+
+        assert check.finish()
+
+    def test_keyword_missing(self, engine):
+        """Test a missing keyword fails the check."""
+        check = _check(engine("content"), [b"status: ", b"degraded"], keyword="healthy")
+
+        assert not check.finish()
+
+    def test_stops_when_decided(self, engine):
+        """Test reading stops once every assertion is decided."""
+        check = _check(engine("content"), [b"ok", b"never read"], keyword="ok")
+
+        assert check.done
+        assert check.bytes_read == 2
+
+    def test_regex(self, engine):
+        """Test a regular expression is searched across chunks."""
+        content = engine("content")
+
+        assert _check(
+            content, [b"version=1.", b"42 up"], regex=r"version=\d+\.\d+"
+        ).finish()
+        assert not _check(content, [b"version=x"], regex=r"version=\d+").finish()
+
+    def test_regex_whole_body(self, engine):
+        """Test anchors and long matches see the whole body, not chunk windows."""
+        content = engine("content")
+        chunks = [b"status: ", b"ok\n", b"x" * 4096, b"\nend"]
+
+        assert _check(content, chunks, regex=r"(?m)\Astatus: ok$").finish()
+        assert _check(content, chunks, regex=r"(?s)ok.{4096,}end\Z").finish()
+        assert not _check(content, chunks, regex=r"ok\Z").finish()
+        assert not _check(content, chunks, regex=r"\Ax").finish()
+
+    def test_regex_reads_body(self, engine):
+        """Test a regex keeps the body read after the keyword matched."""
+        check = _check(
+            engine("content"), [b"ok", b" version=2"], keyword="ok", regex=r"=\d$"
+        )
+
+        assert not check.done
+        assert check.bytes_read == 12
+        assert check.finish()
+
+    def test_limit(self, engine):
+        """Test only the first ``limit`` bytes are evaluated."""
+        check = _check(
+            engine("content"), [b"x" * 8, b"healthy"], keyword="healthy", limit=10
+        )
+
+        assert check.done
+        assert check.bytes_read == 10
+        assert not check.finish()
+
+    @pytest.mark.parametrize(
+        ("path", "value", "expected"),
+        [
+            ("status", "ok", True),
+            ("$.checks.0.healthy", None, True),
+            ("checks.-1.healthy", "false", True),
+            ("checks.1.healthy", None, False),
+            ("checks.2", None, False),
+            ("missing", None, False),
+            ("status", "down", False),
+        ],
+    )
+    def test_json_path(self, engine, path, value, expected):
+        """Test JSON path assertions."""
+        body = b'{"status": "ok", "checks": [{"healthy": true}, {"healthy": false}]}'
+        check = _check(
+            engine("content"), [body[:20], body[20:]], json_path=path, json_value=value
+        )
+
+        assert not check.done
+        assert check.finish() is expected
+        assert check.json_match is expected
+
+    def test_invalid_json(self, engine):
+        """Test a body that is not JSON fails a JSON path assertion."""
+        assert not _check(engine("content"), [b"<html>"], json_path="status").finish()
+
+    def test_from_config(self, engine):
+        """Test a check is only created when an assertion is configured."""
+        content = engine("content")
+
+        assert content.ContentCheck.from_config({"body_keyword": ""}) is None
+        check = content.ContentCheck.from_config({"body_keyword": "ok"})
+        check.feed(b"ok")
+        assert check.as_dict()["content_match"] is True
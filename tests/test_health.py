@@ -0,0 +1,101 @@
+"""Tests for the probe engine self-monitoring."""
+import asyncio
+import time
+
+
+class TestEngineMonitor:
+    """Test EngineMonitor."""
+
+    def test_loop_lag(self, engine):
+        """Test a blocked event loop is measured as lag and blocked time."""
+        health = engine("health")
+        monitor = health.EngineMonitor(profile_rate=0, tick=0.02)
+
+        async def _run():
+            monitor.async_start()
+            await asyncio.sleep(0.05)
+            time.sleep(health.HEALTH_BLOCK_THRESHOLD + 0.05)
+            await asyncio.sleep(0.05)
+            monitor.async_stop()
+
+        asyncio.run(_run())
+
+        assert monitor.loop_lag_max >= health.HEALTH_BLOCK_THRESHOLD
+        assert monitor.loop_blocked >= health.HEALTH_BLOCK_THRESHOLD
+        assert monitor.stats["profiler"] is None
+
+    def test_probe_rate(self, engine):
+        """Test completed probes are turned into a smoothed rate."""
+        monitor = engine("health").EngineMonitor(profile_rate=0, tick=0.05)
+
+        async def _run():
+            monitor.async_start()
+            for _ in range(10):
+                monitor.record_probe()
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+            monitor.async_stop()
+
+        asyncio.run(_run())
+
+        assert monitor.probes == 10
+        assert monitor.probe_rate > 0
+
+    def test_phases(self, engine):
+        """Test CPU time is attributed to named phases."""
+        monitor = engine("health").EngineMonitor(profile_rate=0)
+        with monitor.phase("bookkeeping"):
+            sum(range(200_000))
+        monitor.add_phase_time("content_match", 0.5)
+
+        phases = monitor.stats["phase_cpu"]
+        assert phases["bookkeeping"] > 0
+        assert phases["content_match"] == 0.5
+
+    def test_stop_without_start(self, engine):
+        """Test stopping a monitor that never started is harmless."""
+        engine("health").EngineMonitor().async_stop()
+
+
+class TestSamplingProfiler:
+    """Test SamplingProfiler."""
+
+    @staticmethod
+    async def _work():
+        """Return after some profiled work."""
+        await asyncio.sleep(0)
+        return sum(range(10_000))
+
+    def test_profiles_sampled_updates(self, engine):
+        """Test every update is profiled at a rate of 1."""
+        profiler = engine("health").SamplingProfiler(1)
+
+        async def _run():
+            return [await profiler.async_run(self._work) for _ in range(3)]
+
+        assert asyncio.run(_run()) == [49995000] * 3
+        assert profiler.sampled == 3
+        functions = profiler.top_functions(limit=50)
+        assert any("_work" in entry["function"] for entry in functions)
+        assert len(profiler.top_functions(limit=2)) == 2
+
+    def test_skips_unsampled_updates(self, engine):
+        """Test nothing is profiled at a rate of 0."""
+        profiler = engine("health").SamplingProfiler(0)
+
+        assert asyncio.run(profiler.async_run(self._work)) == 49995000
+        assert profiler.sampled == 0
+        assert profiler.top_functions() == []
+
+    def test_one_update_at_a_time(self, engine):
+        """Test updates overlapping a profiled one are not profiled."""
+        profiler = engine("health").SamplingProfiler(1)
+
+        async def _run():
+            await asyncio.gather(
+                profiler.async_run(self._work), profiler.async_run(self._work)
+            )
+
+        asyncio.run(_run())
+
+        assert profiler.sampled == 1
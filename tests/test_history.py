@@ -0,0 +1,135 @@
+"""Tests for the persistent probe history."""
+import math
+import time
+
+
+def _records(history, start, count, step=10, down_every=0):
+    """Return ``count`` raw records from ``start``, ``step`` seconds apart."""
+    return [
+        history.RawRecord(
+            start + index * step,
+            math.nan if down_every and index % down_every == 0 else 100.0 + index % 10,
+            500 if down_every and index % down_every == 0 else 200,
+            0 if down_every and index % down_every == 0 else history.FLAG_UP,
+        )
+        for index in range(count)
+    ]
+
+
+class TestHistoryStore:
+    """Test HistoryStore."""
+
+    def test_write_read(self, engine, tmp_path):
+        """Test records are read back from a given time."""
+        history = engine("history")
+        start = time.time() // 3600 * 3600 - 3600
+        rows = _records(history, start, 30)
+        history.HistoryStore(str(tmp_path), "entry").append(rows)
+
+        snapshot = history.HistoryStore(str(tmp_path), "entry").load(start + 100)
+
+        assert snapshot.raw == rows[10:]
+        assert snapshot.last == rows[-1]
+        assert snapshot.last_success == rows[-1].timestamp
+        assert snapshot.last_failure is None
+
+    def test_rollups(self, engine, tmp_path):
+        """Test completed buckets are rolled up and open ones are not written."""
+        history = engine("history")
+        start = time.time() // 3600 * 3600 - 3600
+        # Two and a half minutes, every third probe down
+        rows = _records(history, start, 15, down_every=3)
+        store = history.HistoryStore(str(tmp_path), "entry")
+        store.append(rows)
+
+        minutely = store.rollups["1m"].read_since(0)
+        assert [bucket[:3] for bucket in minutely] == [(start, 6, 4), (start + 60, 6, 4)]
+        assert minutely[0][3] == sum(row.latency for row in rows[:6] if row.is_up)
+        assert minutely[0][4] == max(row.latency for row in rows[:6] if row.is_up)
+        assert store.rollups["1h"].read_since(0) == []
+
+        snapshot = history.HistoryStore(str(tmp_path), "entry").load(0)
+        assert [bucket.start for bucket in snapshot.minutely] == [start, start + 60]
+        assert snapshot.last_failure == rows[12].timestamp
+        assert snapshot.last_success == rows[14].timestamp
+
+    def test_hourly_before_minutes(self, engine, tmp_path):
+        """Test only the hours before the first minute rollup are loaded."""
+        history = engine("history")
+        store = history.HistoryStore(str(tmp_path), "entry")
+        start = time.time() // 3600 * 3600 - 3 * 3600
+        store.rollups["1h"].append([(start, 360, 360, 36000.0, 100.0)])
+        store.rollups["1h"].append([(start + 3600, 360, 360, 36000.0, 100.0)])
+        store.rollups["1m"].append([(start + 3600, 6, 6, 600.0, 100.0)])
+
+        snapshot = store.load(0)
+
+        assert [bucket.start for bucket in snapshot.hourly] == [start]
+        assert snapshot.last_success == start + 3600
+        assert snapshot.last_failure is None
+
+    def test_last_times_from_rollups(self, engine, tmp_path):
+        """Test the last failure is found in the rollups before the raw records."""
+        history = engine("history")
+        store = history.HistoryStore(str(tmp_path), "entry")
+        start = time.time() // 3600 * 3600 - 3 * 3600
+        store.rollups["1h"].append([(start, 360, 350, 35000.0, 100.0)])
+        store.rollups["1m"].append([(start + 3600, 6, 5, 500.0, 100.0)])
+        store.rollups["1m"].append([(start + 3660, 6, 6, 600.0, 100.0)])
+
+        snapshot = store.load(0)
+
+        assert snapshot.last_success == start + 3660
+        assert snapshot.last_failure == start + 3600
+
+    def test_retention(self, engine, tmp_path):
+        """Test compaction drops raw records older than the retention."""
+        history = engine("history")
+        now = time.time()
+        retention = history.HISTORY_RETENTION["raw"]
+        old = _records(history, now - retention - 600, 10)
+        recent = _records(history, now - 600, 10)
+        history.HistoryStore(str(tmp_path), "entry").append(old + recent)
+
+        snapshot = history.HistoryStore(str(tmp_path), "entry").load(0)
+
+        assert snapshot.raw == recent
+
+    def test_torn_tail(self, engine, tmp_path):
+        """Test a record torn by a crash is dropped on the next append."""
+        history = engine("history")
+        start = time.time() // 3600 * 3600 - 3600
+        rows = _records(history, start, 3)
+        store = history.HistoryStore(str(tmp_path), "entry")
+        store.append(rows[:2])
+        with open(store.raw.path, "ab") as file:
+            file.write(history.RAW_RECORD.pack(*rows[2])[:5])
+        assert len(store.raw.read_since(0)) == 2
+
+        store.append(rows[2:])
+
+        assert history.HistoryStore(str(tmp_path), "entry").load(0).raw == rows
+
+    def test_migrate(self, engine, tmp_path):
+        """Test the legacy directory is moved unless the new one exists."""
+        history = engine("history")
+        legacy = tmp_path / ".storage" / "http_uptime_history"
+        legacy.mkdir(parents=True)
+        (legacy / "entry.raw").write_bytes(b"")
+        directory = tmp_path / "http_uptime_history"
+
+        history.migrate_history(str(legacy), str(directory))
+
+        assert (directory / "entry.raw").exists()
+        assert not legacy.exists()
+
+        legacy.mkdir()
+        history.migrate_history(str(legacy), str(directory))
+        assert legacy.exists()
+
+    def test_missing_files(self, engine, tmp_path):
+        """Test loading a store without files returns an empty snapshot."""
+        snapshot = engine("history").HistoryStore(str(tmp_path), "entry").load(0)
+
+        assert snapshot.last is None
+        assert snapshot.raw == snapshot.minutely == snapshot.hourly == []
@@ -0,0 +1,144 @@
+"""Tests for the bulk endpoint import.
+
+The importer validates through the config flow, so these tests need Home
+Assistant installed.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.data_entry_flow import FlowResultType  # noqa: E402
+
+DEFAULTS = {
+    "probe_type": "http",
+    "method": "GET",
+    "timeout": 10,
+    "update_interval": 60,
+    "verify_ssl": True,
+    "expected_status": "200",
+    "headers": "",
+    "batch_concurrency": 10,
+}
+
+
+def _hass(unique_ids=()):
+    """Return a stand-in for Home Assistant recording the created entries."""
+    created = []
+
+    async def _async_init(domain, context, data):
+        created.append(data)
+        return {"type": FlowResultType.CREATE_ENTRY}
+
+    return (
+        SimpleNamespace(
+            config_entries=SimpleNamespace(
+                async_entries=lambda domain: [
+                    SimpleNamespace(unique_id=unique_id) for unique_id in unique_ids
+                ],
+                flow=SimpleNamespace(async_init=_async_init),
+            )
+        ),
+        created,
+    )
+
+
+class TestImportEndpoints:
+    """Test async_import_endpoints."""
+
+    def test_validation(self, engine):
+        """Test invalid, duplicate and configured endpoints are reported."""
+        importer = engine("importer")
+        hass, created = _hass(["https://known.example_Known"])
+        endpoints = [
+            {"url": "https://a.example", "name": "A"},
+            {"url": "https://a.example", "name": "A"},
+            {"url": "https://known.example", "name": "Known"},
+            {"url": "https://b.example", "timeout": 500},
+            {"url": "tcp://db.example", "probe_type": "tcp"},
+            {"url": "https://c.example", "body_regex": "("},
+            {"name": "No URL"},
+        ]
+
+        report = asyncio.run(
+            importer.async_import_endpoints(hass, endpoints, DEFAULTS, connect=False)
+        )
+
+        assert [entry["url"] for entry in created] == ["https://a.example"]
+        assert report["total"] == 7
+        assert report["valid"] == report["created"] == 1
+        assert [item["url"] for item in report["skipped"]] == [
+            "https://a.example",
+            "https://known.example",
+        ]
+        assert {item["url"] for item in report["failed"]} == {
+            "https://b.example",
+            "tcp://db.example",
+            "https://c.example",
+            None,
+        }
+        assert report["validation_time"] is None
+
+    def test_batch(self, engine):
+        """Test valid endpoints go into one batch entry with their own settings."""
+        importer = engine("importer")
+        hass, created = _hass()
+        endpoints = [
+            {"url": "https://a.example", "name": "A", "method": "head"},
+            {"url": "https://b.example"},
+            {"url": "https://c.example", "probe_type": "ping"},
+        ]
+
+        report = asyncio.run(
+            importer.async_import_endpoints(
+                hass, endpoints, DEFAULTS, batch_name="Sites", connect=False
+            )
+        )
+
+        assert report["created"] == 1
+        assert len(report["failed"]) == 1
+        (batch,) = created
+        assert batch["name"] == "Sites"
+        assert batch["endpoints"] == [
+            {"name": "A", "url": "https://a.example", "method": "HEAD"},
+            {"name": "https://b.example", "url": "https://b.example"},
+        ]
+
+    def test_existing_batch(self, engine):
+        """Test importing into an existing batch name is refused."""
+        importer = engine("importer")
+        hass, _ = _hass(["batch_Sites"])
+
+        with pytest.raises(importer.HomeAssistantError):
+            asyncio.run(
+                importer.async_import_endpoints(
+                    hass, [{"url": "https://a.example"}], DEFAULTS, batch_name="Sites"
+                )
+            )
+
+
+class TestLoadEndpoints:
+    """Test load_endpoints."""
+
+    def test_yaml(self, engine, tmp_path):
+        """Test a YAML list or mapping with an endpoints key is read."""
+        path = tmp_path / "endpoints.yaml"
+        path.write_text("endpoints:\n  - url: https://a.example\n    name: A\n")
+
+        assert engine("importer").load_endpoints(str(path)) == [
+            {"url": "https://a.example", "name": "A"}
+        ]
+
+    def test_csv(self, engine, tmp_path):
+        """Test empty CSV cells are left out so the defaults apply."""
+        path = tmp_path / "endpoints.csv"
+        path.write_text(
+            "url,name,timeout\nhttps://a.example,A,\nhttps://b.example,,5\n"
+        )
+
+        assert engine("importer").load_endpoints(str(path)) == [
+            {"url": "https://a.example", "name": "A"},
+            {"url": "https://b.example", "timeout": "5"},
+        ]
@@ -0,0 +1,118 @@
+"""Tests for the incident log."""
+
+
+def _log(incidents):
+    """Return a log with two closed outages and one open since 3000."""
+    log = incidents.IncidentLog(["1h", "24h"])
+    for now, is_up in [
+        (0, True),
+        (100, False),
+        (110, False),
+        (160, True),
+        (1000, False),
+        (1030, True),
+        (3000, False),
+    ]:
+        log.record(now, is_up, None if is_up else 503, None if is_up else "Down")
+    return log
+
+
+class TestIncidentLog:
+    """Test IncidentLog."""
+
+    def test_open_close(self, engine):
+        """Test an incident is returned when it opens and when it closes."""
+        log = engine("incidents").IncidentLog(["1h"])
+
+        assert log.record(0, True) is None
+        opened = log.record(10, False, 503, "Unexpected status 503")
+        assert opened is log.open
+        assert log.record(20, False, 500, "Unexpected status 500") is None
+        closed = log.record(40, True, 200)
+
+        assert closed is opened
+        assert log.open is None
+        assert closed.as_dict(100)["duration"] == 30
+        assert closed.status_code == 503
+        assert list(log.incidents) == [closed]
+
+    def test_stats(self, engine):
+        """Test outage count, MTTR, MTBF and downtime with an open outage."""
+        log = _log(engine("incidents"))
+
+        assert log.stats("1h", 3100) == {
+            "outages": 3,
+            "mttr": 45.0,
+            "mtbf": 970.0,
+            "downtime": 190.0,
+        }
+
+    def test_stats_closed(self, engine):
+        """Test the aggregates of closed outages only."""
+        log = engine("incidents").IncidentLog(["1h"])
+        for now, is_up in [
+            (0, True),
+            (100, False),
+            (160, True),
+            (1000, False),
+            (1030, True),
+        ]:
+            log.record(now, is_up)
+
+        assert log.stats("1h", 2000) == {
+            "outages": 2,
+            "mttr": 45.0,
+            "mtbf": 955.0,
+            "downtime": 90.0,
+        }
+
+    def test_windows(self, engine):
+        """Test outages that closed before a window no longer count in it."""
+        log = _log(engine("incidents"))
+
+        assert log.stats("1h", 3800) == {
+            "outages": 2,
+            "mttr": 30.0,
+            "mtbf": 1385.0,
+            "downtime": 830.0,
+        }
+        assert log.stats("24h", 3800) == {
+            "outages": 3,
+            "mttr": 45.0,
+            "mtbf": 970.0,
+            "downtime": 890.0,
+        }
+
+    def test_open_outage_clipped(self, engine):
+        """Test only the part of an open outage inside the window counts."""
+        log = engine("incidents").IncidentLog(["1h"])
+        log.record(0, False)
+
+        assert log.stats("1h", 7200) == {
+            "outages": 1,
+            "mttr": None,
+            "mtbf": 0,
+            "downtime": 3600.0,
+        }
+
+    def test_no_outages(self, engine):
+        """Test an endpoint without outages has no MTTR or MTBF."""
+        log = engine("incidents").IncidentLog(["1h"])
+        log.record(0, True)
+
+        assert log.stats("1h", 60) == {
+            "outages": 0,
+            "mttr": None,
+            "mtbf": None,
+            "downtime": 0.0,
+        }
+
+    def test_log_size(self, engine):
+        """Test only the latest incidents are kept."""
+        log = engine("incidents").IncidentLog(["1h"], size=2)
+        for start in range(0, 60, 20):
+            log.record(start, False)
+            log.record(start + 10, True)
+
+        assert [incident.start for incident in log.incidents] == [20, 40]
+        assert log.stats("1h", 60)["outages"] == 3
@@ -0,0 +1,90 @@
+"""Tests for the OpenMetrics export."""
+
+
+def _series(engine, url="https://example.com"):
+    """Return a metrics snapshot with one registered series."""
+    metrics = engine("metrics").MetricsSnapshot()
+    series, unregister = metrics.register({"name": "Example", "url": url})
+    return metrics, series, unregister
+
+
+class TestMetricsSnapshot:
+    """Test MetricsSnapshot and EndpointSeries."""
+
+    def test_render(self, engine):
+        """Test the samples of a checked endpoint are rendered per family."""
+        result = engine("result")
+        metrics, series, _ = _series(engine)
+        url = "https://example.com"
+        series.update(result.ProbeResult(url, True, 200, 250.0, 1900000000))
+        series.update(result.ProbeResult(url, True, 200, 500.0))
+        series.update(result.ProbeResult(url, False, 503))
+        labels = 'name="Example",url="https://example.com"'
+        expiry = "http_uptime_ssl_expiry_timestamp_seconds"
+
+        lines = metrics.render().splitlines()
+
+        assert lines[0] == "# TYPE http_uptime_up gauge"
+        assert lines[-1] == "# EOF"
+        assert f"http_uptime_up{{{labels}}} 0" in lines
+        assert f"http_uptime_status_code{{{labels}}} 503" in lines
+        assert f"http_uptime_checks_total{{{labels}}} 3" in lines
+        assert f"http_uptime_failures_total{{{labels}}} 1" in lines
+        assert f"{expiry}{{{labels}}} 1900000000" in lines
+        buckets = {
+            line.split('le="')[1].split('"')[0]: int(line.rsplit(" ", 1)[1])
+            for line in lines
+            if line.startswith("http_uptime_response_time_seconds_bucket")
+        }
+        # Buckets are cumulative and include their upper bound
+        assert buckets["0.1"] == 0
+        assert buckets["0.25"] == 1
+        assert buckets["0.5"] == buckets["+Inf"] == 2
+        assert f"http_uptime_response_time_seconds_count{{{labels}}} 2" in lines
+        assert f"http_uptime_response_time_seconds_sum{{{labels}}} 0.75" in lines
+
+    def test_family_order(self, engine):
+        """Test every family header precedes its samples, once."""
+        result = engine("result")
+        metrics = engine("metrics")
+        snapshot = metrics.MetricsSnapshot()
+        for name in ("a", "b"):
+            series, _ = snapshot.register({"name": name})
+            series.update(result.ProbeResult(name, True, 200, 10.0))
+
+        text = snapshot.render()
+
+        assert text.count("# TYPE") == len(metrics.FAMILIES)
+        up = text.index("# TYPE http_uptime_up gauge")
+        status = text.index("# TYPE http_uptime_status_code gauge")
+        assert up < text.index('http_uptime_up{name="a"}') < status
+        assert up < text.index('http_uptime_up{name="b"}') < status
+
+    def test_unchecked_and_removed(self, engine):
+        """Test unchecked and unregistered series are left out."""
+        metrics, series, unregister = _series(engine)
+
+        assert "http_uptime_up{" not in metrics.render()
+        series.update(None)
+        assert "http_uptime_up{" in metrics.render()
+        unregister()
+        assert "http_uptime_up{" not in metrics.render()
+        assert metrics.stats == {"series": 0, "scrapes": 3}
+
+    def test_cached_samples(self, engine):
+        """Test samples are rendered once per check."""
+        result = engine("result")
+        metrics, series, _ = _series(engine)
+        series.update(result.ProbeResult("https://example.com", True, 200, 10.0))
+
+        first = series.samples()
+        assert series.samples() is first
+        series.update(result.ProbeResult("https://example.com", True, 200, 10.0))
+        assert series.samples() is not first
+
+    def test_escape(self, engine):
+        """Test label values are escaped."""
+        metrics, series, _ = _series(engine, 'https://example.com/"a\\b"\n')
+        series.update(None)
+
+        assert 'url="https://example.com/\\"a\\\\b\\"\\n"' in metrics.render()
@@ -0,0 +1,207 @@
+"""Tests for the probes and their phase timings."""
+import asyncio
+import ssl
+
+from aiohttp import web
+import pytest
+
+
+async def _serve(context=None):
+    """Start a server on localhost that closes every connection."""
+    return await asyncio.start_server(
+        lambda reader, writer: writer.close(), "127.0.0.1", 0, ssl=context
+    )
+
+
+def _config(url, **config):
+    """Return a probe configuration for a URL."""
+    return {"url": url, "timeout": 5, "verify_ssl": False, **config}
+
+
+class TestConnectTarget:
+    """Test connect_target."""
+
+    def test_targets(self, engine):
+        """Test the host and port are taken from the URL."""
+        probe = engine("probe")
+
+        assert probe.connect_target(_config("tcp://db.local:5432")) == (
+            "db.local",
+            5432,
+        )
+        assert probe.connect_target(_config("https://example.com")) == (
+            "example.com",
+            443,
+        )
+        assert probe.connect_target(_config("tcp://example.com"), tls=True) == (
+            "example.com",
+            443,
+        )
+
+    def test_missing_port(self, engine):
+        """Test a TCP URL without a port is rejected."""
+        with pytest.raises(ValueError):
+            engine("probe").connect_target(_config("tcp://db.local"))
+
+
+class TestProbeConnect:
+    """Test async_probe_connect."""
+
+    def test_tcp(self, engine):
+        """Test a TCP probe connects and reports the connect time."""
+        probe = engine("probe")
+
+        async def _run():
+            server = await _serve()
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await probe.async_probe_connect(
+                    _config(f"tcp://127.0.0.1:{port}")
+                )
+
+        result = asyncio.run(_run())
+
+        assert result["is_up"]
+        assert result["connect_time"] >= 0
+        assert result["handshake_time"] is None
+        assert result["ssl_expires"] is None
+
+    def test_pinned_address(self, engine):
+        """Test a pinned address is connected to instead of the host."""
+        probe = engine("probe")
+
+        async def _run():
+            server = await _serve()
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await probe.async_probe_connect(
+                    _config(f"tcp://monitored.invalid:{port}", resolve="127.0.0.1")
+                )
+
+        assert asyncio.run(_run())["is_up"]
+
+    def test_refused(self, engine):
+        """Test a refused connection raises for the caller to report."""
+        probe = engine("probe")
+
+        async def _run():
+            server = await _serve()
+            port = server.sockets[0].getsockname()[1]
+            server.close()
+            await server.wait_closed()
+            await probe.async_probe_connect(_config(f"tcp://127.0.0.1:{port}"))
+
+        with pytest.raises(OSError):
+            asyncio.run(_run())
+
+    def test_tls(self, engine, certificate):
+        """Test a TLS probe completes the handshake and observes the certificate."""
+        probe = engine("probe")
+        certificates = engine("certs").CertificateCache()
+
+        async def _run():
+            server = await _serve(certificate.context)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                config = _config(f"tcp://localhost:{port}", resolve="127.0.0.1")
+                first = await probe.async_probe_connect(config, certificates, tls=True)
+                await asyncio.sleep(0)
+                second = await probe.async_probe_connect(config, certificates, tls=True)
+            await certificates.async_stop()
+            return first, second
+
+        first, second = asyncio.run(_run())
+
+        assert first["is_up"]
+        assert first["handshake_time"] >= 0
+        assert second["ssl_expires"] == certificate.expires
+        assert certificates.fetched == 0
+
+    def test_tls_verification(self, engine, certificate):
+        """Test a self-signed certificate fails the handshake when verified."""
+        probe = engine("probe")
+
+        async def _run():
+            server = await _serve(certificate.context)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                await probe.async_probe_connect(
+                    _config(f"tcp://localhost:{port}", verify_ssl=True), tls=True
+                )
+
+        with pytest.raises(ssl.SSLError):
+            asyncio.run(_run())
+
+
+class TestProbeTimings:
+    """Test ProbeTimings."""
+
+    def test_as_dict(self, engine):
+        """Test phase durations are measured from the timestamps."""
+        timings = engine("probe").ProbeTimings()
+        timings.start = 1_000_000
+        timings.dns_start, timings.dns_end = 1_000_000, 3_500_000
+        timings.connect_start, timings.connect_end = 3_500_000, 13_500_000
+        timings.headers = 43_500_000
+        timings.end = 44_000_000
+
+        assert timings.as_dict() == {
+            "dns_time": 2.5,
+            "connect_time": 10.0,
+            "ttfb": 30.0,
+            "transfer_time": 0.5,
+            "connection_reused": False,
+        }
+
+    def test_reused_connection(self, engine):
+        """Test a reused connection has no DNS or connect phase."""
+        timings = engine("probe").ProbeTimings()
+        timings.start = 1_000_000
+        timings.headers = 21_000_000
+        timings.reused = True
+
+        assert timings.as_dict() == {
+            "dns_time": None,
+            "connect_time": None,
+            "ttfb": 20.0,
+            "transfer_time": None,
+            "connection_reused": True,
+        }
+
+    def test_http_probe(self, engine):
+        """Test the trace hooks fill in the timings of an HTTP probe."""
+        probe = engine("probe")
+
+        async def _handle(request):
+            return web.Response(text="ok")
+
+        async def _run():
+            app = web.Application()
+            app.router.add_get("/", _handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            config = _config(
+                f"http://127.0.0.1:{port}/",
+                probe_type="http",
+                method="GET",
+                expected_status=[200],
+            )
+            session = engine("session").SessionManager().get_session(False, 5)
+            try:
+                return [await probe.async_probe(session, config) for _ in range(2)]
+            finally:
+                await session.close()
+                await runner.cleanup()
+
+        first, second = asyncio.run(_run())
+
+        assert first["is_up"]
+        assert first["connect_time"] is not None
+        assert first["ttfb"] is not None
+        assert first["transfer_time"] is not None
+        assert not first["connection_reused"]
+        assert second["connect_time"] is None
+        assert second["connection_reused"]
@@ -0,0 +1,125 @@
+"""Tests for the probe registry."""
+import asyncio
+
+
+class _Request:
+    """Request counting its calls, answering after an optional event."""
+
+    def __init__(self, release=None):
+        self.calls = 0
+        self.release = release
+
+    async def __call__(self):
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        return {"status_code": 200, "call": self.calls}
+
+
+class TestProbeRegistry:
+    """Test ProbeRegistry."""
+
+    def test_join_in_flight(self, engine):
+        """Test concurrent probes of a key share one request and get copies."""
+        registry = engine("registry").ProbeRegistry()
+
+        async def _run():
+            request = _Request(asyncio.Event())
+            probes = [
+                asyncio.ensure_future(registry.async_probe("key", request, max_age=0))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            request.release.set()
+            return request, await asyncio.gather(*probes)
+
+        request, results = asyncio.run(_run())
+
+        assert request.calls == 1
+        assert results == [{"status_code": 200, "call": 1}] * 3
+        assert results[0] is not results[1]
+        assert registry.stats == {"requests": 1, "coalesced": 2, "in_flight": 0, "cached": 1}
+
+    def test_window(self, engine):
+        """Test a completed result is reused within the window only."""
+        registry = engine("registry").ProbeRegistry(window=0.05)
+        request = _Request()
+
+        async def _run():
+            first = await registry.async_probe("key", request)
+            second = await registry.async_probe("key", request)
+            await asyncio.sleep(0.06)
+            third = await registry.async_probe("key", request)
+            return first, second, third
+
+        first, second, third = asyncio.run(_run())
+
+        assert first["call"] == second["call"] == 1
+        assert third["call"] == 2
+        assert registry.stats["coalesced"] == 1
+
+    def test_max_age(self, engine):
+        """Test max_age shortens the reuse window, and 0 disables reuse."""
+        registry = engine("registry").ProbeRegistry(window=10)
+        request = _Request()
+
+        async def _run():
+            await registry.async_probe("key", request)
+            cached = await registry.async_probe("key", request, max_age=5)
+            fresh = await registry.async_probe("key", request, max_age=0)
+            return cached, fresh
+
+        cached, fresh = asyncio.run(_run())
+
+        assert cached["call"] == 1
+        assert fresh["call"] == 2
+
+    def test_eviction(self, engine):
+        """Test results older than the window are dropped on the next insert."""
+        registry = engine("registry").ProbeRegistry(window=0.05)
+
+        async def _run():
+            await registry.async_probe("old", _Request())
+            await asyncio.sleep(0.06)
+            await registry.async_probe("new", _Request())
+
+        asyncio.run(_run())
+
+        assert registry.stats["cached"] == 1
+
+    def test_error_shared(self, engine):
+        """Test a failed request raises for every subscriber and is not cached."""
+        registry = engine("registry").ProbeRegistry()
+
+        async def _fail():
+            await asyncio.sleep(0)
+            raise OSError("refused")
+
+        async def _run():
+            return await asyncio.gather(
+                registry.async_probe("key", _fail),
+                registry.async_probe("key", _fail),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(_run())
+
+        assert all(isinstance(result, OSError) for result in results)
+        assert registry.stats == {"requests": 1, "coalesced": 1, "in_flight": 0, "cached": 0}
+
+
+def test_probe_key(engine):
+    """Test probes differing only in their name share a key."""
+    registry = engine("registry")
+    config = {
+        "name": "a",
+        "url": "https://example.com",
+        "method": "GET",
+        "verify_ssl": True,
+        "timeout": 10,
+        "headers": {"Accept": "text/html"},
+    }
+
+    assert registry.probe_key(config) == registry.probe_key({**config, "name": "b"})
+    assert registry.probe_key(config) != registry.probe_key({**config, "timeout": 5})
+
@@ -0,0 +1,106 @@
+"""Tests for the shared caching DNS resolver."""
+import asyncio
+import socket
+import time
+
+import pytest
+
+
+def _resolver(engine, monkeypatch, answer):
+    """Return a resolver looking names up with ``answer`` only."""
+    resolver_module = engine("resolver")
+    monkeypatch.setattr(resolver_module, "aiodns", None)
+    resolver = resolver_module.CachingResolver()
+    calls = []
+
+    async def _getaddrinfo(host, family):
+        calls.append(host)
+        await asyncio.sleep(0)
+        return answer(host)
+
+    resolver._async_getaddrinfo = _getaddrinfo
+    return resolver, calls
+
+
+class TestCachingResolver:
+    """Test CachingResolver."""
+
+    @pytest.mark.parametrize(("ttl", "expected"), [(1, 30), (600, 600), (86400, 3600)])
+    def test_ttl_clamp(self, engine, monkeypatch, ttl, expected):
+        """Test answers are cached for their TTL clamped to the limits."""
+        resolver, _ = _resolver(
+            engine, monkeypatch, lambda host: ([("192.0.2.1", socket.AF_INET)], ttl)
+        )
+
+        async def _run():
+            await resolver.resolve("example.com", 443)
+            return resolver._cache[("example.com", socket.AF_INET)].expires
+
+        assert asyncio.run(_run()) - time.monotonic() == pytest.approx(expected, abs=1)
+
+    def test_cache(self, engine, monkeypatch):
+        """Test concurrent and later lookups of a name share one query."""
+        resolver, calls = _resolver(
+            engine, monkeypatch, lambda host: ([("192.0.2.1", socket.AF_INET)], 300)
+        )
+
+        async def _run():
+            results = await asyncio.gather(
+                *(resolver.resolve("example.com", 443) for _ in range(5))
+            )
+            results.append(await resolver.resolve("example.com", 80))
+            return results
+
+        results = asyncio.run(_run())
+
+        assert calls == ["example.com"]
+        assert results[0] == [
+            {
+                "hostname": "example.com",
+                "host": "192.0.2.1",
+                "port": 443,
+                "family": socket.AF_INET,
+                "proto": 0,
+                "flags": socket.AI_NUMERICHOST | socket.AI_NUMERICSERV,
+            }
+        ]
+        assert results[-1][0]["port"] == 80
+        assert resolver.stats["misses"] == 1
+        assert resolver.stats["hits"] == 1
+
+    def test_negative_cache(self, engine, monkeypatch):
+        """Test a failed lookup is cached and raised again without a query."""
+
+        def _fail(host):
+            raise OSError("Name or service not known")
+
+        resolver, calls = _resolver(engine, monkeypatch, _fail)
+
+        async def _run():
+            for _ in range(2):
+                with pytest.raises(socket.gaierror):
+                    await resolver.resolve("missing.invalid")
+            return resolver._cache[("missing.invalid", socket.AF_INET)].expires
+
+        expires = asyncio.run(_run())
+
+        assert calls == ["missing.invalid"]
+        assert expires - time.monotonic() == pytest.approx(30, abs=1)
+        assert resolver.stats["failures"] == 1
+        assert resolver.stats["negative_hits"] == 1
+
+    def test_expiry(self, engine, monkeypatch):
+        """Test an expired answer is looked up again."""
+        resolver, calls = _resolver(
+            engine, monkeypatch, lambda host: ([("192.0.2.1", socket.AF_INET)], 300)
+        )
+
+        async def _run():
+            await resolver.resolve("example.com")
+            resolver._cache[("example.com", socket.AF_INET)].expires = 0
+            await resolver.resolve("example.com")
+            await resolver.close()
+
+        asyncio.run(_run())
+
+        assert calls == ["example.com", "example.com"]
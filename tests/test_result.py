@@ -0,0 +1,73 @@
+"""Tests for the compact probe result records."""
+from datetime import datetime, timezone
+
+
+class TestProbeResult:
+    """Test ProbeResult."""
+
+    def test_from_probe(self, engine):
+        """Test a probe dict becomes a record with the timings in one tuple."""
+        result = engine("result")
+        probe = {
+            "url": "https://example.com",
+            "status_code": 200,
+            "response_time": 42.5,
+            "ssl_expires": datetime(2030, 1, 1, 12, 30, tzinfo=timezone.utc),
+            "content_match": True,
+            "dns_time": 1.5,
+            "connect_time": 3.25,
+            "ttfb": 30.0,
+            "connection_reused": False,
+            "is_up": False,
+        }
+
+        record = result.ProbeResult.from_probe(probe, True)
+
+        assert record.is_up
+        assert record.status_code == 200
+        assert record.response_time == 42.5
+        assert record.ssl_expires == 1893501000
+        assert record.content_match is True
+        assert len(record.timings) == len(result.TIMING_FIELDS)
+        assert record.phase_timings() == {
+            "dns_time": 1.5,
+            "connect_time": 3.25,
+            "ttfb": 30.0,
+            "connection_reused": False,
+        }
+
+    def test_from_probe_minimal(self, engine):
+        """Test a connection-level probe without HTTP values."""
+        result = engine("result")
+
+        record = result.ProbeResult.from_probe({"url": "tcp://db.local:5432"}, False)
+
+        assert not record.is_up
+        assert record.status_code is None
+        assert record.ssl_expires is None
+        assert record.phase_timings() == {}
+
+    def test_as_dict(self, engine):
+        """Test only set values are returned, with times in ISO 8601."""
+        result = engine("result")
+        record = result.ProbeResult.from_probe(
+            {"url": "https://example.com", "status_code": 503, "dns_time": 2.0}, False
+        )
+        record.last_failure = 1893501000
+
+        assert record.as_dict() == {
+            "url": "https://example.com",
+            "is_up": False,
+            "status_code": 503,
+            "dns_time": 2.0,
+            "last_failure": "2030-01-01T12:30:00+00:00",
+        }
+        record.restored = True
+        assert record.as_dict()["restored"] is True
+
+    def test_isoformat(self, engine):
+        """Test timestamps are formatted as UTC."""
+        result = engine("result")
+
+        assert result.isoformat(0) == "1970-01-01T00:00:00+00:00"
+        assert result.isoformat(None) is None
@@ -0,0 +1,94 @@
+"""Tests for the central probe scheduler."""
+import asyncio
+import zlib
+
+import pytest
+
+
+class TestProbeScheduler:
+    """Test ProbeScheduler."""
+
+    def test_heap_order(self, engine):
+        """Test jobs run in the order of their due times."""
+        scheduler = engine("scheduler").ProbeScheduler()
+        runs = []
+
+        async def _run():
+            for key in ("a", "b", "c", "d", "e"):
+                scheduler.async_add(key, 0.2, lambda key=key: _record(key))
+            due = {key: job.due for key, job in scheduler._jobs.items()}
+            await asyncio.sleep(0.25)
+            await scheduler.async_stop()
+            return due
+
+        async def _record(key):
+            runs.append(key)
+
+        due = asyncio.run(_run())
+
+        assert runs[:5] == sorted(due, key=due.get)
+        assert scheduler.stats["dispatched"] >= 5
+
+    def test_jitter_deterministic(self, engine):
+        """Test the phase is derived from the jitter key and shared with it."""
+        scheduler = engine("scheduler").ProbeScheduler()
+
+        async def _run():
+            loop = asyncio.get_running_loop()
+            scheduler.async_add("entry1", 60, asyncio.sleep, jitter_key="https://a")
+            await asyncio.sleep(0.01)
+            scheduler.async_add("entry2", 60, asyncio.sleep, jitter_key="https://a")
+            scheduler.async_add("entry3", 60, asyncio.sleep, jitter_key="https://b")
+            scheduler.async_add("entry4", 60, asyncio.sleep, delay=60)
+            jobs = scheduler._jobs
+            result = (loop.time(), {key: job.due for key, job in jobs.items()})
+            await scheduler.async_stop()
+            return result
+
+        now, due = asyncio.run(_run())
+
+        phase = zlib.crc32(b"https://a") / 0xFFFFFFFF * 60
+        assert due["entry1"] == pytest.approx(due["entry2"])
+        assert due["entry1"] % 60 == pytest.approx(phase, abs=1e-6)
+        assert now < due["entry1"] <= now + 60
+        assert due["entry3"] != pytest.approx(due["entry1"])
+        assert now + 60 <= due["entry4"] <= now + 120
+
+    def test_remove(self, engine):
+        """Test a removed job no longer runs."""
+        scheduler = engine("scheduler").ProbeScheduler()
+        runs = []
+
+        async def _record():
+            runs.append(1)
+
+        async def _run():
+            remove = scheduler.async_add("a", 0.05, _record)
+            remove()
+            await asyncio.sleep(0.12)
+            await scheduler.async_stop()
+
+        asyncio.run(_run())
+
+        assert runs == []
+        assert scheduler.stats["jobs"] == 0
+
+    def test_slot_cap(self, engine):
+        """Test no more than ``max_in_flight`` probes hold a slot at once."""
+        scheduler = engine("scheduler").ProbeScheduler(max_in_flight=2)
+        peak = 0
+
+        async def _probe():
+            nonlocal peak
+            async with scheduler.slot():
+                peak = max(peak, scheduler.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def _run():
+            await asyncio.gather(*(_probe() for _ in range(6)))
+
+        asyncio.run(_run())
+
+        assert peak == 2
+        assert scheduler.in_flight == 0
+        assert scheduler.stats["slot_wait_max"] > 0
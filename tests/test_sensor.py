@@ -0,0 +1,95 @@
+"""Tests for the state write throttling of the sensors.
+
+The sensors are Home Assistant entities, so these tests need Home Assistant
+installed.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+
+@pytest.fixture
+def clock(engine, monkeypatch):
+    """Return a list holding the monotonic time seen by the sensors."""
+    now = [1000.0]
+    monkeypatch.setattr(engine("sensor").time, "monotonic", lambda: now[0])
+    return now
+
+
+def _writer(engine, heartbeat):
+    """Return a throttled writer counting its state writes."""
+
+    class _Writer(engine("sensor")._ThrottledWriteMixin):
+        writes = 0
+
+        def async_write_ha_state(self):
+            self.writes += 1
+
+    writer = _Writer()
+    writer._heartbeat = heartbeat
+    return writer
+
+
+class TestThrottledWrite:
+    """Test _ThrottledWriteMixin."""
+
+    def test_heartbeat(self, engine, clock):
+        """Test unchanged states are only written once the heartbeat is due."""
+        writer = _writer(engine, 900)
+
+        assert writer._async_write_if(False)
+        clock[0] += 899
+        assert not writer._async_write_if(False)
+        clock[0] += 1
+        assert writer._async_write_if(False)
+        assert writer.writes == 2
+
+    def test_significant(self, engine, clock):
+        """Test significant changes are written right away."""
+        writer = _writer(engine, 900)
+        writer._async_write_if(False)
+
+        assert writer._async_write_if(True)
+        assert writer._async_write_if(True)
+        # A significant write restarts the heartbeat
+        clock[0] += 899
+        assert not writer._async_write_if(False)
+        assert writer.writes == 3
+
+    def test_no_heartbeat(self, engine, clock):
+        """Test a heartbeat of 0 writes on every check."""
+        writer = _writer(engine, 0)
+
+        assert all(writer._async_write_if(False) for _ in range(3))
+        assert writer.writes == 3
+
+
+class TestLatencyChanged:
+    """Test the response time thresholds of the status sensor."""
+
+    @pytest.mark.parametrize(
+        ("previous", "latency", "changed"),
+        [
+            (None, None, False),
+            (None, 50.0, True),
+            (50.0, None, True),
+            # 100 ms but only 10 %
+            (1000.0, 1100.0, False),
+            # 60 % but only 30 ms
+            (50.0, 80.0, False),
+            (200.0, 300.0, True),
+            (300.0, 200.0, True),
+        ],
+    )
+    def test_thresholds(self, engine, previous, latency, changed):
+        """Test a change must pass both the absolute and relative threshold."""
+        sensor = SimpleNamespace(
+            _written_latency=previous, _threshold_ms=100, _threshold_pct=25
+        )
+
+        assert (
+            engine("sensor").HTTPUptimeSensor._latency_changed(sensor, latency)
+            is changed
+        )
@@ -0,0 +1,87 @@
+"""Tests for the shared session pool."""
+import asyncio
+
+from aiohttp import web
+
+
+async def _handle(request):
+    """Answer every request with a short body."""
+    return web.Response(text="ok")
+
+
+async def _serve():
+    """Start a local HTTP server and return its runner and URL."""
+    app = web.Application()
+    app.router.add_get("/", _handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/"
+
+
+class TestSessionManager:
+    """Test SessionManager."""
+
+    def test_sessions_per_profile(self, engine):
+        """Test endpoints with the same profile share a session."""
+        manager = engine("session").SessionManager()
+
+        async def _run():
+            first = manager.get_session(True, 10)
+            same = manager.get_session(True, 10.0)
+            other = manager.get_session(False, 10)
+            await first.close()
+            replaced = manager.get_session(True, 10)
+            result = (first is same, first is other, replaced is first)
+            await manager.async_close()
+            return result
+
+        assert asyncio.run(_run()) == (True, False, False)
+        assert manager.stats["sessions"] == 0
+
+    def test_connection_reuse(self, engine):
+        """Test new and reused keep-alive connections are counted."""
+        manager = engine("session").SessionManager()
+
+        async def _run():
+            runner, url = await _serve()
+            try:
+                session = manager.get_session(True, 10)
+                for _ in range(3):
+                    async with session.get(url) as response:
+                        await response.read()
+                return manager.stats
+            finally:
+                await manager.async_close()
+                await runner.cleanup()
+
+        stats = asyncio.run(_run())
+
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 2
+        assert stats["reuse_rate"] == 0.667
+        assert stats["connections_in_use"] == 0
+
+    def test_failed_connection(self, engine):
+        """Test a request that got no connection is not counted as in use."""
+        manager = engine("session").SessionManager()
+
+        async def _run():
+            runner, url = await _serve()
+            await runner.cleanup()
+            try:
+                async with manager.get_session(True, 5).get(url):
+                    pass
+            except OSError:
+                pass
+            finally:
+                await manager.async_close()
+            return manager.stats
+
+        stats = asyncio.run(_run())
+
+        assert stats["connections_created"] == 0
+        assert stats["connections_in_use"] == 0
+        assert stats["reuse_rate"] is None
@@ -0,0 +1,94 @@
+"""Tests for the deferred first probes."""
+import asyncio
+
+import pytest
+
+
+class TestStartupBatch:
+    """Test StartupBatch."""
+
+    def test_pacing(self, engine):
+        """Test queued refreshes start at the configured rate, in order."""
+        batch = engine("startup").StartupBatch(rate=50)
+        started = []
+
+        async def _run():
+            loop = asyncio.get_running_loop()
+
+            def _action(key):
+                async def _refresh():
+                    started.append((key, loop.time()))
+
+                return _refresh
+
+            for key in "abcde":
+                batch.async_add(key, _action(key))
+            while batch.first_probes_time is None:
+                await asyncio.sleep(0.01)
+
+        asyncio.run(_run())
+
+        assert [key for key, _ in started] == list("abcde")
+        times = [time for _, time in started]
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        assert min(gaps) >= 0.02 * 0.9
+        assert batch.stats["completed"] == 5
+        assert batch.stats["pending"] == 0
+        assert batch.first_probes_time >= 0.08 * 0.9
+
+    def test_drop_and_errors(self, engine):
+        """Test dropped refreshes are skipped and failing ones do not stop the rest."""
+        batch = engine("startup").StartupBatch(rate=1000)
+        started = []
+
+        async def _run():
+            async def _fail():
+                started.append("fail")
+                raise RuntimeError("probe failed")
+
+            async def _ok():
+                started.append("ok")
+
+            batch.async_add("fail", _fail)
+            drop = batch.async_add("dropped", _ok)
+            batch.async_add("ok", _ok)
+            drop()
+            while batch.first_probes_time is None:
+                await asyncio.sleep(0.01)
+
+        asyncio.run(_run())
+
+        assert started == ["fail", "ok"]
+        assert batch.stats["queued"] == 3
+        # A failed first probe still completes
+        assert batch.stats["completed"] == 2
+
+    def test_stop(self, engine):
+        """Test stopping drops queued refreshes and cancels running ones."""
+        batch = engine("startup").StartupBatch(rate=1000)
+
+        async def _run():
+            release = asyncio.Event()
+            batch.async_add("slow", release.wait)
+            batch.async_add("queued", release.wait)
+            await asyncio.sleep(0)
+            running = next(iter(batch._tasks))
+            await batch.async_stop()
+            return running
+
+        running = asyncio.run(_run())
+
+        assert running.cancelled()
+        assert batch.stats["pending"] == 0
+        assert batch.stats["completed"] == 0
+
+    def test_setup_times(self, engine):
+        """Test setup times are summed and the slowest kept."""
+        batch = engine("startup").StartupBatch(deferred=False)
+        for seconds in (0.5, 1.5, 1.0):
+            batch.record_setup(seconds)
+
+        assert batch.stats["entries"] == 3
+        assert batch.stats["setup_time_total"] == pytest.approx(3.0)
+        assert batch.stats["setup_time_max"] == 1.5
+        assert not batch.stats["deferred"]
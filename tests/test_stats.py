@@ -0,0 +1,77 @@
+"""Tests for the rolling statistics."""
+import pytest
+
+
+class TestRollingWindow:
+    """Test RollingWindow."""
+
+    def test_percentiles(self, engine):
+        """Test nearest-rank percentiles, mean and jitter."""
+        stats = engine("stats")
+        window = stats.RollingWindow(100, 1)
+        for second in range(100):
+            window.record(second, second + 1, True)
+
+        assert window.samples == 100
+        assert window.uptime == 100
+        assert window.percentile(50) == 50
+        assert window.percentile(95) == 95
+        assert window.percentile(99) == 99
+        assert window.percentile(100) == 100
+        assert window.mean == pytest.approx(50.5)
+        assert window.jitter == pytest.approx(28.866, abs=0.001)
+
+    def test_empty(self, engine):
+        """Test an empty window has no statistics."""
+        window = engine("stats").RollingWindow(60, 1)
+
+        assert window.uptime is None
+        assert window.percentile(50) is None
+        assert window.as_dict()["samples"] == 0
+
+    def test_wraparound(self, engine):
+        """Test old slots are evicted once the ring wraps around."""
+        window = engine("stats").RollingWindow(10, 1)
+        for second in range(10):
+            window.record(second, 1000, False)
+        for second in range(10, 15):
+            window.record(second, second, True)
+
+        assert window.samples == 10
+        assert window.uptime == 50
+        assert window.percentile(50) == 14
+        assert window.percentile(60) == 1000
+
+    def test_gap_longer_than_window(self, engine):
+        """Test a gap longer than the window clears it."""
+        window = engine("stats").RollingWindow(10, 1)
+        for second in range(10):
+            window.record(second, 10, False)
+        window.record(100, 20, True)
+
+        assert window.samples == 1
+        assert window.uptime == 100
+        assert window.mean == 20
+
+    def test_merge_within_slot(self, engine):
+        """Test probes in one slot keep the worst latency and any failure."""
+        window = engine("stats").RollingWindow(3600, 1, max_samples=60)
+        window.record(0, 10, True)
+        window.record(30, 50, False)
+        window.record(45, None, True)
+
+        assert window.samples == 1
+        assert window.uptime == 0
+        assert window.mean == 50
+
+
+class TestEndpointStatistics:
+    """Test EndpointStatistics."""
+
+    def test_windows(self, engine):
+        """Test unknown windows are skipped and every window records."""
+        statistics = engine("stats").EndpointStatistics(60, ["1h", "2h", "7d"])
+        statistics.record(0, 42, True)
+
+        assert list(statistics.windows) == ["1h", "7d"]
+        assert all(window.samples == 1 for window in statistics.windows.values())
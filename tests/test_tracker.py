@@ -0,0 +1,107 @@
+"""Tests for the per-endpoint bookkeeping."""
+import math
+import time
+
+
+class TestEndpointTracker:
+    """Test EndpointTracker."""
+
+    def test_record(self, engine):
+        """Test a result updates the statistics, times and incidents."""
+        result = engine("result")
+        tracker = engine("tracker").EndpointTracker(60, ["1h"])
+        now = time.time()
+
+        down = result.ProbeResult("https://example.com", False, 503)
+        incident = tracker.record(down, now)
+        up = result.ProbeResult("https://example.com", True, 200, 12.0)
+        closed = tracker.record(up, now + 60)
+
+        assert incident is closed
+        assert incident.reason == "Unexpected status 503"
+        assert incident.end == now + 60
+        assert (up.last_success, up.last_failure) == (int(now + 60), int(now))
+        # Both results fall into the current slot, which is down
+        assert tracker.statistics.windows["1h"].samples == 1
+        assert tracker.statistics.windows["1h"].uptime == 0
+
+    def test_failure_reason(self, engine):
+        """Test the reason recorded for the kinds of down results."""
+        result = engine("result")
+        tracker = engine("tracker")
+
+        assert (
+            tracker.failure_reason(
+                result.ProbeResult("u", False, failure_reason="Timeout connecting to u")
+            )
+            == "Timeout connecting to u"
+        )
+        quorum = result.ProbeResult("u", False, 200)
+        quorum.locations = {"local": "up", "berlin": "down", "tokyo": "down"}
+        assert tracker.failure_reason(quorum) == "Down by quorum of locations"
+        content = result.ProbeResult("u", False, 200)
+        content.content_match = False
+        assert tracker.failure_reason(content) == "Content check failed"
+
+    def test_replay(self, engine, tmp_path):
+        """Test state is rebuilt from rollups and the raw tail of the history."""
+        history = engine("history")
+        now = time.time()
+        start = now // 60 * 60 - 3 * 3600
+        rows = [
+            history.RawRecord(
+                start + index * 60,
+                math.nan if index % 30 == 0 else 100.0,
+                500 if index % 30 == 0 else 200,
+                0 if index % 30 == 0 else history.FLAG_UP,
+            )
+            for index in range(180)
+        ]
+        history.HistoryStore(str(tmp_path), "entry").append(rows)
+        tracker = engine("tracker").EndpointTracker(60, ["1h", "24h"])
+
+        tracker.replay(history.HistoryStore(str(tmp_path), "entry").load(now - 86400))
+
+        windows = tracker.statistics.windows
+        # 2-minute slots, down when either probe failed
+        assert windows["24h"].samples == 90
+        assert windows["24h"].uptime == 100 * 84 / 90
+        # Only the last hour, with the failure half an hour ago
+        assert windows["1h"].samples <= 60
+        assert windows["1h"].uptime < 100
+        assert tracker.last_success == int(rows[-1].timestamp)
+        assert tracker.last_failure == int(rows[150].timestamp)
+        assert len(tracker.incidents.incidents) == 6
+
+    def test_replay_incidents_from_rollups(self, engine):
+        """Test incidents before the raw records are rebuilt from the rollups."""
+        history = engine("history")
+        tracker = engine("tracker").EndpointTracker(60, ["7d"])
+        now = time.time()
+        hour = now // 3600 * 3600 - 4 * 86400
+        minute = hour + 3600
+        snapshot = history.HistorySnapshot(
+            None,
+            None,
+            None,
+            # A quarter of an hour down
+            [history.RollupRecord(hour, 60, 45, 4500.0, 100.0)],
+            [
+                history.RollupRecord(minute, 6, 6, 600.0, 100.0),
+                history.RollupRecord(minute + 60, 6, 0, 0.0, 0.0),
+                history.RollupRecord(minute + 120, 6, 3, 300.0, 100.0),
+                history.RollupRecord(minute + 180, 6, 6, 600.0, 100.0),
+            ],
+            [history.RawRecord(minute + 240, 100.0, 200, history.FLAG_UP)],
+        )
+
+        tracker.replay(snapshot)
+
+        incidents = list(tracker.incidents.incidents)
+        assert [(incident.start, incident.end) for incident in incidents] == [
+            (hour, hour + 900),
+            (minute + 60, minute + 150),
+        ]
+        stats = tracker.incidents.stats("7d", now)
+        assert stats["outages"] == 2
+        assert stats["mttr"] == 495
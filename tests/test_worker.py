@@ -0,0 +1,79 @@
+"""Tests for the probe worker processes."""
+import asyncio
+from datetime import datetime, timezone
+import json
+
+import pytest
+
+
+class TestWireFormat:
+    """Test the result records exchanged with the workers."""
+
+    def test_round_trip(self, engine):
+        """Test a result survives encoding, JSON lines and decoding."""
+        worker = engine("worker")
+        result = {
+            "status_code": 200,
+            "response_time": 12.5,
+            "is_up": True,
+            "ssl_expires": datetime(2030, 1, 1, tzinfo=timezone.utc),
+            "connect_time": 1.25,
+            "connection_reused": False,
+            "url": "https://example.com",
+            "last_success": datetime.now(timezone.utc),
+        }
+
+        line = json.dumps(worker.encode_result(7, result)) + "\n"
+        request_id, kind, values = json.loads(line)
+        decoded = worker.decode_result(values, {"url": "https://example.com"})
+
+        assert (request_id, kind) == (7, worker.RECORD_RESULT)
+        assert len(values) == len(worker.RESULT_FIELDS)
+        assert decoded == {
+            key: value for key, value in result.items() if key != "last_success"
+        }
+
+    def test_missing_values(self, engine):
+        """Test fields a probe did not report are left out of the result."""
+        worker = engine("worker")
+
+        _, _, values = worker.encode_result(1, {"is_up": False})
+        decoded = worker.decode_result(values, {"url": "tcp://db.local:5432"})
+
+        assert decoded == {"is_up": False, "url": "tcp://db.local:5432"}
+
+
+class TestWorkerPool:
+    """Test WorkerPool."""
+
+    def test_probe(self, engine):
+        """Test probes run in a worker process and failures are reported."""
+        pool = engine("worker").WorkerPool(1)
+
+        async def _run():
+            server = await asyncio.start_server(
+                lambda reader, writer: writer.close(), "127.0.0.1", 0
+            )
+            port = server.sockets[0].getsockname()[1]
+            config = {
+                "url": f"tcp://127.0.0.1:{port}",
+                "probe_type": "tcp",
+                "timeout": 5,
+                "verify_ssl": False,
+            }
+            try:
+                async with server:
+                    results = await asyncio.gather(
+                        *(pool.async_probe(config) for _ in range(20))
+                    )
+                with pytest.raises(engine("worker").WorkerProbeError):
+                    await pool.async_probe(config)
+                return results, pool.stats
+            finally:
+                await pool.async_stop()
+
+        results, stats = asyncio.run(_run())
+
+        assert all(result["is_up"] for result in results)
+        assert stats["sent"] == stats["received"] == 21
+        assert stats["pending"] == 0